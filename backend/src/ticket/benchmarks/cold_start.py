@@ -0,0 +1,110 @@
+"""
+Measures Lambda cold starts: module import time and the first (cold) and
+second (warm) invocation of every handler, each run in a fresh interpreter.
+
+    python benchmarks/cold_start.py --import-only     # no credentials needed
+    python benchmarks/cold_start.py list find_similar --repeat 5
+
+Invocations hit the services configured in .env, so the write handlers
+(create, update) are only run when named explicitly.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+TICKET_ROOT = Path(__file__).resolve().parent.parent
+
+SAMPLE_TICKET = {
+    "title": "Fix Password Reset Email",
+    "description": "Debug and fix issue with password reset emails not being delivered",
+    "status": "open",
+    "priority": "high",
+    "type": "bug",
+    "labels": ["auth", "email"],
+}
+
+SAMPLE_EVENTS = {
+    "list": {"queryStringParameters": {"limit": "100"}},
+    "sync": {"queryStringParameters": {"since": "0"}},
+    "find_similar": {"body": json.dumps({"data": SAMPLE_TICKET})},
+    "search": {"body": json.dumps({"user_ticket_text": SAMPLE_TICKET["title"]})},
+    "gen": {
+        "body": json.dumps({"data": {"ticket_description": SAMPLE_TICKET["description"]}})
+    },
+    "create": {"body": json.dumps({"data": SAMPLE_TICKET})},
+    "update": {"body": json.dumps({"data": {"id": "", "status": "open"}})},
+}
+READ_HANDLERS = ["list", "sync", "find_similar", "search", "gen"]
+
+RUNNER = """
+import json, sys, time
+handler_dir, root, event, import_only = sys.argv[1:5]
+sys.path[:0] = [handler_dir, root]
+start = time.perf_counter()
+import lambda_function
+timings = {"import_ms": (time.perf_counter() - start) * 1000}
+if import_only != "1":
+    event = json.loads(event)
+    for run in ("cold_ms", "warm_ms"):
+        start = time.perf_counter()
+        lambda_function.lambda_handler(event, None)
+        timings[run] = (time.perf_counter() - start) * 1000
+print(json.dumps(timings))
+"""
+
+
+def measure(handler: str, import_only: bool) -> dict:
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            RUNNER,
+            str(TICKET_ROOT / handler),
+            str(TICKET_ROOT),
+            json.dumps(SAMPLE_EVENTS[handler]),
+            "1" if import_only else "0",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("handlers", nargs="*", help=", ".join(SAMPLE_EVENTS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--import-only", action="store_true")
+    parser.add_argument("--output", help="write the medians as JSON to this file")
+    args = parser.parse_args()
+    unknown = set(args.handlers) - set(SAMPLE_EVENTS)
+    if unknown:
+        parser.error(f"unknown handlers: {', '.join(sorted(unknown))}")
+
+    handlers = args.handlers or (
+        list(SAMPLE_EVENTS) if args.import_only else READ_HANDLERS
+    )
+
+    report = {}
+    for handler in handlers:
+        runs = [measure(handler, args.import_only) for _ in range(args.repeat)]
+        report[handler] = {
+            metric: round(statistics.median(run[metric] for run in runs), 1)
+            for metric in runs[0]
+        }
+        print(
+            f"{handler:<14}"
+            + "  ".join(f"{m}={v:>8.1f}" for m, v in report[handler].items())
+        )
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
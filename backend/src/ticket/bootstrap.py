@@ -0,0 +1,60 @@
+"""
+Creates or migrates the tickets collection.
+
+    python bootstrap.py                      # uses QDRANT_* from .env
+    python bootstrap.py --memory             # dry run against the in-memory client
+    python bootstrap.py --on-disk --quantize # large collections
+"""
+
+import argparse
+import os
+
+from dotenv import load_dotenv
+from qdrant_client import QdrantClient
+
+from common.collection import ensure_tickets_collection
+
+
+def main():
+    load_dotenv()
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--url", default=os.environ.get("QDRANT_URL"))
+    parser.add_argument("--api-key", default=os.environ.get("QDRANT_API_KEY"))
+    parser.add_argument(
+        "--collection", default=os.environ.get("QDRANT_COLLECTION_NAME", "tickets")
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="use the in-memory client"
+    )
+    parser.add_argument("--hnsw-m", type=int, default=16)
+    parser.add_argument("--hnsw-ef-construct", type=int, default=100)
+    parser.add_argument(
+        "--on-disk", action="store_true", help="keep original vectors on disk"
+    )
+    parser.add_argument(
+        "--quantize", action="store_true", help="enable int8 scalar quantization"
+    )
+    args = parser.parse_args()
+
+    if args.memory:
+        client = QdrantClient(":memory:")
+    elif args.url:
+        client = QdrantClient(url=args.url, api_key=args.api_key)
+    else:
+        parser.error("--url or QDRANT_URL is required unless --memory is used")
+
+    actions = ensure_tickets_collection(
+        client,
+        args.collection,
+        hnsw_m=args.hnsw_m,
+        hnsw_ef_construct=args.hnsw_ef_construct,
+        on_disk=args.on_disk,
+        scalar_quantization=args.quantize,
+    )
+    for name, action in actions.items():
+        print(f"{name}: {action}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+from .clients import get_openai_client, get_qdrant_client
+from .config import (
+    collection_name,
+    embedding_batch_size,
+    env,
+    env_flag,
+    upsert_batch_size,
+)
+from .embedding import EMBEDDING_MODEL, default_cache, embed_text, embed_texts, stringify_ticket
+from .embedding_cache import (
+    EmbeddingCache,
+    EmbeddingStore,
+    QdrantEmbeddingStore,
+    SQLiteEmbeddingStore,
+    cache_key,
+)
+from .vectors import (
+    VECTOR_ENCODINGS,
+    VECTOR_PAYLOAD_FIELDS,
+    decode_vector,
+    encode_vector,
+    strip_vectors,
+)
+
+__all__ = [
+    "get_openai_client",
+    "get_qdrant_client",
+    "collection_name",
+    "embedding_batch_size",
+    "env",
+    "env_flag",
+    "upsert_batch_size",
+    "EMBEDDING_MODEL",
+    "default_cache",
+    "embed_text",
+    "embed_texts",
+    "stringify_ticket",
+    "EmbeddingCache",
+    "EmbeddingStore",
+    "QdrantEmbeddingStore",
+    "SQLiteEmbeddingStore",
+    "cache_key",
+    "VECTOR_ENCODINGS",
+    "VECTOR_PAYLOAD_FIELDS",
+    "decode_vector",
+    "encode_vector",
+    "strip_vectors",
+]
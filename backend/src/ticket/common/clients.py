@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING, Optional
+
+from .config import env, env_flag
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+    from qdrant_client import QdrantClient
+
+# created on first use and kept for the lifetime of the Lambda container, so
+# warm invocations reuse the pooled TCP/TLS connections
+_openai_client: Optional["OpenAI"] = None
+_qdrant_client: Optional["QdrantClient"] = None
+
+
+def get_openai_client() -> "OpenAI":
+    global _openai_client
+    if _openai_client is None:
+        import httpx
+        from openai import DefaultHttpxClient, OpenAI
+
+        _openai_client = OpenAI(
+            api_key=env("OPENAI_API_KEY"),
+            timeout=float(env("OPENAI_TIMEOUT", "60")),
+            max_retries=int(env("OPENAI_MAX_RETRIES", "2")),
+            http_client=DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                    # Lambda containers idle for minutes between bursts
+                    keepalive_expiry=300,
+                ),
+            ),
+        )
+    return _openai_client
+
+
+def get_qdrant_client() -> "QdrantClient":
+    """
+    Set QDRANT_PREFER_GRPC=1 to talk gRPC (port 6334), which keeps one
+    multiplexed HTTP/2 connection open instead of a REST connection pool.
+    """
+    global _qdrant_client
+    if _qdrant_client is None:
+        from qdrant_client import QdrantClient
+
+        _qdrant_client = QdrantClient(
+            url=env("QDRANT_URL"),
+            api_key=env("QDRANT_API_KEY", None),
+            prefer_grpc=env_flag("QDRANT_PREFER_GRPC"),
+            timeout=int(env("QDRANT_TIMEOUT", "10")),
+        )
+    return _qdrant_client
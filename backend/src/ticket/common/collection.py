@@ -0,0 +1,80 @@
+from typing import Dict, Optional
+
+from qdrant_client import QdrantClient, models
+
+EMBEDDING_SIZE = 1536
+
+# payload fields used by the list/search filters and the delta sync
+TICKET_PAYLOAD_INDEXES: Dict[str, models.PayloadSchemaType] = {
+    "status": models.PayloadSchemaType.KEYWORD,
+    "priority": models.PayloadSchemaType.KEYWORD,
+    "type": models.PayloadSchemaType.KEYWORD,
+    "assignee_id": models.PayloadSchemaType.KEYWORD,
+    "labels": models.PayloadSchemaType.KEYWORD,
+    "parent_ticket_id": models.PayloadSchemaType.KEYWORD,
+    # timestamps are stored as float seconds, see `prepare_ticket` in create/
+    "updated_at": models.PayloadSchemaType.FLOAT,
+}
+
+
+def ensure_tickets_collection(
+    client: QdrantClient,
+    collection_name: str,
+    hnsw_m: int = 16,
+    hnsw_ef_construct: int = 100,
+    on_disk: bool = False,
+    scalar_quantization: bool = False,
+) -> Dict[str, str]:
+    """
+    Creates the tickets collection and its payload indexes if they are missing.
+    Safe to run repeatedly: an existing collection gets its HNSW and
+    quantization settings updated and only missing indexes are created.
+
+    Returns what was done per collection/index, for logging.
+    """
+    hnsw_config = models.HnswConfigDiff(m=hnsw_m, ef_construct=hnsw_ef_construct)
+    quantization_config: Optional[models.ScalarQuantization] = None
+    if scalar_quantization:
+        quantization_config = models.ScalarQuantization(
+            scalar=models.ScalarQuantizationConfig(
+                type=models.ScalarType.INT8, quantile=0.99, always_ram=True
+            )
+        )
+
+    actions = {}
+    if not client.collection_exists(collection_name):
+        client.create_collection(
+            collection_name=collection_name,
+            vectors_config=models.VectorParams(
+                size=EMBEDDING_SIZE,
+                distance=models.Distance.COSINE,
+                on_disk=on_disk,
+            ),
+            hnsw_config=hnsw_config,
+            quantization_config=quantization_config,
+        )
+        actions[collection_name] = "created"
+    else:
+        client.update_collection(
+            collection_name=collection_name,
+            vectors_config={"": models.VectorParamsDiff(on_disk=on_disk)},
+            hnsw_config=hnsw_config,
+            quantization_config=quantization_config,
+        )
+        actions[collection_name] = "updated"
+
+    existing_indexes = client.get_collection(collection_name).payload_schema or {}
+    for field, schema in TICKET_PAYLOAD_INDEXES.items():
+        if field in existing_indexes:
+            actions[field] = "exists"
+            continue
+
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name=field,
+            field_schema=schema,
+            wait=True,
+        )
+        actions[field] = "created"
+
+    return actions
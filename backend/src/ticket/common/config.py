@@ -0,0 +1,50 @@
+import os
+from typing import Optional
+
+_REQUIRED = object()
+_dotenv_loaded = False
+
+
+def env(name: str, default=_REQUIRED) -> Optional[str]:
+    """
+    Reads a setting from the environment, loading `.env` once per process on
+    first use rather than at import time.
+    """
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _dotenv_loaded = True
+
+    if default is _REQUIRED:
+        return os.environ[name]
+    return os.environ.get(name, default)
+
+
+def env_flag(name: str) -> bool:
+    return (env(name, "") or "").lower() in ("1", "true", "yes")
+
+
+def collection_name() -> str:
+    """
+    The tickets collection, QDRANT_COLLECTION_NAME. Read when a handler runs
+    rather than when it is imported, so importing needs no settings.
+    """
+    return env("QDRANT_COLLECTION_NAME")
+
+
+def embedding_batch_size() -> int:
+    """
+    Texts per embedding request, EMBEDDING_BATCH_SIZE. OpenAI accepts up to
+    2048 inputs per request, this stays well below that.
+    """
+    return int(env("EMBEDDING_BATCH_SIZE", "100"))
+
+
+def upsert_batch_size() -> int:
+    """
+    Points per Qdrant write, UPSERT_BATCH_SIZE. Qdrant is happiest with writes
+    of a few hundred points.
+    """
+    return int(env("UPSERT_BATCH_SIZE", "100"))
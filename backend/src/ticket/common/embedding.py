@@ -0,0 +1,96 @@
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from .clients import get_openai_client, get_qdrant_client
+from .config import env
+from .embedding_cache import (
+    EmbeddingCache,
+    EmbeddingStore,
+    QdrantEmbeddingStore,
+    SQLiteEmbeddingStore,
+    cache_key,
+)
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+_default_cache: Optional[EmbeddingCache] = None
+
+
+def stringify_ticket(ticket: Dict) -> str:
+    """Text that is embedded for a ticket, shared by every handler so cache keys match."""
+    return f"ticket title: {ticket.get('title')}, ticket description: {ticket.get('description')}, ticket type: {ticket.get('type')}"
+
+
+def default_cache() -> EmbeddingCache:
+    """
+    Cache shared by the handlers of this process. The persistent tier is picked
+    from the environment:
+
+    - EMBEDDING_CACHE_COLLECTION: Qdrant collection shared by all Lambdas
+    - EMBEDDING_CACHE_PATH: local SQLite file, e.g. /tmp/embeddings.sqlite3
+    """
+    global _default_cache
+    if _default_cache is not None:
+        return _default_cache
+
+    store: Optional[EmbeddingStore] = None
+    if env("EMBEDDING_CACHE_COLLECTION", None):
+        store = QdrantEmbeddingStore(
+            get_qdrant_client(), env("EMBEDDING_CACHE_COLLECTION")
+        )
+    elif env("EMBEDDING_CACHE_PATH", None):
+        store = SQLiteEmbeddingStore(env("EMBEDDING_CACHE_PATH"))
+
+    _default_cache = EmbeddingCache(
+        max_entries=int(env("EMBEDDING_CACHE_SIZE", "1024")), store=store
+    )
+    return _default_cache
+
+
+def embed_texts(
+    texts: List[str],
+    model: str = EMBEDDING_MODEL,
+    cache: Optional[EmbeddingCache] = None,
+    openai_client: Optional["OpenAI"] = None,
+) -> List[List[float]]:
+    """
+    Embeds `texts` in a single request, skipping the ones already cached.
+    Duplicate texts within the same call are only sent once, and the OpenAI
+    client is not even created when everything is cached.
+    """
+    cache = cache or default_cache()
+    keys = [cache_key(text, model) for text in texts]
+    vectors = cache.get_many(keys)
+
+    missing: Dict[str, str] = {}
+    for key, text in zip(keys, texts):
+        if key not in vectors and key not in missing:
+            missing[key] = text
+
+    if missing:
+        openai_client = openai_client or get_openai_client()
+        embeddings = openai_client.embeddings.create(
+            model=model, input=list(missing.values()), encoding_format="float"
+        )
+        # the API does not guarantee ordering, so align by the returned index
+        fresh = {
+            key: e.embedding
+            for key, e in zip(
+                missing, sorted(embeddings.data, key=lambda e: e.index)
+            )
+        }
+        cache.put_many(fresh)
+        vectors.update(fresh)
+
+    return [vectors[key] for key in keys]
+
+
+def embed_text(
+    text: str,
+    model: str = EMBEDDING_MODEL,
+    cache: Optional[EmbeddingCache] = None,
+    openai_client: Optional["OpenAI"] = None,
+) -> List[float]:
+    return embed_texts([text], model=model, cache=cache, openai_client=openai_client)[0]
@@ -0,0 +1,193 @@
+import hashlib
+import sqlite3
+import threading
+import uuid
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Protocol
+
+if TYPE_CHECKING:
+    from qdrant_client import QdrantClient
+
+
+def normalize_text(text: str) -> str:
+    return " ".join(text.split())
+
+
+def cache_key(text: str, model: str) -> str:
+    """Content hash of the normalized text, scoped to the embedding model."""
+    content = f"{model}\0{normalize_text(text)}".encode("utf-8")
+    return hashlib.sha256(content).hexdigest()
+
+
+class EmbeddingStore(Protocol):
+    """Persistent tier behind the in-process LRU."""
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]: ...
+
+    def put_many(self, vectors: Dict[str, List[float]]) -> None: ...
+
+
+class SQLiteEmbeddingStore:
+    """
+    Stores vectors as float32 blobs in a local SQLite file. Useful for local
+    development and tests, and as a per-container tier in /tmp on Lambda.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+
+        placeholders = ",".join("?" for _ in keys)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                keys,
+            ).fetchall()
+
+        found = {}
+        for key, blob in rows:
+            vector = array("f")
+            vector.frombytes(blob)
+            found[key] = vector.tolist()
+        return found
+
+    def put_many(self, vectors: Dict[str, List[float]]) -> None:
+        if not vectors:
+            return
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                [(key, array("f", vector).tobytes()) for key, vector in vectors.items()],
+            )
+            self._conn.commit()
+
+
+class QdrantEmbeddingStore:
+    """
+    Stores vectors in a dedicated Qdrant collection so every Lambda shares the
+    same cache, e.g. find_similar followed by create on the same ticket.
+    """
+
+    def __init__(self, client: "QdrantClient", collection_name: str, size: int = 1536):
+        self.client = client
+        self.collection_name = collection_name
+        self.size = size
+        self._ready = False
+
+    @staticmethod
+    def _point_id(key: str) -> str:
+        return str(uuid.UUID(key[:32]))
+
+    def _ensure_collection(self):
+        if self._ready:
+            return
+
+        from qdrant_client import models
+
+        if not self.client.collection_exists(self.collection_name):
+            self.client.create_collection(
+                collection_name=self.collection_name,
+                vectors_config=models.VectorParams(
+                    size=self.size, distance=models.Distance.COSINE
+                ),
+            )
+        self._ready = True
+
+    def get_many(self, keys: List[str]) -> Dict[str, List[float]]:
+        if not keys:
+            return {}
+
+        self._ensure_collection()
+        ids = {self._point_id(key): key for key in keys}
+        records = self.client.retrieve(
+            collection_name=self.collection_name,
+            ids=list(ids),
+            with_payload=False,
+            with_vectors=True,
+        )
+        return {ids[str(record.id)]: record.vector for record in records}
+
+    def put_many(self, vectors: Dict[str, List[float]]) -> None:
+        if not vectors:
+            return
+
+        from qdrant_client import models
+
+        self._ensure_collection()
+        self.client.upsert(
+            collection_name=self.collection_name,
+            points=[
+                models.PointStruct(id=self._point_id(key), vector=vector, payload={})
+                for key, vector in vectors.items()
+            ],
+        )
+
+
+class EmbeddingCache:
+    """
+    Two tier cache of embedding vectors: an in-process LRU that survives warm
+    invocations, backed by an optional persistent `EmbeddingStore`.
+    """
+
+    def __init__(self, max_entries: int = 1024, store: Optional[EmbeddingStore] = None):
+        self.max_entries = max_entries
+        self.store = store
+        self._lru: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _remember(self, key: str, vector: List[float]):
+        self._lru[key] = vector
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_entries:
+            self._lru.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, List[float]]:
+        found = {}
+        missing = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    found[key] = self._lru[key]
+                else:
+                    missing.append(key)
+
+        if missing and self.store is not None:
+            try:
+                stored = self.store.get_many(missing)
+            except Exception as e:
+                print("Embedding cache store lookup failed: ", e)
+                stored = {}
+
+            with self._lock:
+                for key, vector in stored.items():
+                    self._remember(key, vector)
+            found.update(stored)
+
+        return found
+
+    def put_many(self, vectors: Dict[str, List[float]]) -> None:
+        with self._lock:
+            for key, vector in vectors.items():
+                self._remember(key, vector)
+
+        if self.store is not None:
+            try:
+                self.store.put_many(vectors)
+            except Exception as e:
+                print("Embedding cache store write failed: ", e)
+
+    def clear(self):
+        with self._lock:
+            self._lru.clear()
@@ -0,0 +1,28 @@
+import base64
+import struct
+from typing import Dict, List
+
+# payload keys that hold vectors, vectors live in the Qdrant point instead
+VECTOR_PAYLOAD_FIELDS = ("embedding",)
+
+# struct format codes, little-endian
+VECTOR_ENCODINGS = {"float32": "f", "float16": "e"}
+
+
+def strip_vectors(payload: Dict) -> Dict:
+    """Returns the payload without vector fields so they are never persisted or returned."""
+    return {k: v for k, v in payload.items() if k not in VECTOR_PAYLOAD_FIELDS}
+
+
+def encode_vector(vector: List[float], encoding: str = "float32") -> str:
+    """Packs a vector as base64 little-endian float32/float16, ~4-8x smaller than JSON floats."""
+    code = VECTOR_ENCODINGS[encoding]
+    return base64.b64encode(struct.pack(f"<{len(vector)}{code}", *vector)).decode(
+        "ascii"
+    )
+
+
+def decode_vector(data: str, encoding: str = "float32") -> List[float]:
+    code = VECTOR_ENCODINGS[encoding]
+    raw = base64.b64decode(data)
+    return list(struct.unpack(f"<{len(raw) // struct.calcsize(code)}{code}", raw))
@@ -0,0 +1,120 @@
+"""
+Fixtures for the handler tests in tests/: each handler is loaded from its
+directory against an in-memory Qdrant collection and a fake embedder, so
+the tests need neither credentials nor network access.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from qdrant_client import QdrantClient
+
+from common.collection import EMBEDDING_SIZE, ensure_tickets_collection
+
+TICKET_ROOT = Path(__file__).resolve().parent
+TEST_COLLECTION_NAME = "tickets-test"
+
+os.environ["QDRANT_COLLECTION_NAME"] = TEST_COLLECTION_NAME
+
+
+def fake_embedding(text: str) -> List[float]:
+    """A deterministic unit-ish vector per text."""
+    digest = hashlib.sha256(text.encode()).digest()
+    values = [byte / 255 + 0.01 for byte in digest]
+    return (values * (EMBEDDING_SIZE // len(values) + 1))[:EMBEDDING_SIZE]
+
+
+class FakeEmbedder:
+    """Stands in for `embed_text`/`embed_texts`, recording every request."""
+
+    def __init__(self):
+        self.requests: List[List[str]] = []
+        self.fail = False
+
+    def embed_texts(self, texts: List[str], *args, **kwargs) -> List[List[float]]:
+        if self.fail:
+            raise RuntimeError("embedding service unavailable")
+        self.requests.append(list(texts))
+        return [fake_embedding(text) for text in texts]
+
+    def embed_text(self, text: str, *args, **kwargs) -> List[float]:
+        return self.embed_texts([text])[0]
+
+
+@pytest.fixture
+def qdrant() -> QdrantClient:
+    client = QdrantClient(":memory:")
+    with warnings.catch_warnings():
+        # the local client ignores payload indexes and warns about each one
+        warnings.simplefilter("ignore", UserWarning)
+        ensure_tickets_collection(client, TEST_COLLECTION_NAME)
+    return client
+
+
+@pytest.fixture
+def embedder() -> FakeEmbedder:
+    return FakeEmbedder()
+
+
+@pytest.fixture
+def load_handler(qdrant, embedder, monkeypatch):
+    """Imports `<name>/lambda_function.py` wired to the fixtures."""
+
+    def load(name: str):
+        path = TICKET_ROOT / name / "lambda_function.py"
+        spec = importlib.util.spec_from_file_location(f"{name}_lambda_function", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        monkeypatch.setattr(module, "get_qdrant_client", lambda: qdrant)
+        for helper in ("embed_text", "embed_texts"):
+            if hasattr(module, helper):
+                monkeypatch.setattr(module, helper, getattr(embedder, helper))
+        return module
+
+    return load
+
+
+def _invoke(handler, body: Dict = None, query: Dict = None) -> tuple:
+    event = {}
+    if body is not None:
+        event["body"] = json.dumps(body)
+    if query is not None:
+        event["queryStringParameters"] = {
+            key: str(value) for key, value in query.items()
+        }
+    response = handler.lambda_handler(event, None)
+    return response["statusCode"], json.loads(response["body"])
+
+
+def sync_all(sync, since: float = 0.0, limit: int = None) -> tuple:
+    """
+    Polls the sync handler like the frontend does until `has_more` is false,
+    returns (every ticket received, final watermark).
+    """
+    tickets = []
+    cursor = {"since": since}
+    for _ in range(1000):
+        query = dict(cursor, limit=limit) if limit else dict(cursor)
+        status, body = _invoke(sync, query=query)
+        assert status == 200
+        data = body["data"]
+        tickets.extend(data["tickets"])
+        cursor = {"since": data["watermark"]}
+        if data["after_id"] is not None:
+            cursor["after_id"] = data["after_id"]
+        if not data["has_more"]:
+            return tickets, data["watermark"]
+    pytest.fail("sync did not finish")
+
+
+@pytest.fixture
+def invoke():
+    """Calls a handler like API Gateway does, returns (status, parsed body)."""
+    return _invoke
@@ -1,27 +1,20 @@
-import datetime
 import json
-from typing import Dict, List
-from openai import OpenAI
-import os
+from typing import Dict, Iterator, List, Tuple
 from datetime import datetime
-from dotenv import load_dotenv
 import uuid
-from qdrant_client import QdrantClient, models
-
-load_dotenv()
+from qdrant_client import models
+
+from common import (
+    collection_name,
+    embed_texts,
+    embedding_batch_size,
+    get_qdrant_client,
+    stringify_ticket,
+    strip_vectors,
+    upsert_batch_size,
+)
 
 SYSTEM = ""
-OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
-
-QDRANT_URL = os.environ["QDRANT_URL"]
-QDRANT_API_KEY = os.environ["QDRANT_API_KEY"]
-QDRANT_COLLECTION_NAME = os.environ["QDRANT_COLLECTION_NAME"]
-
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
-qdrant_client = QdrantClient(
-    url=QDRANT_URL,
-    api_key=QDRANT_API_KEY,
-)
 
 
 def lambda_handler(event, context):
@@ -45,50 +38,115 @@ def lambda_handler(event, context):
             "body": json.dumps({"base": {"message": "invalid ticket payload"}}),
         }
 
-    results = []
-    for ticket in tickets_to_insert:
-        ticket_str = stringify_ticket(ticket)
-        ticket_embedding = text_to_embedding(ticket_str)
-        inserted_ticket = insert_ticket(ticket, ticket_embedding)
-        results.append(inserted_ticket)
+    inserted, errors = insert_tickets(tickets_to_insert)
+    if not inserted:
+        # nothing valid to insert is the client's error, a failed write ours
+        invalid = all(error["status"] == 400 for error in errors)
+        return {
+            "statusCode": 400 if invalid else 500,
+            "body": json.dumps(
+                {
+                    "base": {
+                        "message": (
+                            "invalid ticket payload"
+                            if invalid
+                            else "ticket creation failed"
+                        )
+                    },
+                    "errors": errors,
+                }
+            ),
+        }
 
     return {
         "statusCode": 200,
         "body": json.dumps(
             {
                 "base": {"code": 0, "message": "success"},
-                "data": results[0] if len(results) == 1 else results,
+                "data": inserted[0] if isinstance(tickets, dict) else inserted,
+                "errors": errors,
             }
         ),
     }
 
 
-def stringify_ticket(ticket: Dict):
-    return f"ticket title: {ticket.get("title")}, ticket description: {ticket.get('description')}, ticket type: {ticket.get('type')}"
+def texts_to_embeddings(texts: List[str]) -> List[List[float]]:
+    return embed_texts(texts)
 
 
-def text_to_embedding(text):
-    embeddings = openai_client.embeddings.create(
-        model="text-embedding-3-small", input=text, encoding_format="float"
-    )
-    return embeddings.data[0].embedding
+def chunked(items: List, size: int) -> Iterator[Tuple[int, List]]:
+    for start in range(0, len(items), size):
+        yield start, items[start : start + size]
 
 
-def insert_ticket(ticket: Dict, embedding: List[float]):
-    ticket_id = str(uuid.uuid4())
-    ticket["id"] = ticket_id
-    ticket["created_at"] = datetime.now().timestamp()
-    ticket["updated_at"] = datetime.now().timestamp()
+def prepare_ticket(ticket: Dict) -> Dict:
+    now = datetime.now().timestamp()
+    ticket["id"] = str(uuid.uuid4())
+    ticket["created_at"] = now
+    ticket["updated_at"] = now
+    return ticket
+
 
-    qdrant_client.upsert(
-        collection_name=QDRANT_COLLECTION_NAME,
-        points=[
+def insert_tickets(tickets: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Embeds and stores tickets in chunks, one embedding request and one upsert
+    per chunk instead of per ticket.
+
+    Returns the inserted tickets in input order and a list of
+    `{"index", "status", "message"}` errors for the tickets that could not be
+    inserted, status 400 for invalid tickets and 500 for failed writes.
+    """
+    errors = []
+    valid = []
+    for index, ticket in enumerate(tickets):
+        if isinstance(ticket, dict):
+            # the vector is stored on the point, never in the payload
+            valid.append((index, strip_vectors(ticket)))
+        else:
+            errors.append(
+                {"index": index, "status": 400, "message": "invalid ticket payload"}
+            )
+
+    embedded = []
+    for _, batch in chunked(valid, embedding_batch_size()):
+        try:
+            embeddings = texts_to_embeddings(
+                [stringify_ticket(ticket) for _, ticket in batch]
+            )
+        except Exception as e:
+            errors.extend(
+                {"index": index, "status": 500, "message": f"embedding failed: {e}"}
+                for index, _ in batch
+            )
+            continue
+        embedded.extend(
+            (index, ticket, embedding)
+            for (index, ticket), embedding in zip(batch, embeddings)
+        )
+
+    inserted = []
+    for _, batch in chunked(embedded, upsert_batch_size()):
+        points = [
             models.PointStruct(
-                id=ticket_id,
+                id=prepare_ticket(ticket)["id"],
                 payload=ticket,
                 vector=embedding,
             )
-        ],
-    )
+            for _, ticket, embedding in batch
+        ]
+        try:
+            get_qdrant_client().upsert(
+                collection_name=collection_name(), points=points
+            )
+        except Exception as e:
+            errors.extend(
+                {"index": index, "status": 500, "message": f"insert failed: {e}"}
+                for index, _, _ in batch
+            )
+            continue
+        inserted.extend((index, ticket) for index, ticket, _ in batch)
+
+    inserted.sort(key=lambda item: item[0])
+    errors.sort(key=lambda error: error["index"])
+    return [ticket for _, ticket in inserted], errors
 
-    return ticket
@@ -1,27 +1,13 @@
 import json
 from typing import Dict, List
-from openai import OpenAI
-import os
 from pydantic import BaseModel, ValidationError
 from enum import StrEnum
-from dotenv import load_dotenv
-from openai.types.create_embedding_response import CreateEmbeddingResponse
-from qdrant_client import QdrantClient
+from qdrant_client import models
 
-load_dotenv()
+import common
+from common import collection_name, get_qdrant_client
 
 SYSTEM = ""
-OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
-
-QDRANT_URL = os.environ["QDRANT_URL"]
-QDRANT_API_KEY = os.environ["QDRANT_API_KEY"]
-QDRANT_COLLECTION_NAME = os.environ["QDRANT_COLLECTION_NAME"]
-
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
-qdrant_client = QdrantClient(
-    url=QDRANT_URL,
-    api_key=QDRANT_API_KEY,
-)
 
 
 class TicketStatus(StrEnum):
@@ -84,27 +70,25 @@ def lambda_handler(event, _context):
     }
 
 
-
 def stringify_ticket(ticket: Ticket):
-    return f"ticket title: {ticket.title}, ticket description: {ticket.description}, ticket type: {ticket.type}"
+    return common.stringify_ticket(ticket.model_dump())
 
 
 def text_to_embedding(ticket: Ticket):
-    ticket_string = stringify_ticket(ticket)
-    embeddings: CreateEmbeddingResponse = openai_client.embeddings.create(
-        model="text-embedding-3-small", input=ticket_string, encoding_format="float"
-    )
-    return embeddings.data[0].embedding
+    return common.embed_text(stringify_ticket(ticket))
 
 
 #! Arbitrary score_threshold used
 def find_similar_tickets(ticket: Ticket, score_threshold=0.75) -> List[Dict]:
     text_embedding = text_to_embedding(ticket)
-    similar_tickets = qdrant_client.search(
-        collection_name=QDRANT_COLLECTION_NAME,
+    similar_tickets = get_qdrant_client().search(
+        collection_name=collection_name(),
         query_vector=text_embedding,
         limit=5,
         score_threshold=score_threshold,
+        with_payload=models.PayloadSelectorExclude(
+            exclude=list(common.VECTOR_PAYLOAD_FIELDS)
+        ),
     )
 
     return [
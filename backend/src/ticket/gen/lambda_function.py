@@ -1,27 +1,13 @@
 import json
 from typing import Dict, List
-from openai import OpenAI
-import os
 from pydantic import BaseModel
 from enum import StrEnum
-from dotenv import load_dotenv
-from openai.types.create_embedding_response import CreateEmbeddingResponse
-from qdrant_client import QdrantClient
+from qdrant_client import models
 
-load_dotenv()
+import common
+from common import collection_name, get_openai_client, get_qdrant_client
 
 SYSTEM = ""
-OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
-
-QDRANT_URL = os.environ["QDRANT_URL"]
-QDRANT_API_KEY = os.environ["QDRANT_API_KEY"]
-QDRANT_COLLECTION_NAME = os.environ["QDRANT_COLLECTION_NAME"]
-
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
-qdrant_client = QdrantClient(
-    url=QDRANT_URL,
-    api_key=QDRANT_API_KEY,
-)
 
 
 class TicketStatus(StrEnum):
@@ -83,18 +69,18 @@ def lambda_handler(event, _context):
     }
 
     master_ticket = generated.master_ticket
-    similar_master_tickets = find_similar_tickets(master_ticket)
+    sub_tickets = generated.sub_tickets
+    similar_tickets = find_similar_tickets_batch([master_ticket, *sub_tickets])
+
     master_ticket_dict = master_ticket.model_dump()
     master_ticket_dict["reporter_id"] = reporter_id
     master_ticket_dict["assignee_id"] = assignee_id
     response["master_ticket"] = {
         "ticket": master_ticket_dict,
-        "similar_tickets": similar_master_tickets,
+        "similar_tickets": similar_tickets[0],
     }
 
-    sub_tickets = generated.sub_tickets
-    for sub_ticket in sub_tickets:
-        similar_sub_tickets = find_similar_tickets(sub_ticket)
+    for sub_ticket, similar_sub_tickets in zip(sub_tickets, similar_tickets[1:]):
         sub_ticket_dict = sub_ticket.model_dump()
         sub_ticket_dict["reporter_id"] = reporter_id
         sub_ticket_dict["assignee_id"] = assignee_id
@@ -151,7 +137,7 @@ def generate_tickets(ticket_desc: str):
 
     user_prompt = f"The following is the ticket description: {ticket_desc}. Please generate the specified tickets based on the description."
 
-    completion = openai_client.beta.chat.completions.parse(
+    completion = get_openai_client().beta.chat.completions.parse(
         model="gpt-4o",
         messages=[
             {"role": "system", "content": generate_ticket_prompt},
@@ -164,27 +150,41 @@ def generate_tickets(ticket_desc: str):
 
 
 def stringify_ticket(ticket: Ticket):
-    return f"ticket title: {ticket.title}, ticket description: {ticket.description}, ticket type: {ticket.type}"
+    return common.stringify_ticket(ticket.model_dump())
 
 
-def text_to_embedding(ticket: Ticket):
-    ticket_string = stringify_ticket(ticket)
-    embeddings: CreateEmbeddingResponse = openai_client.embeddings.create(
-        model="text-embedding-3-small", input=ticket_string, encoding_format="float"
-    )
-    return embeddings.data[0].embedding
+def tickets_to_embeddings(tickets: List[Ticket]) -> List[List[float]]:
+    return common.embed_texts([stringify_ticket(ticket) for ticket in tickets])
 
 
 #! Arbitrary score_threshold used
-def find_similar_tickets(ticket: Ticket, score_threshold=0.75) -> List[Dict]:
-    text_embedding = text_to_embedding(ticket)
-    similar_tickets = qdrant_client.search(
-        collection_name=QDRANT_COLLECTION_NAME,
-        query_vector=text_embedding,
-        limit=5,
-        score_threshold=score_threshold,
+def find_similar_tickets_batch(
+    tickets: List[Ticket], score_threshold=0.75
+) -> List[List[Dict]]:
+    """
+    The tickets most similar to each of `tickets`, with one embedding request
+    for all of them and one Qdrant batch search.
+    """
+    if not tickets:
+        return []
+
+    text_embeddings = tickets_to_embeddings(tickets)
+    batch_results = get_qdrant_client().search_batch(
+        collection_name=collection_name(),
+        requests=[
+            models.SearchRequest(
+                vector=text_embedding,
+                limit=5,
+                score_threshold=score_threshold,
+                with_payload=models.PayloadSelectorExclude(
+                    exclude=list(common.VECTOR_PAYLOAD_FIELDS)
+                ),
+            )
+            for text_embedding in text_embeddings
+        ],
     )
 
     return [
-        {"ticket": ticket.payload, "score": ticket.score} for ticket in similar_tickets
+        [{"ticket": ticket.payload, "score": ticket.score} for ticket in results]
+        for results in batch_results
     ]
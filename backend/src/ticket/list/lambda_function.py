@@ -1,47 +1,145 @@
 import json
-import os
-from dotenv import load_dotenv
-from qdrant_client import QdrantClient
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
-load_dotenv()
+from common import (
+    VECTOR_ENCODINGS,
+    VECTOR_PAYLOAD_FIELDS,
+    collection_name,
+    encode_vector,
+    get_qdrant_client,
+)
 
-QDRANT_URL = os.environ["QDRANT_URL"]
-QDRANT_API_KEY = os.environ["QDRANT_API_KEY"]
-QDRANT_COLLECTION_NAME = os.environ["QDRANT_COLLECTION_NAME"]
+if TYPE_CHECKING:
+    from qdrant_client import models
 
-qdrant_client = QdrantClient(
-    url=QDRANT_URL,
-    api_key=QDRANT_API_KEY,
-)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+# payload fields that can be filtered on, multiple values are comma-separated
+FILTER_FIELDS = ("status", "priority", "assignee_id", "labels", "type")
+
+
+def lambda_handler(event, _context):
+    """
+    GET /ticket/list
 
+    Query parameters (all optional):
+    - limit: page size, defaults to 100 and is capped at 1000
+    - offset: `next_page_offset` returned by the previous page
+    - status, priority, assignee_id, labels, type: comma-separated values,
+      tickets match if the field equals any of them
+    - fields / exclude_fields: comma-separated payload fields to return / omit
+    - with_vectors: "true" to add each ticket's vector as base64 under "vector"
+    - vector_encoding: "float32" (default) or "float16"
+    """
+    params = (event or {}).get("queryStringParameters") or {}
 
-def lambda_handler(_event, _context):
-    tickets = list_tickets()
+    try:
+        limit = parse_limit(params.get("limit"))
+    except ValueError:
+        return {
+            "statusCode": 400,
+            "body": json.dumps({"base": {"message": "invalid page size"}}),
+        }
+
+    with_vectors = params.get("with_vectors", "").lower() in ("1", "true")
+    vector_encoding = params.get("vector_encoding") or "float32"
+    if vector_encoding not in VECTOR_ENCODINGS:
+        return {
+            "statusCode": 400,
+            "body": json.dumps({"base": {"message": "invalid vector encoding"}}),
+        }
+
+    filters = {field: split_param(params.get(field)) for field in FILTER_FIELDS}
+    tickets, next_page_offset = list_tickets(
+        limit=limit,
+        offset=params.get("offset") or None,
+        filters={field: values for field, values in filters.items() if values},
+        fields=split_param(params.get("fields")),
+        exclude_fields=split_param(params.get("exclude_fields")),
+        with_vectors=with_vectors,
+        vector_encoding=vector_encoding,
+    )
     return {
         "statusCode": 200,
         "body": json.dumps(
-            {"base": {"code": 0, "message": "success"}, "data": tickets}
+            {
+                "base": {"code": 0, "message": "success"},
+                "data": tickets,
+                "next_page_offset": next_page_offset,
+                "vector_encoding": vector_encoding if with_vectors else None,
+            }
         ),
     }
 
 
-def list_tickets():
-    tickets = []
+def parse_limit(value: Optional[str]) -> int:
+    if value is None or value == "":
+        return DEFAULT_PAGE_SIZE
+
+    limit = int(value)
+    if limit <= 0:
+        raise ValueError("page size must be positive")
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def split_param(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def build_filter(filters: Dict[str, List[str]]) -> "models.Filter":
+    # imported on first use, the models are a large part of a cold start
+    from qdrant_client import models
+
+    return models.Filter(
+        must=[
+            models.FieldCondition(key=field, match=models.MatchAny(any=values))
+            for field, values in filters.items()
+        ]
+    )
+
+
+def build_payload_selector(
+    fields: List[str], exclude_fields: List[str]
+) -> "models.WithPayloadInterface":
+    from qdrant_client import models
+
+    if fields:
+        fields = [field for field in fields if field not in VECTOR_PAYLOAD_FIELDS]
+        return models.PayloadSelectorInclude(include=fields)
+    # older tickets may still carry their vector in the payload
+    return models.PayloadSelectorExclude(
+        exclude=[*exclude_fields, *VECTOR_PAYLOAD_FIELDS]
+    )
 
-    offset = 0
-    while True:
-        scroll_result = qdrant_client.scroll(
-            collection_name=QDRANT_COLLECTION_NAME,
-            limit=100,
-            offset=offset,
-            with_payload=True,
-        )
 
-        points = scroll_result[0]
-        tickets.extend(points)
+def list_tickets(
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: Optional[str] = None,
+    filters: Optional[Dict[str, List[str]]] = None,
+    fields: Optional[List[str]] = None,
+    exclude_fields: Optional[List[str]] = None,
+    with_vectors: bool = False,
+    vector_encoding: str = "float32",
+) -> Tuple[List[Dict], Optional["models.ExtendedPointId"]]:
+    """
+    Returns one page of ticket payloads and the offset of the next page, which
+    is None once the last page has been reached.
+    """
+    points, next_page_offset = get_qdrant_client().scroll(
+        collection_name=collection_name(),
+        scroll_filter=build_filter(filters or {}),
+        limit=limit,
+        offset=offset,
+        with_payload=build_payload_selector(fields or [], exclude_fields or []),
+        with_vectors=with_vectors,
+    )
 
-        offset = scroll_result[1]
-        if offset == None:
-            break
+    if not with_vectors:
+        return [point.payload for point in points], next_page_offset
 
-    return [ticket.payload for ticket in tickets]
+    return [
+        {**point.payload, "vector": encode_vector(point.vector, vector_encoding)}
+        for point in points
+    ], next_page_offset
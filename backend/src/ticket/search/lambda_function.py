@@ -1,29 +1,25 @@
 import json
-from openai import OpenAI
-import os
-from datetime import datetime
-from dotenv import load_dotenv
-from qdrant_client import QdrantClient, models
-load_dotenv()
-SYSTEM = ""
-OPENAI_API_KEY = os.environ['OPENAI_API_KEY']
-
-QDRANT_URL = os.environ['QDRANT_URL']
-QDRANT_API_KEY = os.environ['QDRANT_API_KEY']
-QDRANT_COLLECTION_NAME = os.environ['QDRANT_COLLECTION_NAME']
-
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
-qdrant_client = QdrantClient(
-    url=QDRANT_URL,
-    api_key=QDRANT_API_KEY,
+from qdrant_client import models
+
+from common import (
+    VECTOR_PAYLOAD_FIELDS,
+    collection_name,
+    embed_text,
+    encode_vector,
+    get_openai_client,
+    get_qdrant_client,
 )
 
+SYSTEM = ""
 
 def lambda_handler(event, context):
     body = json.loads(event['body'])
     response = user_to_vectordb_prompt(body['user_ticket_text'])
 
-    results = fetch_similar_tickets(response, QDRANT_COLLECTION_NAME, qdrant_client, 5)
+    # vectors are only returned on request, as base64 float32; parsed like
+    # list/'s query parameter, so "false" means false
+    with_vectors = str(body.get('with_vectors') or '').lower() in ('1', 'true')
+    results = fetch_similar_tickets(response, collection_name(), get_qdrant_client(), 5, with_vectors)
     print(results)
     return {
         'statusCode': 200,
@@ -31,7 +27,7 @@ def lambda_handler(event, context):
     }
 
 def user_to_vectordb_prompt(user_prompt) -> str:
-    completion = openai_client.chat.completions.create(
+    completion = get_openai_client().chat.completions.create(
         model="gpt-4o",
         messages=[
             {"role": "system", "content": SYSTEM},
@@ -42,21 +38,25 @@ def user_to_vectordb_prompt(user_prompt) -> str:
 
 
 def text_to_embedding(text):
-    embeddings = openai_client.embeddings.create(
-        model="text-embedding-3-small", input=text, encoding_format="float"
-    )
-    return embeddings.data[0].embedding
+    return embed_text(text)
 
 def fetch_similar_tickets(
-    text, collection_name, qdrant_client, limit=5
+    text, collection_name, qdrant_client, limit=5, with_vectors=False
 ):
     text_embedding = text_to_embedding(text)
     similar_tickets = qdrant_client.search(
-        collection_name=collection_name, query_vector=text_embedding, limit=limit
+        collection_name=collection_name,
+        query_vector=text_embedding,
+        limit=limit,
+        with_payload=models.PayloadSelectorExclude(exclude=list(VECTOR_PAYLOAD_FIELDS)),
+        with_vectors=with_vectors,
     )
     results = []
     for ticket in similar_tickets:
-        results.append({"payload": ticket.payload, "score": ticket.score})
+        result = {"payload": ticket.payload, "score": ticket.score}
+        if with_vectors:
+            result["vector"] = encode_vector(ticket.vector)
+        results.append(result)
     return results
 
  
\ No newline at end of file
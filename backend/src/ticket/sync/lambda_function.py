@@ -0,0 +1,144 @@
+import json
+from typing import Dict, List, Optional, Tuple
+from qdrant_client import models
+
+from common import VECTOR_PAYLOAD_FIELDS, collection_name, get_qdrant_client
+
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+
+
+def lambda_handler(event, _context):
+    """
+    GET /ticket/sync?since=<watermark>&after_id=<ticket id>&limit=<page size>
+
+    Returns the tickets updated after the `(since, after_id)` cursor, ordered
+    by `updated_at` and then by id. Without `after_id` that is every ticket
+    whose `updated_at` is greater than `since`. Clients store the returned
+    `watermark` and `after_id` and pass them back on the next poll, repeating
+    immediately while `has_more` is true.
+
+    Tickets sharing one `updated_at`, e.g. after a batch update, are paged
+    by id, so a group larger than a page is still delivered in full.
+    """
+    params = (event or {}).get("queryStringParameters") or {}
+
+    try:
+        since = float(params.get("since") or 0)
+        after_id = params.get("after_id") or None
+        limit = min(int(params.get("limit") or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE)
+        if limit <= 0:
+            raise ValueError("page size must be positive")
+    except ValueError:
+        return {
+            "statusCode": 400,
+            "body": json.dumps({"base": {"message": "invalid sync parameters"}}),
+        }
+
+    tickets, watermark, next_after_id, has_more = sync_tickets(since, limit, after_id)
+    return {
+        "statusCode": 200,
+        "body": json.dumps(
+            {
+                "base": {"code": 0, "message": "success"},
+                "data": {
+                    "tickets": tickets,
+                    "watermark": watermark,
+                    "after_id": next_after_id,
+                    "has_more": has_more,
+                },
+            }
+        ),
+    }
+
+
+def sync_tickets(
+    since: float, limit: int = DEFAULT_PAGE_SIZE, after_id: Optional[str] = None
+) -> Tuple[List[Dict], float, Optional[str], bool]:
+    """
+    One page after the `(since, after_id)` cursor. Returns the tickets, the
+    cursor to continue from and whether there may be more.
+    """
+    points: List[models.Record] = []
+    if after_id is not None:
+        # finish the group of tickets updated at `since` first
+        points, more_in_group = scroll_updated_at(since, limit, after_id)
+        if more_in_group:
+            return _page(points, since, str(points[-1].id), True)
+
+    remaining = limit - len(points)
+    if remaining == 0:
+        return _page(points, since, None, True)
+
+    later, _ = get_qdrant_client().scroll(
+        collection_name=collection_name(),
+        scroll_filter=models.Filter(
+            must=[
+                models.FieldCondition(key="updated_at", range=models.Range(gt=since))
+            ]
+        ),
+        # ordering needs the updated_at payload index, see bootstrap.py
+        order_by=models.OrderBy(key="updated_at", direction=models.Direction.ASC),
+        limit=remaining,
+        with_payload=models.PayloadSelectorExclude(
+            exclude=list(VECTOR_PAYLOAD_FIELDS)
+        ),
+        with_vectors=False,
+    )
+    if len(later) < remaining:
+        points += later
+        watermark = points[-1].payload["updated_at"] if points else since
+        return _page(points, watermark, None, False)
+
+    # a full page may end in the middle of a group sharing one updated_at,
+    # whose order is not by id: leave that group to the next page
+    last_updated_at = later[-1].payload["updated_at"]
+    complete = [p for p in later if p.payload["updated_at"] != last_updated_at]
+    if points or complete:
+        points += complete
+        watermark = points[-1].payload["updated_at"] if complete else since
+        return _page(points, watermark, None, True)
+
+    # the whole page is one group, walk it by id instead
+    points, more_in_group = scroll_updated_at(last_updated_at, limit)
+    next_after_id = str(points[-1].id) if more_in_group else None
+    return _page(points, last_updated_at, next_after_id, True)
+
+
+def scroll_updated_at(
+    updated_at: float, limit: int, after_id: Optional[str] = None
+) -> Tuple[List[models.Record], bool]:
+    """
+    Up to `limit` tickets updated exactly at `updated_at` with an id after
+    `after_id`, in id order, and whether the group has more.
+    """
+    # the scroll offset is inclusive, fetch one more in case it is returned
+    points, next_offset = get_qdrant_client().scroll(
+        collection_name=collection_name(),
+        scroll_filter=models.Filter(
+            must=[
+                models.FieldCondition(
+                    key="updated_at",
+                    range=models.Range(gte=updated_at, lte=updated_at),
+                )
+            ]
+        ),
+        offset=after_id,
+        limit=limit + 1,
+        with_payload=models.PayloadSelectorExclude(
+            exclude=list(VECTOR_PAYLOAD_FIELDS)
+        ),
+        with_vectors=False,
+    )
+    if after_id is not None:
+        points = [p for p in points if str(p.id) != str(after_id)]
+    return points[:limit], len(points) > limit or next_offset is not None
+
+
+def _page(
+    points: List[models.Record],
+    watermark: float,
+    after_id: Optional[str],
+    has_more: bool,
+) -> Tuple[List[Dict], float, Optional[str], bool]:
+    return [point.payload for point in points], watermark, after_id, has_more
@@ -0,0 +1,92 @@
+import pytest
+
+from common import VECTOR_PAYLOAD_FIELDS
+
+TICKET = {
+    "title": "Fix Password Reset Email",
+    "description": "Password reset emails are not delivered",
+    "status": "open",
+    "priority": "high",
+    "type": "bug",
+    "labels": ["auth", "email"],
+}
+
+
+@pytest.fixture
+def create(load_handler):
+    return load_handler("create")
+
+
+def ticket(number: int) -> dict:
+    return {**TICKET, "title": f"{TICKET['title']} {number}"}
+
+
+def test_create_single_ticket(create, invoke, qdrant, embedder):
+    status, body = invoke(create, {"data": ticket(0)})
+
+    assert status == 200
+    created = body["data"]
+    assert created["id"] and created["created_at"] == created["updated_at"]
+    stored = qdrant.retrieve("tickets-test", ids=[created["id"]], with_vectors=True)
+    assert stored[0].payload["title"] == "Fix Password Reset Email 0"
+    assert stored[0].vector is not None
+    assert len(embedder.requests) == 1
+
+
+def test_create_batch_chunks_embeddings_and_upserts(
+    create, invoke, qdrant, embedder, monkeypatch
+):
+    monkeypatch.setenv("EMBEDDING_BATCH_SIZE", "4")
+    monkeypatch.setenv("UPSERT_BATCH_SIZE", "3")
+
+    status, body = invoke(create, {"data": [ticket(i) for i in range(10)]})
+
+    assert status == 200
+    titles = [created["title"] for created in body["data"]]
+    assert titles == [ticket(i)["title"] for i in range(10)]
+    assert body["errors"] == []
+    assert [len(texts) for texts in embedder.requests] == [4, 4, 2]
+    assert qdrant.count("tickets-test").count == 10
+
+
+def test_create_keeps_vectors_out_of_payloads(create, invoke, qdrant):
+    status, body = invoke(
+        create, {"data": [{**ticket(0), "embedding": [0.1, 0.2]}]}
+    )
+
+    assert status == 200
+    payload = qdrant.retrieve("tickets-test", ids=[body["data"][0]["id"]])[0].payload
+    assert not set(VECTOR_PAYLOAD_FIELDS) & set(payload)
+
+
+def test_create_reports_invalid_items(create, invoke, qdrant):
+    status, body = invoke(create, {"data": [ticket(0), "not a ticket", ticket(2)]})
+
+    assert status == 200
+    assert len(body["data"]) == 2
+    assert body["errors"] == [
+        {"index": 1, "status": 400, "message": "invalid ticket payload"}
+    ]
+
+
+def test_create_with_only_invalid_items_is_a_client_error(create, invoke, qdrant):
+    status, body = invoke(create, {"data": ["not a ticket", 42]})
+
+    assert status == 400
+    assert [error["index"] for error in body["errors"]] == [0, 1]
+    assert qdrant.count("tickets-test").count == 0
+
+
+def test_create_embedding_failure_is_a_server_error(create, invoke, embedder):
+    embedder.fail = True
+
+    status, body = invoke(create, {"data": [ticket(0)]})
+
+    assert status == 500
+    assert body["errors"][0]["status"] == 500
+
+
+def test_create_requires_data(create, invoke):
+    status, _ = invoke(create, {"data": []})
+
+    assert status == 400
@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+
+import pytest
+
+from common.embedding import embed_text, embed_texts
+from common.embedding_cache import (
+    EmbeddingCache,
+    SQLiteEmbeddingStore,
+    cache_key,
+)
+
+MODEL = "text-embedding-3-small"
+
+
+def vector_of(text: str) -> list:
+    # exact in float32, so vectors survive the SQLite round trip unchanged
+    return [float(len(text)), 0.5, -0.25]
+
+
+class FakeOpenAI:
+    """Answers `embeddings.create` in reverse order, like the API may."""
+
+    def __init__(self):
+        self.inputs = []
+        self.embeddings = SimpleNamespace(create=self.create)
+
+    def create(self, model, input, encoding_format):
+        self.inputs.append(list(input))
+        data = [
+            SimpleNamespace(index=index, embedding=vector_of(text))
+            for index, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=data[::-1])
+
+
+@pytest.fixture
+def openai_client():
+    return FakeOpenAI()
+
+
+def test_cache_key_ignores_whitespace_and_depends_on_the_model():
+    assert cache_key("a  b\n", MODEL) == cache_key("a b", MODEL)
+    assert cache_key("a b", MODEL) != cache_key("a b", "other-model")
+
+
+def test_lru_evicts_the_least_recently_used():
+    cache = EmbeddingCache(max_entries=2)
+    cache.put_many({"a": [1.0], "b": [2.0]})
+    cache.get_many(["a"])
+    cache.put_many({"c": [3.0]})
+
+    assert cache.get_many(["a", "b", "c"]) == {"a": [1.0], "c": [3.0]}
+
+
+def test_sqlite_store_round_trip(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    SQLiteEmbeddingStore(path).put_many({"a": [0.5, -0.25], "b": [1.0, 2.0]})
+
+    store = SQLiteEmbeddingStore(path)
+
+    assert store.get_many(["a", "b", "missing"]) == {
+        "a": [0.5, -0.25],
+        "b": [1.0, 2.0],
+    }
+    assert store.get_many([]) == {}
+
+
+def test_store_fills_the_lru(tmp_path):
+    store = SQLiteEmbeddingStore(str(tmp_path / "embeddings.sqlite3"))
+    store.put_many({"a": [0.5]})
+    cache = EmbeddingCache(max_entries=4, store=store)
+
+    assert cache.get_many(["a"]) == {"a": [0.5]}
+    cache.store = None
+    assert cache.get_many(["a"]) == {"a": [0.5]}
+
+
+def test_embed_texts_aligns_vectors_with_their_texts(openai_client):
+    texts = ["one", "three", "fifteen"]
+
+    vectors = embed_texts(texts, cache=EmbeddingCache(), openai_client=openai_client)
+
+    assert vectors == [vector_of(text) for text in texts]
+
+
+def test_embed_texts_sends_duplicates_once(openai_client):
+    vectors = embed_texts(
+        ["a", "bb", "a", "a  "], cache=EmbeddingCache(), openai_client=openai_client
+    )
+
+    assert openai_client.inputs == [["a", "bb"]]
+    assert vectors == [vector_of("a"), vector_of("bb"), vector_of("a"), vector_of("a")]
+
+
+def test_embed_texts_only_sends_uncached_texts(openai_client, tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    embed_texts(
+        ["a", "bb"],
+        cache=EmbeddingCache(store=SQLiteEmbeddingStore(path)),
+        openai_client=openai_client,
+    )
+
+    # a cold process with the same persistent tier
+    cache = EmbeddingCache(store=SQLiteEmbeddingStore(path))
+    vectors = embed_texts(["bb", "ccc", "a"], cache=cache, openai_client=openai_client)
+
+    assert openai_client.inputs == [["a", "bb"], ["ccc"]]
+    assert vectors == [vector_of("bb"), vector_of("ccc"), vector_of("a")]
+    assert embed_text("ccc", cache=cache, openai_client=openai_client) == vector_of(
+        "ccc"
+    )
+    assert len(openai_client.inputs) == 2
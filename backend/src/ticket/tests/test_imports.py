@@ -0,0 +1,23 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+import common.config
+
+TICKET_ROOT = Path(__file__).resolve().parent.parent
+
+HANDLERS = ["create", "find_similar", "gen", "list", "search", "sync", "update"]
+
+
+@pytest.mark.parametrize("name", HANDLERS)
+def test_handlers_import_without_settings(name, monkeypatch):
+    # benchmarks/cold_start.py --import-only relies on this
+    monkeypatch.delenv("QDRANT_COLLECTION_NAME", raising=False)
+    monkeypatch.setattr(common.config, "_dotenv_loaded", False)
+    path = TICKET_ROOT / name / "lambda_function.py"
+    spec = importlib.util.spec_from_file_location(f"{name}_import_check", path)
+    spec.loader.exec_module(importlib.util.module_from_spec(spec))
+
+    # no setting is read, so .env is not loaded either
+    assert not common.config._dotenv_loaded
@@ -0,0 +1,37 @@
+import pytest
+
+
+@pytest.fixture
+def search(load_handler, monkeypatch):
+    search = load_handler("search")
+    # the chat completion that rewrites the prompt is not under test
+    monkeypatch.setattr(search, "user_to_vectordb_prompt", lambda text: text)
+    return search
+
+
+@pytest.mark.parametrize(
+    "flag, expected",
+    [
+        (True, True),
+        ("true", True),
+        ("1", True),
+        ("false", False),
+        (False, False),
+        (None, False),
+    ],
+)
+def test_with_vectors_is_parsed_like_list(search, invoke, monkeypatch, flag, expected):
+    requested = []
+    monkeypatch.setattr(
+        search,
+        "fetch_similar_tickets",
+        lambda text, collection, client, limit, with_vectors: requested.append(
+            with_vectors
+        )
+        or [],
+    )
+
+    status, _ = invoke(search, {"user_ticket_text": "login", "with_vectors": flag})
+
+    assert status == 200
+    assert requested == [expected]
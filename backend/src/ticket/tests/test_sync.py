@@ -0,0 +1,83 @@
+import random
+import uuid
+
+import pytest
+from qdrant_client import models
+
+from conftest import TEST_COLLECTION_NAME, fake_embedding, sync_all
+
+
+@pytest.fixture
+def sync(load_handler):
+    return load_handler("sync")
+
+
+def store_tickets(qdrant, updated_ats):
+    ids = []
+    points = []
+    for number, updated_at in enumerate(updated_ats):
+        ticket_id = str(uuid.uuid4())
+        ids.append(ticket_id)
+        payload = {"id": ticket_id, "title": f"Ticket {number}", "updated_at": updated_at}
+        points.append(
+            models.PointStruct(
+                id=ticket_id, payload=payload, vector=fake_embedding(str(number))
+            )
+        )
+    qdrant.upsert(TEST_COLLECTION_NAME, points=points)
+    return ids
+
+
+def test_sync_pages_through_a_group_larger_than_a_page(sync, invoke, qdrant):
+    ids = store_tickets(qdrant, [1000.5] * 30)
+
+    tickets, watermark = sync_all(sync, limit=10)
+
+    assert sorted(t["id"] for t in tickets) == sorted(ids)
+    assert len(tickets) == 30
+    assert watermark == 1000.5
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("limit", [1, 2, 3, 7])
+def test_sync_delivers_every_ticket_once_in_order(sync, invoke, qdrant, seed, limit):
+    rng = random.Random(seed)
+    # few distinct timestamps, so most tickets share one with others
+    ids = store_tickets(qdrant, [float(rng.randint(1, 6)) for _ in range(25)])
+
+    tickets, watermark = sync_all(sync, limit=limit)
+
+    assert sorted(t["id"] for t in tickets) == sorted(ids)
+    updated_ats = [t["updated_at"] for t in tickets]
+    assert updated_ats == sorted(updated_ats)
+    assert watermark == max(updated_ats)
+
+
+def test_sync_only_returns_tickets_after_the_watermark(sync, invoke, qdrant):
+    store_tickets(qdrant, [1.0, 2.0, 3.0, 3.0])
+
+    tickets, watermark = sync_all(sync, since=2.0)
+
+    assert [t["updated_at"] for t in tickets] == [3.0, 3.0]
+    assert watermark == 3.0
+
+
+def test_sync_without_changes_keeps_the_watermark(sync, invoke, qdrant):
+    store_tickets(qdrant, [1.0])
+
+    status, body = invoke(sync, query={"since": 5.0})
+
+    assert status == 200
+    assert body["data"] == {
+        "tickets": [],
+        "watermark": 5.0,
+        "after_id": None,
+        "has_more": False,
+    }
+
+
+@pytest.mark.parametrize("query", [{"since": "yesterday"}, {"limit": 0}])
+def test_sync_rejects_invalid_parameters(sync, invoke, query):
+    status, _ = invoke(sync, query=query)
+
+    assert status == 400
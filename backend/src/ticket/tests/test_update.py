@@ -0,0 +1,238 @@
+import pytest
+
+from conftest import TEST_COLLECTION_NAME, sync_all
+
+TICKET = {
+    "title": "Fix Password Reset Email",
+    "description": "Password reset emails are not delivered",
+    "status": "open",
+    "priority": "high",
+    "type": "bug",
+    "labels": ["auth", "email"],
+}
+
+
+@pytest.fixture
+def update(load_handler):
+    return load_handler("update")
+
+
+@pytest.fixture
+def create_tickets(load_handler, invoke, embedder):
+    create = load_handler("create")
+
+    def create_tickets(count: int):
+        tickets = [{**TICKET, "title": f"{TICKET['title']} {n}"} for n in range(count)]
+        status, body = invoke(create, {"data": tickets})
+        assert status == 200
+        embedder.requests.clear()
+        return body["data"]
+
+    return create_tickets
+
+
+def stored(qdrant, ticket_id):
+    [point] = qdrant.retrieve(TEST_COLLECTION_NAME, ids=[ticket_id], with_vectors=True)
+    return point
+
+
+def test_update_single_ticket(update, invoke, qdrant, embedder, create_tickets):
+    [ticket] = create_tickets(1)
+
+    status, body = invoke(update, {"data": {"id": ticket["id"], "status": "done"}})
+
+    assert status == 200
+    assert body["data"]["status"] == "done"
+    assert body["data"]["updated_at"] > ticket["updated_at"]
+    assert stored(qdrant, ticket["id"]).payload == body["data"]
+    # status moves keep the vector
+    assert embedder.requests == []
+
+
+def test_single_and_batch_embed_the_same_text(
+    update, invoke, qdrant, embedder, create_tickets
+):
+    first, second = create_tickets(2)
+    delta = {"title": "Renamed", "description": ""}
+
+    invoke(update, {"data": {"id": first["id"], **delta}})
+    invoke(update, {"data": [{"id": second["id"], **delta}]})
+
+    assert embedder.requests[0] == embedder.requests[1]
+    assert stored(qdrant, first["id"]).vector == stored(qdrant, second["id"]).vector
+
+
+def test_precondition_rejects_a_stale_copy(update, invoke, qdrant, create_tickets):
+    [ticket] = create_tickets(1)
+    invoke(update, {"data": {"id": ticket["id"], "status": "done"}})
+
+    status, body = invoke(
+        update,
+        {
+            "data": {"id": ticket["id"], "priority": "low"},
+            "expected_updated_at": ticket["updated_at"],
+        },
+    )
+
+    assert status == 409
+    assert body["data"]["status"] == "done"
+    assert stored(qdrant, ticket["id"]).payload["priority"] == "high"
+
+
+def test_precondition_accepts_the_current_copy(update, invoke, create_tickets):
+    [ticket] = create_tickets(1)
+
+    status, body = invoke(
+        update,
+        {
+            "data": {"id": ticket["id"], "priority": "low"},
+            "expected_updated_at": ticket["updated_at"],
+        },
+    )
+
+    assert status == 200
+    assert body["data"]["priority"] == "low"
+
+
+@pytest.mark.parametrize("ticket_id", ["TICKET-A95216E6", -1, 1.5, {"id": 1}, True])
+def test_malformed_id_is_rejected(update, invoke, ticket_id):
+    status, body = invoke(update, {"data": {"id": ticket_id, "status": "done"}})
+
+    assert status == 400
+    assert body["base"]["message"] == "invalid ticket id"
+
+
+@pytest.mark.parametrize("field", ["title", "status", "type", "priority"])
+def test_clearing_a_required_field_is_rejected(
+    update, invoke, qdrant, create_tickets, field
+):
+    [ticket] = create_tickets(1)
+
+    status, body = invoke(update, {"data": {"id": ticket["id"], field: None}})
+
+    assert status == 400
+    assert body["base"]["message"] == f"{field} is required"
+    assert stored(qdrant, ticket["id"]).payload[field] == ticket[field]
+
+
+def test_batch_update_rejects_cleared_required_fields(
+    update, invoke, qdrant, create_tickets
+):
+    first, second = create_tickets(2)
+
+    status, body = invoke(
+        update,
+        {
+            "data": [
+                {"id": first["id"], "title": None, "status": None},
+                {"id": second["id"], "title": ""},
+            ]
+        },
+    )
+
+    assert status == 200
+    assert body["data"] == [None, None]
+    assert [(e["index"], e["status"], e["message"]) for e in body["errors"]] == [
+        (0, 400, "title is required"),
+        (1, 400, "title is required"),
+    ]
+    assert stored(qdrant, first["id"]).payload["status"] == "open"
+    assert stored(qdrant, second["id"]).payload["title"] == second["title"]
+
+
+def test_batch_update_reports_errors_per_item(
+    update, invoke, qdrant, embedder, create_tickets
+):
+    first, second, third = create_tickets(3)
+    invoke(update, {"data": {"id": third["id"], "status": "done"}})
+
+    status, body = invoke(
+        update,
+        {
+            "data": [
+                {"id": first["id"], "status": "done"},
+                {"id": "not-a-uuid", "status": "done"},
+                {"id": second["id"], "title": "Renamed"},
+                {"id": first["id"], "status": "open"},
+                {"id": "00000000-0000-0000-0000-000000000000", "status": "done"},
+                {
+                    "id": third["id"],
+                    "status": "open",
+                    "expected_updated_at": third["updated_at"],
+                },
+                {"status": "done"},
+            ]
+        },
+    )
+
+    assert status == 200
+    updated = body["data"]
+    assert updated[0]["status"] == "done"
+    assert updated[2]["title"] == "Renamed"
+    assert updated[1] is updated[3] is updated[4] is updated[5] is updated[6] is None
+    assert [(e["index"], e["status"]) for e in body["errors"]] == [
+        (1, 400),
+        (3, 400),
+        (4, 404),
+        (5, 409),
+        (6, 400),
+    ]
+    assert body["errors"][3]["data"]["status"] == "done"
+    assert [len(texts) for texts in embedder.requests] == [1]
+    assert stored(qdrant, second["id"]).payload["title"] == "Renamed"
+    assert stored(qdrant, third["id"]).payload["status"] == "done"
+
+
+def test_batch_update_chunks_embeddings(
+    update, invoke, embedder, create_tickets, monkeypatch
+):
+    monkeypatch.setenv("EMBEDDING_BATCH_SIZE", "4")
+    monkeypatch.setenv("UPSERT_BATCH_SIZE", "3")
+    tickets = create_tickets(10)
+
+    status, body = invoke(
+        update,
+        {"data": [{"id": t["id"], "title": f"Renamed {n}"} for n, t in enumerate(tickets)]},
+    )
+
+    assert status == 200
+    assert [t["title"] for t in body["data"]] == [f"Renamed {n}" for n in range(10)]
+    assert [len(texts) for texts in embedder.requests] == [4, 4, 2]
+
+
+def test_batch_update_larger_than_a_sync_page_is_fully_synced(
+    update, invoke, load_handler, create_tickets
+):
+    tickets = create_tickets(30)
+    sync = load_handler("sync")
+    _, watermark = sync_all(sync)
+
+    status, body = invoke(
+        update, {"data": [{"id": t["id"], "status": "done"} for t in tickets]}
+    )
+    assert status == 200
+    # the whole batch shares one updated_at
+    assert len({t["updated_at"] for t in body["data"]}) == 1
+
+    synced, _ = sync_all(sync, since=watermark, limit=10)
+
+    assert sorted(t["id"] for t in synced) == sorted(t["id"] for t in tickets)
+    assert all(t["status"] == "done" for t in synced)
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_clearing_the_description_re_embeds(
+    update, invoke, qdrant, embedder, create_tickets, batch
+):
+    [ticket] = create_tickets(1)
+    before = stored(qdrant, ticket["id"]).vector
+    delta = {"id": ticket["id"], "description": ""}
+
+    status, _ = invoke(update, {"data": [delta] if batch else delta})
+
+    assert status == 200
+    point = stored(qdrant, ticket["id"])
+    assert point.payload["description"] == ""
+    assert len(embedder.requests) == 1
+    assert "ticket description: ," in embedder.requests[0][0]
+    assert point.vector != before
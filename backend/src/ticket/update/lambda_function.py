@@ -1,38 +1,59 @@
 from datetime import datetime
 import json
-import os
-from openai import OpenAI
-from typing import Dict
-from dotenv import load_dotenv
-from qdrant_client import QdrantClient
-from qdrant_client.models import PointVectors, Record
-
-load_dotenv()
-
-OPENAI_API_KEY = os.environ["OPENAI_API_KEY"]
-QDRANT_URL = os.environ["QDRANT_URL"]
-QDRANT_API_KEY = os.environ["QDRANT_API_KEY"]
-QDRANT_COLLECTION_NAME = os.environ["QDRANT_COLLECTION_NAME"]
-
-qdrant_client = QdrantClient(
-    url=QDRANT_URL,
-    api_key=QDRANT_API_KEY,
+import uuid
+from typing import Dict, Iterator, List, Tuple
+from qdrant_client.models import (
+    PayloadSelectorExclude,
+    PointStruct,
+    PointsList,
+    Record,
+    SetPayload,
+    SetPayloadOperation,
+    UpsertOperation,
 )
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
+
+from common import (
+    VECTOR_PAYLOAD_FIELDS,
+    collection_name,
+    embed_text,
+    embed_texts,
+    embedding_batch_size,
+    get_qdrant_client,
+    stringify_ticket,
+    strip_vectors,
+    upsert_batch_size,
+)
+
+# fields that make up the embedded ticket text, see `stringify_ticket`
+EMBEDDED_FIELDS = ("title", "description", "type")
+# fields every stored ticket must keep, a delta may change but not clear them
+REQUIRED_FIELDS = ("title", "status", "type", "priority")
 
 
 def lambda_handler(event, _context):
     body: Dict = json.loads(event["body"])
     ticket_delta = body.get("data")
 
+    if isinstance(ticket_delta, list) and ticket_delta:
+        updated, errors = update_tickets(ticket_delta)
+        return {
+            "statusCode": 200,
+            "body": json.dumps(
+                {
+                    "base": {"code": 0, "message": "success"},
+                    "data": updated,
+                    "errors": errors,
+                }
+            ),
+        }
+
     if not ticket_delta or not isinstance(ticket_delta, dict) or len(ticket_delta) == 0:
         return {
             "statusCode": 400,
             "body": json.dumps({"base": {"message": "ticket data is required"}}),
         }
 
-    ticket_id = ticket_delta.get("id")
-    del ticket_delta["id"] # we don't want to update the id
+    ticket_id = ticket_delta.pop("id", None)  # we don't want to update the id
 
     if not ticket_id:
         return {
@@ -40,6 +61,19 @@ def lambda_handler(event, _context):
             "body": json.dumps({"base": {"message": "ticket id is required"}}),
         }
 
+    if not is_point_id(ticket_id):
+        return {
+            "statusCode": 400,
+            "body": json.dumps({"base": {"message": "invalid ticket id"}}),
+        }
+
+    cleared = cleared_required_field(ticket_delta)
+    if cleared:
+        return {
+            "statusCode": 400,
+            "body": json.dumps({"base": {"message": f"{cleared} is required"}}),
+        }
+
     original_ticket = select_ticket(ticket_id)
     if not original_ticket:
         return {
@@ -47,21 +81,36 @@ def lambda_handler(event, _context):
             "body": json.dumps({"base": {"message": "ticket not found"}}),
         }
 
-    update_ticket_payload(original_ticket, ticket_delta)
-    original_ticket = select_ticket(ticket_id)
-    assert original_ticket, "Unexpected state: ticket not found after update"
+    # optional optimistic concurrency check against the copy the client edited
+    expected_updated_at = body.get("expected_updated_at")
+    if expected_updated_at is not None and expected_updated_at != (
+        original_ticket.payload or {}
+    ).get("updated_at"):
+        return {
+            "statusCode": 409,
+            "body": json.dumps(
+                {
+                    "base": {"message": "ticket was modified by someone else"},
+                    "data": original_ticket.payload,
+                }
+            ),
+        }
+
+    updated_ticket = update_ticket_payload(original_ticket, ticket_delta)
 
     return {
         "statusCode": 200,
         "body": json.dumps(
-            {"base": {"code": 0, "message": "success"}, "data": original_ticket.payload}
+            {"base": {"code": 0, "message": "success"}, "data": updated_ticket}
         ),
     }
 
 
 def select_ticket(ticket_id: int):
-    ticket = qdrant_client.retrieve(
-        collection_name=QDRANT_COLLECTION_NAME, ids=[ticket_id]
+    ticket = get_qdrant_client().retrieve(
+        collection_name=collection_name(),
+        ids=[ticket_id],
+        with_payload=PayloadSelectorExclude(exclude=list(VECTOR_PAYLOAD_FIELDS)),
     )
 
     if not ticket:
@@ -71,36 +120,229 @@ def select_ticket(ticket_id: int):
 
 
 def text_to_embedding(text):
-    embeddings = openai_client.embeddings.create(
-        model="text-embedding-3-small", input=text, encoding_format="float"
-    )
-    return embeddings.data[0].embedding
+    return embed_text(text)
 
 
-def update_ticket_payload(original_ticket: Record, ticket_delta: Dict):
+def update_ticket_payload(original_ticket: Record, ticket_delta: Dict) -> Dict:
+    """
+    Applies the delta with a single Qdrant write and returns the merged payload,
+    so no read-back is needed.
+    """
+    ticket_delta = strip_vectors(ticket_delta)
     ticket_delta["updated_at"] = datetime.now().timestamp()
+    original_payload = original_ticket.payload or {}
+    updated_ticket = {**original_payload, **ticket_delta}
 
-    qdrant_client.set_payload(
-        collection_name=QDRANT_COLLECTION_NAME,
-        points=[original_ticket.id],
-        payload=ticket_delta,
-    )
+    if not text_changed(original_payload, ticket_delta):
+        # status/priority/assignee/label moves keep the existing vector
+        get_qdrant_client().set_payload(
+            collection_name=collection_name(),
+            points=[original_ticket.id],
+            payload=ticket_delta,
+        )
+        return updated_ticket
 
-    ticket_title = ticket_delta.get("title") or (original_ticket.payload or {}).get(
-        "title"
-    )
-    ticket_desc = ticket_delta.get("description") or (
-        original_ticket.payload or {}
-    ).get("description")
-    ticket_type = ticket_delta.get("type") or (original_ticket.payload or {}).get(
-        "type"
-    )
-    ticket_text = f"ticket title: {ticket_title}, ticket description: {ticket_desc}, ticket type: {ticket_type}"
-    ticket_embedding = text_to_embedding(ticket_text)
+    ticket_embedding = text_to_embedding(embedding_text(updated_ticket))
 
-    qdrant_client.update_vectors(
-        collection_name=QDRANT_COLLECTION_NAME,
+    # payload and vector in one write, the upsert replaces the whole point
+    get_qdrant_client().upsert(
+        collection_name=collection_name(),
         points=[
-            PointVectors(id=original_ticket.id, vector=ticket_embedding),
+            PointStruct(
+                id=original_ticket.id,
+                payload=updated_ticket,
+                vector=ticket_embedding,
+            ),
         ],
     )
+    return updated_ticket
+
+
+def embedding_text(payload: Dict) -> str:
+    """The text a ticket is embedded from, always its merged payload."""
+    return stringify_ticket({field: payload.get(field) for field in EMBEDDED_FIELDS})
+
+
+def is_point_id(value) -> bool:
+    """Qdrant point ids are unsigned integers or UUIDs, it rejects anything else."""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return value >= 0
+    if not isinstance(value, str):
+        return False
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def cleared_required_field(ticket_delta: Dict):
+    """The first required field the delta sets to null or blank, if any."""
+    for field in REQUIRED_FIELDS:
+        if field in ticket_delta and ticket_delta[field] in (None, ""):
+            return field
+    return None
+
+
+def text_changed(original_payload: Dict, ticket_delta: Dict) -> bool:
+    # a cleared field is a change too, the vector must follow the payload
+    return any(
+        field in ticket_delta and ticket_delta[field] != original_payload.get(field)
+        for field in EMBEDDED_FIELDS
+    )
+
+
+def chunked(items: List, size: int) -> Iterator[List]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def update_tickets(items: List) -> Tuple[List, List[Dict]]:
+    """
+    Applies a list of `{"id", ...delta}` items (each optionally with an
+    `expected_updated_at`) with one `retrieve` for all originals, one
+    embedding request per chunk of text-changed tickets and batched Qdrant
+    writes. Payload-only deltas that are identical, e.g. the same assignee
+    for many tickets, share a single set-payload operation.
+
+    Returns the updated tickets in input order, None where an item failed,
+    and a list of `{"index", "id", "status", "message"}` errors, 409 errors
+    also carrying the current ticket as `data`.
+    """
+    errors = []
+    deltas: Dict[str, Tuple[int, Dict, object]] = {}
+    for index, item in enumerate(items):
+        if not isinstance(item, dict) or not item.get("id"):
+            errors.append(_item_error(index, None, 400, "ticket id is required"))
+            continue
+        if not is_point_id(item["id"]):
+            errors.append(_item_error(index, None, 400, "invalid ticket id"))
+            continue
+        item = dict(item)
+        ticket_id = item.pop("id")
+        expected_updated_at = item.pop("expected_updated_at", None)
+        if ticket_id in deltas:
+            errors.append(_item_error(index, ticket_id, 400, "duplicate ticket id"))
+            continue
+        cleared = cleared_required_field(item)
+        if cleared:
+            errors.append(_item_error(index, ticket_id, 400, f"{cleared} is required"))
+            continue
+        deltas[ticket_id] = (index, strip_vectors(item), expected_updated_at)
+
+    originals = {}
+    if deltas:
+        originals = {
+            str(ticket.id): ticket for ticket in select_tickets(list(deltas))
+        }
+
+    now = datetime.now().timestamp()
+    # (index, ticket id, delta, merged payload), split by whether to re-embed
+    payload_only, text_updates = [], []
+    for ticket_id, (index, delta, expected_updated_at) in deltas.items():
+        original = originals.get(str(ticket_id))
+        if original is None:
+            errors.append(_item_error(index, ticket_id, 404, "ticket not found"))
+            continue
+        payload = original.payload or {}
+        if expected_updated_at is not None and expected_updated_at != payload.get(
+            "updated_at"
+        ):
+            errors.append(
+                {
+                    **_item_error(
+                        index, ticket_id, 409, "ticket was modified by someone else"
+                    ),
+                    "data": payload,
+                }
+            )
+            continue
+
+        delta["updated_at"] = now
+        update = (index, original.id, delta, {**payload, **delta})
+        (text_updates if text_changed(payload, delta) else payload_only).append(update)
+
+    operations = []  # (indexes, operation)
+    by_delta: Dict[str, Tuple[List[int], List, Dict]] = {}
+    for index, point_id, delta, _ in payload_only:
+        key = json.dumps(delta, sort_keys=True, default=str)
+        indexes, point_ids, _ = by_delta.setdefault(key, ([], [], delta))
+        indexes.append(index)
+        point_ids.append(point_id)
+    for indexes, point_ids, delta in by_delta.values():
+        operations.append(
+            (
+                indexes,
+                SetPayloadOperation(
+                    set_payload=SetPayload(payload=delta, points=point_ids)
+                ),
+            )
+        )
+
+    for batch in chunked(text_updates, embedding_batch_size()):
+        try:
+            embeddings = embed_texts(
+                [embedding_text(merged) for _, _, _, merged in batch]
+            )
+        except Exception as e:
+            errors.extend(
+                _item_error(index, point_id, 500, f"embedding failed: {e}")
+                for index, point_id, _, _ in batch
+            )
+            continue
+        for (index, point_id, _, merged), embedding in zip(batch, embeddings):
+            operations.append(
+                (
+                    [index],
+                    UpsertOperation(
+                        upsert=PointsList(
+                            points=[
+                                PointStruct(
+                                    id=point_id, payload=merged, vector=embedding
+                                )
+                            ]
+                        )
+                    ),
+                )
+            )
+
+    merged_by_index = {
+        index: (point_id, merged)
+        for index, point_id, _, merged in payload_only + text_updates
+    }
+    updated = [None] * len(items)
+    for batch in chunked(operations, upsert_batch_size()):
+        try:
+            get_qdrant_client().batch_update_points(
+                collection_name=collection_name(),
+                update_operations=[operation for _, operation in batch],
+            )
+        except Exception as e:
+            errors.extend(
+                _item_error(
+                    index, merged_by_index[index][0], 500, f"update failed: {e}"
+                )
+                for indexes, _ in batch
+                for index in indexes
+            )
+            continue
+        for indexes, _ in batch:
+            for index in indexes:
+                updated[index] = merged_by_index[index][1]
+
+    errors.sort(key=lambda error: error["index"])
+    return updated, errors
+
+
+def select_tickets(ticket_ids: List) -> List[Record]:
+    return get_qdrant_client().retrieve(
+        collection_name=collection_name(),
+        ids=ticket_ids,
+        with_payload=PayloadSelectorExclude(exclude=list(VECTOR_PAYLOAD_FIELDS)),
+    )
+
+
+def _item_error(index: int, ticket_id, status: int, message: str) -> Dict:
+    return {"index": index, "id": ticket_id, "status": status, "message": message}
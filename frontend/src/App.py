@@ -1,8 +1,8 @@
 import streamlit as st
 import time
 
-from utils import SAMPLE_TICKETS, SAMPLE_USERS, get_user, auth_user
-from services.ticket import list_tickets
+from utils import SAMPLE_USERS, get_user, auth_user
+from services.ticket_store import get_ticket_store
 
 st.set_page_config(
     layout="centered",
@@ -17,7 +17,7 @@ curr_user = SAMPLE_USERS[0]
 
 def initialise_states():
     if "tickets" not in st.session_state:
-        st.session_state.tickets = list_tickets()
+        st.session_state.tickets = get_ticket_store().list()
     if "users" not in st.session_state:
         st.session_state.users = SAMPLE_USERS
     if "curr_user" not in st.session_state:
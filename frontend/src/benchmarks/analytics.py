@@ -0,0 +1,287 @@
+"""
+Benchmarks services/analytics.py on synthetic sprint logs: wall time and
+peak traced memory of every analytics function at several log sizes.
+
+    python benchmarks/analytics.py                              # 1k, 100k, 1M events
+    python benchmarks/analytics.py --sizes 1000 100000 --save-baseline baseline.json
+    python benchmarks/analytics.py --baseline baseline.json --tolerance 0.25
+    python benchmarks/analytics.py --sizes 1000 10000 --check-parity
+
+--check-parity compares every function against the original per-ticket loop
+implementations in tests/analytics_baseline.py, on logs shuffled by
+--out-of-order.
+"""
+
+import argparse
+import copy
+import json
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from services.analytics import (  # noqa: E402
+    generate_lead_time,
+    generate_sprint_burndown,
+    generate_tix_status_breakdown,
+    generate_tix_status_per_unit_time,
+    group_events_by_tix,
+)
+from services.analytics_pipeline import SprintAnalytics  # noqa: E402
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+DAY_MS = 24 * 60 * 60 * 1000
+DESCRIPTIONS = [
+    "update status - in_progress",
+    "update status - open",
+    "update priority - high",
+    "update priority - low",
+    "update status - review",
+]
+PRIORITIES = ["low", "medium", "high"]
+
+
+def generate_sprint(
+    size: int,
+    events_per_ticket: int,
+    sprint_days: int = 14,
+    out_of_order: float = 0.0,
+    seed: int = 0,
+) -> Dict:
+    """
+    A sprint log of exactly `size` events in the `get_sample_analytics`
+    format. Every ticket is created during the sprint and gets
+    `events_per_ticket` events in all (the last ticket the remainder): a
+    create, updates and, two times in three, a completion as its last event.
+    `out_of_order` is roughly the fraction of events swapped with another at
+    a random position in the log.
+    """
+    rng = random.Random(seed)
+    start_time = int(datetime(2025, 1, 6, tzinfo=timezone.utc).timestamp() * 1000)
+    end_time = start_time + sprint_days * DAY_MS
+    events_per_ticket = max(events_per_ticket, 1)
+
+    events = []
+    for ticket in range(-(-size // events_per_ticket)):
+        ticket_id = f"TIX-{ticket}"
+        ticket_events = min(events_per_ticket, size - len(events))
+        priority = rng.choice(PRIORITIES)
+        timestamp = rng.randint(start_time - DAY_MS, end_time - DAY_MS)
+        events.append(
+            {
+                "ticket_id": ticket_id,
+                "timestamp": timestamp,
+                "description": "create ticket",
+                "status": "open",
+                "priority": priority,
+            }
+        )
+        completed = ticket_events >= 2 and rng.random() < 2 / 3
+        for _ in range(ticket_events - 1 - completed):
+            timestamp += rng.randint(0, DAY_MS // 2)
+            events.append(
+                {
+                    "ticket_id": ticket_id,
+                    "timestamp": timestamp,
+                    "description": rng.choice(DESCRIPTIONS),
+                    "status": "in_progress",
+                    "priority": priority,
+                }
+            )
+        if completed:
+            events.append(
+                {
+                    "ticket_id": ticket_id,
+                    "timestamp": timestamp + rng.randint(0, 2 * DAY_MS),
+                    "description": "complete ticket",
+                    "status": "done",
+                    "priority": priority,
+                }
+            )
+
+    # logs arrive mostly in time order, with a few events swapped far away
+    events.sort(key=lambda e: e["timestamp"])
+    for _ in range(int(len(events) * out_of_order / 2)):
+        i, j = rng.randrange(len(events)), rng.randrange(len(events))
+        events[i], events[j] = events[j], events[i]
+
+    return {
+        "id": f"synthetic-{size}x{events_per_ticket}",
+        "start_time": start_time,
+        "end_time": end_time,
+        "events": events,
+    }
+
+
+def sprint_of_size(events: int, args) -> Dict:
+    return generate_sprint(
+        events, args.events_per_ticket, args.sprint_days, args.out_of_order, args.seed
+    )
+
+
+def measure(fn: Callable, repeat: int) -> Dict:
+    """Best wall time over `repeat` runs and the peak memory of one traced run."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "time_ms": round(min(times) * 1000, 2),
+        "median_ms": round(statistics.median(times) * 1000, 2),
+        "peak_mb": round(peak / 2**20, 2),
+    }
+
+
+def benchmarks(sprint: Dict) -> Dict[str, Callable]:
+    events_by_ticket = group_events_by_tix(sprint)
+    return {
+        "group_events_by_tix": lambda: group_events_by_tix(sprint),
+        "generate_lead_time": lambda: generate_lead_time(events_by_ticket),
+        # a plain dict has to be converted back to columns, unlike the grouping
+        "generate_lead_time[dict]": lambda: generate_lead_time(
+            dict(events_by_ticket)
+        ),
+        "generate_tix_status_breakdown": lambda: generate_tix_status_breakdown(
+            events_by_ticket
+        ),
+        "generate_tix_status_per_unit_time": (
+            lambda: generate_tix_status_per_unit_time(sprint)
+        ),
+        "generate_sprint_burndown": lambda: generate_sprint_burndown(sprint),
+        # everything the Analytics page shows, from one shared pipeline
+        "sprint_analytics_page": lambda: _render_page(SprintAnalytics(sprint)),
+    }
+
+
+def _render_page(analytics: SprintAnalytics):
+    analytics.header()
+    analytics.status_flow()
+    analytics.status_breakdown
+    analytics.lead_time()
+
+
+def check_parity(sprint: Dict) -> List[str]:
+    """
+    Names of the analytics functions whose results differ from the original
+    implementations kept in tests/analytics_baseline.py, at one frozen now.
+    """
+    import services.analytics as analytics
+    import services.analytics_engine as analytics_engine
+    from tests import analytics_baseline as baseline
+
+    now = datetime.now()
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return now if tz is None else now.astimezone(tz)
+
+    def results(module, fresh: Callable[[], Dict]) -> Dict:
+        return {
+            "group_events_by_tix": list(module.group_events_by_tix(fresh()).items()),
+            "get_analytics_page_header": module.get_analytics_page_header(fresh()),
+            "generate_lead_time": module.generate_lead_time(
+                module.group_events_by_tix(fresh())
+            ),
+            "generate_tix_status_breakdown": module.generate_tix_status_breakdown(
+                module.group_events_by_tix(fresh())
+            ),
+            "generate_tix_status_per_unit_time": tuple(
+                module.generate_tix_status_per_unit_time(fresh())
+            ),
+            "generate_sprint_burndown": module.generate_sprint_burndown(fresh()),
+        }
+
+    with mock.patch.object(analytics, "datetime", FrozenDatetime), mock.patch.object(
+        analytics_engine, "datetime", FrozenDatetime
+    ), mock.patch.object(baseline, "datetime", FrozenDatetime):
+        actual = results(analytics, lambda: sprint)
+        # the original implementations may change their input
+        expected = results(baseline, lambda: copy.deepcopy(sprint))
+    return [name for name in actual if actual[name] != expected[name]]
+
+
+def find_regressions(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    regressions = []
+    for size, results in report.items():
+        for name, result in results.items():
+            previous = baseline.get(size, {}).get(name)
+            if not previous:
+                continue
+            for metric in ("time_ms", "peak_mb"):
+                # ignore noise on anything that takes under a millisecond / MB
+                limit = max(previous[metric] * (1 + tolerance), previous[metric] + 1)
+                if result[metric] > limit:
+                    regressions.append(
+                        f"{name} @ {size} events: {metric} "
+                        f"{previous[metric]} -> {result[metric]}"
+                    )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--events-per-ticket", type=int, default=5)
+    parser.add_argument("--sprint-days", type=int, default=14)
+    parser.add_argument(
+        "--out-of-order", type=float, default=0.05, help="fraction of events moved"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", nargs="+", help="benchmark names to run")
+    parser.add_argument("--check-parity", action="store_true")
+    parser.add_argument("--save-baseline", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="fail on regressions against this file")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed slowdown, 0.2 = 20%%"
+    )
+    args = parser.parse_args()
+
+    report = {}
+    failures = []
+    for size in args.sizes:
+        sprint = sprint_of_size(size, args)
+        print(f"\n{len(sprint['events'])} events")
+
+        if args.check_parity:
+            mismatches = check_parity(sprint)
+            failures.extend(f"parity {name} @ {size} events" for name in mismatches)
+            print(f"  parity: {'ok' if not mismatches else ', '.join(mismatches)}")
+
+        report[str(size)] = {}
+        for name, fn in benchmarks(sprint).items():
+            if args.only and name not in args.only:
+                continue
+            result = report[str(size)][name] = measure(fn, args.repeat)
+            print(
+                f"  {name:<36}"
+                + "  ".join(f"{m}={v:>10}" for m, v in result.items())
+            )
+
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        failures.extend(find_regressions(report, baseline, args.tolerance))
+
+    if failures:
+        sys.exit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
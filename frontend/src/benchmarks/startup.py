@@ -0,0 +1,119 @@
+"""
+Measures frontend startup: import time of the shared packages and of App.py
+and every page, each in a fresh interpreter with the network stubbed.
+
+    python benchmarks/startup.py                 # everything
+    python benchmarks/startup.py App.py --budget-ms 1500
+
+HTTP calls made through requests are answered with an empty success response
+and counted, raw socket connections (OpenAI, Qdrant) are refused and counted.
+Importing `components`, `services` or `utils` must not touch the network at
+all; pages may, since Streamlit renders them while importing.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_ROOT = Path(__file__).resolve().parent.parent
+
+PACKAGES = ["entities", "services", "utils", "components"]
+SCRIPTS = [
+    "App.py",
+    *sorted(f"pages/{page.name}" for page in (SRC_ROOT / "pages").glob("*.py")),
+]
+
+RUNNER = """
+import json, runpy, socket, sys, time
+src_root, target = sys.argv[1:3]
+sys.path.insert(0, src_root)
+
+calls = {"http": 0, "socket": 0}
+
+def refuse(*args, **kwargs):
+    calls["socket"] += 1
+    raise ConnectionRefusedError("network is stubbed")
+
+socket.socket.connect = refuse
+socket.create_connection = refuse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+def send(self, request, **kwargs):
+    calls["http"] += 1
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(
+        {"base": {"code": 0, "message": "success"}, "data": []}
+    ).encode()
+    response.url = request.url
+    response.request = request
+    return response
+
+HTTPAdapter.send = send
+
+start = time.perf_counter()
+if target.endswith(".py"):
+    runpy.run_path(f"{src_root}/{target}", run_name="__main__")
+else:
+    __import__(target)
+print(json.dumps({"import_ms": (time.perf_counter() - start) * 1000, **calls}))
+"""
+
+
+def measure(target: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", RUNNER, str(SRC_ROOT), target],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=SRC_ROOT,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("targets", nargs="*", help=", ".join(PACKAGES + SCRIPTS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--budget-ms", type=float, help="fail if any median import exceeds this"
+    )
+    parser.add_argument("--output", help="write the medians as JSON to this file")
+    args = parser.parse_args()
+    unknown = set(args.targets) - set(PACKAGES + SCRIPTS)
+    if unknown:
+        parser.error(f"unknown targets: {', '.join(sorted(unknown))}")
+
+    report = {}
+    failures = []
+    for target in args.targets or PACKAGES + SCRIPTS:
+        runs = [measure(target) for _ in range(args.repeat)]
+        report[target] = {
+            "import_ms": round(statistics.median(run["import_ms"] for run in runs), 1),
+            "http": max(run["http"] for run in runs),
+            "socket": max(run["socket"] for run in runs),
+        }
+        print(
+            f"{target:<32}"
+            + "  ".join(f"{m}={v:>8}" for m, v in report[target].items())
+        )
+
+        if target in PACKAGES and (report[target]["http"] or report[target]["socket"]):
+            failures.append(f"importing {target} made network calls")
+        if args.budget_ms is not None and report[target]["import_ms"] > args.budget_ms:
+            failures.append(f"{target} took {report[target]['import_ms']}ms")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+
+    if failures:
+        sys.exit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
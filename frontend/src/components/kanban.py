@@ -1,12 +1,33 @@
-from typing import Dict, List
+from typing import Callable, Dict, List
+import heapq
 import streamlit as st
 from datetime import datetime, timezone
 import time
+import uuid
 
 from entities import Ticket, Status, Priority, Type
-from services.ticket import update_ticket
+from services.ticket import diff_ticket
+from services.ticket_store import get_ticket_store
+from services.ticket_writer import get_ticket_writer
 from .card import KanbanCard
 
+# every card is an HTML block plus up to three buttons, so columns only render
+# a window of cards ("load more" grows it) and the board caps cards per rerun
+CARDS_PER_PAGE = 20
+MAX_CARDS_PER_RERUN = 120
+
+PRIORITY_RANK = {Priority.HIGH: 0, Priority.MEDIUM: 1, Priority.LOW: 2}
+
+
+def _updated_at(ticket: Ticket) -> float:
+    return ticket.updated_at.timestamp() if ticket.updated_at else 0.0
+
+
+SORT_KEYS: Dict[str, Callable[[Ticket], tuple]] = {
+    "Priority": lambda t: (PRIORITY_RANK.get(t.priority, 3), -_updated_at(t)),
+    "Recently updated": lambda t: (-_updated_at(t),),
+}
+
 
 class KanbanBoard:
     def __init__(self, tickets: List[Ticket]):
@@ -15,6 +36,10 @@ class KanbanBoard:
             status.value for status in Status
         ]  # ['Open', 'In Progress', 'Done']
         st.session_state.tickets = tickets
+        # facets, counts and filtering are answered by the store's index
+        self.store = get_ticket_store()
+        # moves are applied to the store at once and saved in the background
+        self.writer = get_ticket_writer()
 
         # # Initialize session state for tickets if not exists
         # if "tickets" not in st.session_state:
@@ -22,6 +47,16 @@ class KanbanBoard:
 
         if "dragging" not in st.session_state:
             st.session_state.dragging = None
+        # cards shown per column, grown by "load more"
+        if "kanban_windows" not in st.session_state:
+            st.session_state.kanban_windows = {}
+        # identifies this browser session's moves in the shared write queue
+        if "kanban_session" not in st.session_state:
+            st.session_state.kanban_session = uuid.uuid4().hex
+        # there is no backend delete, deleted cards are only hidden for this
+        # browser session and stay in the shared store
+        if "kanban_deleted" not in st.session_state:
+            st.session_state.kanban_deleted = set()
 
         self.ticket_colors = {
             Priority.HIGH.value: "#ff6b6b",  # Red for high priority
@@ -59,25 +94,26 @@ class KanbanBoard:
                 on_delete=self.delete_ticket,
             )
 
-    # TODO: call update from backend API
     def move_ticket(self, target_ticket: Ticket, new_status: str):
-        """Move a ticket to a new status column."""
-        # Find the ticket by ID in the list
-        for i, ticket in enumerate(st.session_state.tickets):
-            if ticket.id == target_ticket.id:
-                target_ticket.status = Status(new_status)
-                target_ticket_json = target_ticket.model_dump()
-                target_ticket_json["created_at"] = None
-                target_ticket_json["updated_at"] = None
-                updated_ticket = update_ticket(target_ticket_json)
-
-                # Replace the old ticket with updated one
-                if update_ticket:
-                    st.session_state.tickets[i] = updated_ticket
-                    st.rerun()
-                    break
-                else:
-                    st.error(f"Failed to update ticket {target_ticket.id}")
+        """
+        Move a ticket to a new status column. The board shows the move right
+        away, the status change is saved in the background.
+        """
+        delta = diff_ticket(target_ticket, {"status": new_status})
+        if not delta:
+            return
+        self.writer.enqueue(
+            target_ticket, delta, owner=st.session_state.kanban_session
+        )
+        st.rerun()
+
+    def report_failed_moves(self):
+        """Show the moves that could not be saved since the last rerun."""
+        for failure in self.writer.take_failures(st.session_state.kanban_session):
+            st.error(
+                f"Failed to update ticket {failure.ticket_id}, "
+                f"its status is {failure.restored.status.value}"
+            )
 
     # TODO: decide whether to implement delete or remove this functionality
     def delete_ticket(self, ticket_id: str):
@@ -88,8 +124,10 @@ class KanbanBoard:
                 # Create a temp container for the toast
                 toast_container = st.empty()
 
-                # Remove the ticket
+                # Remove the ticket, the board renders from the shared index
+                # so it is also hidden there for this session only
                 st.session_state.tickets.pop(i)
+                st.session_state.kanban_deleted.add(ticket_id)
 
                 # Show success toast
                 with toast_container:
@@ -103,13 +141,17 @@ class KanbanBoard:
     def render(self):
         """Render the Kanban board."""
         st.title("📋 Sprint Kanban Board")
+        self.report_failed_moves()
+        unsaved = self.writer.pending_count()
+        if unsaved:
+            st.caption(f"Saving {unsaved} moved tickets…")
 
         # Add filters in the sidebar
         with st.sidebar:
             st.header("Filters")
             selected_assignee = st.multiselect(
                 "Assignee",
-                options=list(set(t.assignee_id for t in st.session_state.tickets)),
+                options=sorted(self.store.facet_values("assignee_id"), key=str),
                 default=[],
             )
 
@@ -127,46 +169,67 @@ class KanbanBoard:
 
             selected_labels = st.multiselect(
                 "Labels",
-                options=list(
-                    set(label for t in st.session_state.tickets for label in t.labels)
-                ),
+                options=sorted(self.store.facet_values("labels")),
                 default=[],
             )
 
+            sort_by = st.selectbox("Sort by", options=list(SORT_KEYS))
+
         # Create columns for each status
         cols = st.columns(len(self.columns), gap="small")
 
-        # Display column headers with ticket counts
+        # Display column headers with ticket counts, less the hidden ones
+        deleted = st.session_state.kanban_deleted
+        status_counts = self.store.counts("status")
+        for ticket_id in deleted:
+            ticket = self.store.get(ticket_id)
+            if ticket is not None:
+                status_counts[ticket.status] = status_counts.get(ticket.status, 1) - 1
         for col, status in zip(cols, self.columns):
-            tickets_in_column = [
-                t for t in st.session_state.tickets if t.status == status
-            ]
-            col.markdown(f"### {status} ({len(tickets_in_column)})")
-
-        # Filter tickets based on sidebar selections
-        filtered_tickets: List[Ticket] = st.session_state.tickets
-        if selected_assignee:
-            filtered_tickets = [
-                t for t in filtered_tickets if t.assignee_id in selected_assignee
-            ]
-        if selected_type:
-            filtered_tickets = [t for t in filtered_tickets if t.type in selected_type]
-        if selected_priority:
-            filtered_tickets = [
-                t for t in filtered_tickets if t.priority in selected_priority
-            ]
-        if selected_labels:
-            filtered_tickets = [
-                t
-                for t in filtered_tickets
-                if any(label in t.labels for label in selected_labels)
-            ]
-
-        # Display tickets in their respective columns
+            col.markdown(f"### {status} ({status_counts.get(status, 0)})")
+
+        # Display tickets matching the sidebar selections in their columns,
+        # intersecting the index postings instead of filtering every ticket
+        column_budget = MAX_CARDS_PER_RERUN // len(self.columns)
         for col, status in zip(cols, self.columns):
             with col:
-                status_tickets = [t for t in filtered_tickets if t.status == status]
-                for ticket in status_tickets:
-                    self.create_ticket_card(
-                        ticket, status
-                    )  # Pass both ticket and current status
+                status_tickets: List[Ticket] = self.store.match(
+                    status=[status],
+                    assignee_id=selected_assignee,
+                    type=selected_type,
+                    priority=selected_priority,
+                    labels=selected_labels,
+                )
+                status_tickets = [t for t in status_tickets if t.id not in deleted]
+                # done tickets are always shown newest first, so older ones
+                # stay collapsed behind "load more"
+                sort_key = SORT_KEYS[
+                    "Recently updated" if status == Status.DONE.value else sort_by
+                ]
+                self.render_column(status, status_tickets, sort_key, column_budget)
+
+    def render_column(
+        self,
+        status: str,
+        tickets: List[Ticket],
+        sort_key: Callable[[Ticket], tuple],
+        budget: int,
+    ):
+        """Render the first cards of a column, only those get widgets."""
+        window = min(
+            st.session_state.kanban_windows.get(status, CARDS_PER_PAGE), budget
+        )
+        # partial sort, only the window has to be ordered
+        visible = heapq.nsmallest(window, tickets, key=sort_key)
+        for ticket in visible:
+            self.create_ticket_card(ticket, status)  # Pass both ticket and current status
+
+        hidden = len(tickets) - len(visible)
+        if not hidden:
+            return
+        if window < budget:
+            if st.button(f"Load more ({hidden} hidden)", key=f"load_more_{status}"):
+                st.session_state.kanban_windows[status] = window + CARDS_PER_PAGE
+                st.rerun()
+        else:
+            st.caption(f"{hidden} more tickets, narrow the filters to see them")
@@ -1,9 +1,18 @@
 import streamlit as st
 import pandas as pd
-from datetime import datetime, timezone
-from typing import List, Union, Dict
+from datetime import datetime
+from typing import List, Optional, Union, Dict
 from entities import Ticket, Type, Status, Priority
-from services.ticket import update_ticket
+from services.ticket import save_ticket
+
+# columns of the View tab that are edited in place, by ticket field
+EDITABLE_COLUMNS = {
+    "Title": "title",
+    "Type": "type",
+    "Status": "status",
+    "Priority": "priority",
+    "Assignee": "assignee_id",
+}
 
 
 def format_datetime(dt):
@@ -32,6 +41,39 @@ def get_value(obj: Union[Dict, Ticket], key: str, default=None):
     return getattr(obj, key, default)
 
 
+def normalize_assignee(entered, current: Optional[str]) -> Optional[str]:
+    """
+    The assignee entered in the table or the edit form. A blank field and
+    "Unassigned" both mean no assignee, the ticket's own value is kept when
+    it has none either, so leaving it unassigned is not sent as a change.
+    """
+    entered = entered.strip() if isinstance(entered, str) else ""
+    if entered and entered != "Unassigned":
+        return entered
+    return current if current in (None, "", "Unassigned") else None
+
+
+def table_edits(original: pd.DataFrame, edited: pd.DataFrame) -> Dict[str, Dict]:
+    """The cells changed in the View tab, as {ticket id: {field: value}}."""
+    columns = list(EDITABLE_COLUMNS)
+    edited = edited.assign(
+        Assignee=[
+            normalize_assignee(entered, current)
+            for entered, current in zip(edited["Assignee"], original["Assignee"])
+        ]
+    )
+    changed = (edited[columns] != original[columns]).any(axis=1)
+    edits = {}
+    for row in changed[changed].index:
+        edits[original.at[row, "ID"]] = {
+            # cleared cells come back as NaN, which is not valid JSON
+            field: None if pd.isna(edited.at[row, column]) else edited.at[row, column]
+            for column, field in EDITABLE_COLUMNS.items()
+            if edited.at[row, column] != original.at[row, column]
+        }
+    return edits
+
+
 def ticket_table(tickets: List[Union[Dict, Ticket]]):
     """
     Display and edit tickets in a table format
@@ -78,9 +120,13 @@ def ticket_table(tickets: List[Union[Dict, Ticket]]):
     tab1, tab2 = st.tabs(["View Tickets", "Edit Ticket"])
 
     with tab1:
-        st.dataframe(
+        edited_df = st.data_editor(
             df,
             hide_index=True,
+            disabled=[column for column in df.columns if column not in EDITABLE_COLUMNS],
+            # edits are kept by row position, a new set of rows starts afresh
+            # so they never move to other tickets when the filters change
+            key=f"ticket_table_{hash(tuple(df['ID']))}",
             column_config={
                 "ID": st.column_config.TextColumn("ID", width="small"),
                 "Title": st.column_config.TextColumn("Title", width="medium"),
@@ -101,6 +147,8 @@ def ticket_table(tickets: List[Union[Dict, Ticket]]):
                 ),
             },
         )
+        # saved in one batch by the page's Save Changes
+        st.session_state.edited_values = table_edits(df, edited_df)
 
     with tab2:
         # Ticket selection for editing
@@ -175,36 +223,39 @@ def ticket_table(tickets: List[Union[Dict, Ticket]]):
                     )
 
                     if st.form_submit_button("Update Ticket"):
-                        # Create updated ticket
-                        updated_data = {
-                            "id": get_value(ticket, "id"),
+                        edited_fields = {
                             "title": new_title,
                             "description": new_description,
                             "type": Type(new_type),
                             "status": Status(new_status),
                             "priority": Priority(new_priority),
-                            "assignee_id": (
-                                new_assignee if new_assignee != "Unassigned" else None
+                            "assignee_id": normalize_assignee(
+                                new_assignee, get_value(ticket, "assignee_id")
                             ),
-                            "reporter_id": get_value(ticket, "reporter_id"),
-                            "created_at": get_value(ticket, "created_at"),
-                            "updated_at": datetime.now(timezone.utc),
                             "labels": [
                                 label.strip()
                                 for label in new_labels.split(",")
                                 if label.strip()
                             ],
-                            "embedding": get_value(ticket, "embedding"),
-                            "parent_ticket_id": get_value(ticket, "parent_ticket_id"),
                         }
 
-                        if isinstance(ticket, dict):
-                            updated_ticket = updated_data
-                        else:
-                            updated_ticket = Ticket(**updated_data)
+                        # only the changed fields are sent, conditional on
+                        # the ticket not having been updated since it was shown
+                        base = (
+                            Ticket.model_validate(ticket)
+                            if isinstance(ticket, dict)
+                            else ticket
+                        )
+                        new_ticket = save_ticket(base, edited_fields)
+                        if new_ticket is None:
+                            st.error(
+                                f"Failed to update ticket {selected_ticket_id}, "
+                                "it may have been changed by someone else. "
+                                "Reload to see the latest version."
+                            )
+                            return
 
                         # Save to session state
-                        # TODO: replace with actual calls to backend
                         if "tickets" in st.session_state:
                             ticket_index = next(
                                 (
@@ -215,17 +266,7 @@ def ticket_table(tickets: List[Union[Dict, Ticket]]):
                                 None,
                             )
                             if ticket_index is not None:
-                                t = (
-                                    updated_ticket
-                                    if isinstance(updated_ticket, dict)
-                                    else updated_ticket.model_dump()
-                                )
-                                t["created_at"] = None
-                                t["updated_at"] = None
-                                new_ticket = update_ticket(t)
-
-                                if new_ticket:
-                                    st.session_state.tickets[ticket_index] = new_ticket
+                                st.session_state.tickets[ticket_index] = new_ticket
 
                         st.success(f"Ticket {selected_ticket_id} updated successfully!")
                         st.rerun()
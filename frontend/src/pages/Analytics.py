@@ -3,10 +3,10 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
+import os
 from datetime import datetime, timedelta, timezone
-from services import get_analytics_page_header, generate_lead_time, \
-generate_tix_status_breakdown, group_events_by_tix, generate_sprint_burndown, \
-generate_tix_status_per_unit_time
+from services import get_sprint_analytics, load_sprint_analytics, \
+multi_sprint_metrics, stored_multi_sprint_metrics, sprint_trends
 from utils import get_sample_analytics
 
 class ScrumDashboard:
@@ -147,6 +147,40 @@ class ScrumDashboard:
         
         st.plotly_chart(fig, use_container_width=True)
 
+    def sprint_trends(self, trends_df: pd.DataFrame):
+        """Show velocity and lead time across sprints."""
+        st.header("Sprint Trends")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = px.bar(
+                trends_df,
+                x='sprint',
+                y='velocity',
+                height=400
+            )
+            fig.update_layout(
+                xaxis_title="Sprint",
+                yaxis_title="Tickets completed"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            fig = px.line(
+                trends_df,
+                x='sprint',
+                y=['lead_time_mean', 'lead_time_median'],
+                markers=True,
+                height=400
+            )
+            fig.update_layout(
+                xaxis_title="Sprint",
+                yaxis_title="Lead Time (days)",
+                legend_title="Lead Time"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+
 def initialize_session_state():
     """Initialize session state variables"""
     if "is_admin" not in st.session_state:
@@ -154,63 +188,64 @@ def initialize_session_state():
     if "curr_user" not in st.session_state:
         st.session_state.curr_user = None
         
+def get_event_store():
+    """The event store named by ANALYTICS_EVENT_STORE, None when unset or empty."""
+    store_path = os.environ.get("ANALYTICS_EVENT_STORE")
+    if not store_path:
+        return None
+
+    from services.event_store import EventStore
+
+    store = EventStore(store_path)
+    return store if store.sprint_ids() else None
+
 def main():
-    tickets = get_sample_analytics()[0]
-    events_by_ticket = group_events_by_tix(tickets)
     dashboard = ScrumDashboard()
+    store = get_event_store()
+    sample_sprints = None if store else get_sample_analytics()
+    sprint_ids = store.sprint_ids() if store else [s["id"] for s in sample_sprints]
     
     # Sidebar for filters and controls
-    # with st.sidebar:
-    #     st.title("Sprint Controls")
-    #     selected_sprint = st.selectbox(
-    #         "Select Sprint",
-    #         ["Sprint 1", "Sprint 2", "Sprint 3"]
-    #     )
-        
-    #     st.divider()
-        
-    #     # Sprint dates
-    #     sprint_start = st.date_input("Sprint Start", datetime.now() - timedelta(days=7))
-    #     sprint_end = st.date_input("Sprint End", datetime.now() + timedelta(days=7))
+    with st.sidebar:
+        st.title("Sprint Controls")
+        selected_sprint = st.selectbox(
+            "Select Sprint",
+            sprint_ids,
+            index=len(sprint_ids) - 1
+        )
+    
+    # one read and sort of the event log feeds every chart below, metrics of
+    # the other sprints come from the per-sprint cache or a process pool
+    if store:
+        analytics = load_sprint_analytics(store, selected_sprint)
+        sprint_metrics = stored_multi_sprint_metrics(store, sprint_ids)
+    else:
+        analytics = get_sprint_analytics(sample_sprints[sprint_ids.index(selected_sprint)])
+        sprint_metrics = multi_sprint_metrics(sample_sprints)
+    trends_df = sprint_trends(sprint_metrics)
     
     # Sample data - replace with your actual data
+    days_remaining, in_progress_count = analytics.header()
     sprint_data = {
-        'days_remaining': get_analytics_page_header(tickets)[0],
-        'in_progress_count': get_analytics_page_header(tickets)[1]
+        'days_remaining': days_remaining,
+        'in_progress_count': in_progress_count
     }
     
-    # Create burndown data
-    start_time, end_time, burndown_data = generate_sprint_burndown(tickets)
-    start_time_convert = datetime.fromtimestamp(start_time / 1000, timezone.utc)
-    end_time_convert = datetime.fromtimestamp(end_time / 1000, timezone.utc)
-    # st.write(start_time_convert, end_time_convert)
-    # st.write(burndown_data)
-    date_range = pd.date_range(start_time_convert, end_time_convert)
-    # num_days = len(date_range)
-    
-    # Calculate ideal burndown (linear decrease)
-    # start_points = 100
-    # daily_decrease = start_points / (num_days - 1)
-    # ideal_points = [start_points - (daily_decrease * i) for i in range(num_days)]
-    
-    # Sample actual points (ensure same length as dates)
-    # actual_points = [
-    #     start_points * (1 - i/num_days) + np.random.randint(-5, 5) 
-    #     for i in range(num_days)
-    # ]
+    # Burndown and CFD share one replay of the event log
+    status_flow = analytics.status_flow(bucket="day")
+    date_range = pd.to_datetime(status_flow.time_points, unit="ms", utc=True)
     
     burndown_data = pd.DataFrame({
         'date': date_range,
         # 'ideal_points': ideal_points,
-        'actual_points': burndown_data
+        'actual_points': status_flow.remaining
     })
     
-    tickets_open, tickets_in_progress, tickets_done = generate_tix_status_per_unit_time(tickets)
     cfd_data = pd.DataFrame({
         'date': date_range,
-        'tickets_open': tickets_open,
-        'tickets_in_progress': tickets_in_progress,
-        'tickets_done': tickets_done
+        'tickets_open': status_flow.open,
+        'tickets_in_progress': status_flow.in_progress,
+        'tickets_done': status_flow.done
     })
     
     # Create velocity data
@@ -220,7 +255,7 @@ def main():
     #     'committed_points': [50, 55, 45]
     # })
     
-    ticket_status = generate_tix_status_breakdown(events_by_ticket)
+    ticket_status = analytics.status_breakdown
     # st.write(ticket_status)
     # Create ticket status data
     tickets_df = pd.DataFrame({
@@ -228,7 +263,7 @@ def main():
         'count': ticket_status.values()
     })
     
-    lead_time = generate_lead_time(events_by_ticket)
+    lead_time = analytics.lead_time()
     # st.write(lead_time)
     # Create team workload data
     lead_time_df = pd.DataFrame({
@@ -254,6 +289,9 @@ def main():
     with col2:
         dashboard.cumulative_flow_diagram(cfd_data)
         dashboard.display_lead_time(lead_time_df)
+    
+    if len(trends_df) > 1:
+        dashboard.sprint_trends(trends_df)
 
 initialize_session_state()
 
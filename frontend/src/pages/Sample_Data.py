@@ -1,9 +1,9 @@
 import streamlit as st
-from utils import SAMPLE_TICKETS, SAMPLE_USERS
-from services.ticket import list_tickets
+from utils import SAMPLE_USERS
+from services.ticket_store import get_ticket_store
 
 st.markdown("## Sample Users")
 st.json(SAMPLE_USERS)
 
 st.markdown("## Sample Tickets")
-st.json(list_tickets())
+st.json(get_ticket_store().list())
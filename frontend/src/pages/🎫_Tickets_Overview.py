@@ -1,7 +1,9 @@
 import streamlit as st
+from typing import Dict, Optional
 from components import ticket_table
-from utils import SAMPLE_TICKETS, SAMPLE_USERS
-from services.ticket import list_tickets
+from utils import SAMPLE_USERS
+from services.ticket import save_tickets
+from services.ticket_store import get_ticket_store
 
 st.set_page_config(
     page_title="Tickets Overview",
@@ -19,6 +21,21 @@ def initialize_session_state():
         st.session_state.curr_user = None
 
 
+def save_changes(edited_values: Dict[str, Dict]) -> Optional[Dict[str, Dict]]:
+    """
+    Saves every pending edit in one batch update. Returns the edits that
+    failed or were refused as invalid, or None if the request failed
+    altogether.
+    """
+    failed = save_tickets(edited_values)
+    if failed is None:
+        return None
+
+    for ticket_id, message in failed.items():
+        st.error(f"Failed to update ticket {ticket_id}: {message}")
+    return {ticket_id: edited_values[ticket_id] for ticket_id in failed}
+
+
 def main():
     # Page Header
     st.title("🎫 All Tickets")
@@ -36,7 +53,7 @@ def main():
         st.write("Admin Status:", "✅" if st.session_state.is_admin else "❌")
 
     # Load sample data
-    tickets = list_tickets()
+    tickets = get_ticket_store().list()
 
     if not tickets:
         st.warning("No tickets found in sample data.")
@@ -106,10 +123,15 @@ def main():
             st.write("")
             st.write("")
             if st.button("💾 Save Changes", type="primary"):
-                # In a real application, you would save to database here
-                st.success("Changes saved!")
-                st.session_state.edited_values = {}
-                st.rerun()
+                failed = save_changes(st.session_state.edited_values)
+                if failed is None:
+                    st.error("Failed to save changes, please try again.")
+                else:
+                    # failed edits stay pending so they can be retried
+                    st.session_state.edited_values = failed
+                    if not failed:
+                        st.success("Changes saved!")
+                        st.rerun()
 
 
 initialize_session_state()
@@ -4,12 +4,13 @@ import time
 from typing import List
 
 from components import KanbanBoard
-from utils import SAMPLE_TICKETS, SAMPLE_USERS
+from utils import SAMPLE_USERS
 from entities import User
 from components import create_ticket_form
 from services import text_to_ticket
 from entities import Ticket
-from services.ticket import list_tickets, generate_ticket, create_tickets, create_ticket
+from services.ticket import generate_ticket, create_tickets, create_ticket
+from services.ticket_store import get_ticket_store
 
 
 st.set_page_config(
@@ -101,7 +102,7 @@ def add_ticket():
 initialise_states()
 
 if st.session_state.curr_user:
-    board = KanbanBoard(list_tickets())
+    board = KanbanBoard(get_ticket_store().list())
     board.render()
     add_ticket()
 else:
@@ -1,17 +1,45 @@
-from .qdrant import fetch_recommended_sessions
-from .analytics import group_events_by_tix, get_analytics_page_header, generate_lead_time, \
-generate_tix_status_breakdown, generate_sprint_burndown, generate_tix_status_per_unit_time
-from .openai import user_to_vectordb_prompt, text_to_embedding, text_to_ticket
+"""
+Services re-exported for the pages. Each submodule is imported on first use
+of one of its names, so importing one service (e.g. the analytics engine in
+a worker process) does not load the Qdrant and OpenAI clients.
+"""
 
-__all__ = [
-    "fetch_recommended_sessions",
-    "user_to_vectordb_prompt",
-    "text_to_embedding",
-    "group_events_by_tix",
-    "get_analytics_page_header",
-    "generate_lead_time",
-    "generate_tix_status_breakdown",
-    "generate_sprint_burndown", 
-    "generate_tix_status_per_unit_time"
-    "text_to_ticket",
-]
+import importlib
+
+_EXPORTS = {
+    "fetch_recommended_sessions": ".qdrant",
+    "user_to_vectordb_prompt": ".openai",
+    "text_to_embedding": ".openai",
+    "text_to_ticket": ".openai",
+    "group_events_by_tix": ".analytics",
+    "get_analytics_page_header": ".analytics",
+    "generate_lead_time": ".analytics",
+    "generate_tix_status_breakdown": ".analytics",
+    "generate_sprint_burndown": ".analytics",
+    "generate_tix_status_per_unit_time": ".analytics",
+    "generate_status_flow": ".analytics",
+    "SprintAnalytics": ".analytics_pipeline",
+    "get_sprint_analytics": ".analytics_pipeline",
+    "load_sprint_analytics": ".analytics_pipeline",
+    "StreamingSprintAnalytics": ".analytics_stream",
+    "read_events": ".analytics_stream",
+    "stream_sprint_analytics": ".analytics_stream",
+    "multi_sprint_metrics": ".analytics_trends",
+    "stored_multi_sprint_metrics": ".analytics_trends",
+    "sprint_trends": ".analytics_trends",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *__all__])
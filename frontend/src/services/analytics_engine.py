@@ -0,0 +1,305 @@
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+# event kinds, parsed once per distinct description instead of once per event
+KIND_OTHER = 0
+KIND_CREATE = 1
+KIND_COMPLETE = 2
+KIND_STATUS_OPEN = 3
+KIND_STATUS_IN_PROGRESS = 4
+# "update status - <anything else>", counted as done in the status breakdown
+KIND_STATUS_OTHER = 5
+
+STATUS_PREFIX = "update status - "
+
+BREAKDOWN_LABELS = ("Open", "In Progress", "Done")
+# breakdown bucket of each status-setting kind, tickets without one are open
+BREAKDOWN_BUCKETS = {
+    KIND_STATUS_OPEN: 0,
+    KIND_STATUS_IN_PROGRESS: 1,
+    KIND_STATUS_OTHER: 2,
+    KIND_COMPLETE: 2,
+}
+
+# cumulative flow state each transition moves a ticket into, other kinds
+# (including other status updates) leave the ticket where it is
+FLOW_LABELS = ("open", "in_progress", "done")
+FLOW_STATES = {KIND_CREATE: 0, KIND_STATUS_IN_PROGRESS: 1, KIND_COMPLETE: 2}
+
+BUCKET_WIDTHS = {
+    "hour": 60 * 60 * 1000,
+    "day": 24 * 60 * 60 * 1000,
+    "week": 7 * 24 * 60 * 60 * 1000,
+}
+
+
+class StatusFlow(NamedTuple):
+    """Ticket counts per state at each time point of a sprint."""
+
+    time_points: List[int]
+    open: List[int]
+    in_progress: List[int]
+    done: List[int]
+    remaining: List[int]
+
+
+def bucket_width_ms(bucket: Union[str, int]) -> int:
+    width = BUCKET_WIDTHS[bucket] if isinstance(bucket, str) else int(bucket)
+    if width <= 0:
+        raise ValueError("bucket width must be positive")
+    return width
+
+
+def classify_description(description: str) -> int:
+    if description == "create ticket":
+        return KIND_CREATE
+    if description == "complete ticket":
+        return KIND_COMPLETE
+    if isinstance(description, str) and description.startswith(STATUS_PREFIX):
+        status = description.split(STATUS_PREFIX)[1]
+        if status == "open":
+            return KIND_STATUS_OPEN
+        if status == "in_progress":
+            return KIND_STATUS_IN_PROGRESS
+        return KIND_STATUS_OTHER
+    return KIND_OTHER
+
+
+class EventColumns:
+    """
+    A sprint event log as parallel NumPy arrays: ticket codes, millisecond
+    timestamps and event-kind codes. Ticket codes follow the order in which
+    tickets first appear in the log, like the dict built by
+    `group_events_by_tix`.
+
+    Every metric works on `order`, the events sorted by (ticket, timestamp)
+    with ties kept in log order, so per-ticket "first" and "last" become
+    boundary lookups instead of Python loops.
+    """
+
+    def __init__(
+        self,
+        ticket_ids: np.ndarray,
+        ticket_codes: np.ndarray,
+        timestamps: np.ndarray,
+        kinds: np.ndarray,
+        events: Optional[List[Dict]] = None,
+    ):
+        self.ticket_ids = ticket_ids
+        self.ticket_codes = ticket_codes
+        self.timestamps = timestamps
+        self.kinds = kinds
+        # the original event dicts, only needed to rebuild grouped events
+        self.events = events
+
+        self.order = np.lexsort((timestamps, ticket_codes))
+        sorted_codes = ticket_codes[self.order]
+        # index into `order` where each ticket's run of events starts
+        if len(sorted_codes):
+            boundaries = sorted_codes[1:] != sorted_codes[:-1]
+            self.starts = np.flatnonzero(np.r_[True, boundaries])
+        else:
+            self.starts = np.empty(0, dtype=np.intp)
+
+    @classmethod
+    def from_events(cls, events: Iterable[Dict]) -> "EventColumns":
+        events = list(events)
+        if not events:
+            empty = np.empty(0, dtype=np.int64)
+            return cls(
+                np.empty(0, dtype=object), empty, empty, empty.astype(np.int8), events
+            )
+
+        # one C-level pass per field, much cheaper than DataFrame.from_records
+        ticket_codes, ticket_ids = pd.factorize(
+            np.array(list(map(itemgetter("ticket_id"), events)), dtype=object),
+            sort=False,
+        )
+        description_codes, descriptions = pd.factorize(
+            np.array(list(map(itemgetter("description"), events)), dtype=object),
+            sort=False,
+        )
+        timestamps = np.fromiter(
+            map(itemgetter("timestamp"), events), dtype=np.int64, count=len(events)
+        )
+        kind_of_description = np.array(
+            [classify_description(d) for d in descriptions], dtype=np.int8
+        )
+
+        return cls(
+            ticket_ids=np.asarray(ticket_ids, dtype=object),
+            ticket_codes=ticket_codes.astype(np.int64),
+            timestamps=timestamps,
+            kinds=kind_of_description[description_codes],
+            events=events,
+        )
+
+    @classmethod
+    def from_events_by_ticket(
+        cls, events_by_ticket: Dict[str, List[Dict]]
+    ) -> "EventColumns":
+        return cls.from_events(
+            event for events in events_by_ticket.values() for event in events
+        )
+
+    @classmethod
+    def of(cls, events_by_ticket: Dict[str, List[Dict]]) -> "EventColumns":
+        """Reuses the columns a grouping was built from instead of re-reading it."""
+        columns = getattr(events_by_ticket, "columns", None)
+        if columns is not None:
+            return columns
+        return cls.from_events_by_ticket(events_by_ticket)
+
+    @property
+    def num_tickets(self) -> int:
+        return len(self.ticket_ids)
+
+    def group_events(self) -> "EventGroups":
+        if self.events is None:
+            raise ValueError("columns were loaded without their event dicts")
+        events = self.events
+        sorted_events = [events[i] for i in self.order.tolist()]
+        bounds = [*self.starts.tolist(), len(sorted_events)]
+        ticket_ids = self.ticket_ids[self.ticket_codes[self.order[self.starts]]]
+        return EventGroups(
+            self,
+            {
+                ticket_id: sorted_events[start:end]
+                for ticket_id, start, end in zip(
+                    ticket_ids.tolist(), bounds, bounds[1:]
+                )
+            },
+        )
+
+    def _last_per_ticket(self, kinds: Tuple[int, ...]) -> np.ndarray:
+        """
+        The kind of each ticket's latest event among `kinds`, -1 for tickets
+        without one.
+        """
+        sorted_kinds = self.kinds[self.order]
+        positions = np.flatnonzero(np.isin(sorted_kinds, kinds))
+        codes = self.ticket_codes[self.order[positions]]
+        # matching events are still grouped by ticket, keep the last of each run
+        is_last = np.r_[codes[1:] != codes[:-1], len(codes) > 0][: len(codes)]
+        latest = np.full(self.num_tickets, -1, dtype=np.int8)
+        latest[codes[is_last]] = sorted_kinds[positions[is_last]]
+        return latest
+
+    def count_in_progress(self) -> int:
+        latest = self._last_per_ticket((KIND_STATUS_IN_PROGRESS, KIND_COMPLETE))
+        return int(np.count_nonzero(latest == KIND_STATUS_IN_PROGRESS))
+
+    def status_breakdown(self) -> Dict[str, int]:
+        latest = self._last_per_ticket(tuple(BREAKDOWN_BUCKETS))
+        buckets = np.zeros(latest.shape, dtype=np.int64)
+        for kind, bucket in BREAKDOWN_BUCKETS.items():
+            buckets[latest == kind] = bucket
+        counts = np.bincount(buckets, minlength=len(BREAKDOWN_LABELS))
+        return {label: int(count) for label, count in zip(BREAKDOWN_LABELS, counts)}
+
+    def status_flow(
+        self, start_time: int, end_time: int, bucket: Union[str, int] = "day"
+    ) -> StatusFlow:
+        """
+        Counts tickets per state at `start_time`, then every `bucket` up to
+        `end_time`, including events up to and at each time point.
+
+        Each transition becomes -1 on the state the ticket leaves and +1 on the
+        one it enters, added to the first time point at or after it. A cumulative
+        sum over the time points then gives the counts, O(E + D) after the sort
+        the columns already hold.
+        """
+        width = bucket_width_ms(bucket)
+        num_points = max((end_time - start_time) // width + 1, 0)
+        time_points = start_time + width * np.arange(num_points, dtype=np.int64)
+
+        sorted_kinds = self.kinds[self.order]
+        positions = np.flatnonzero(np.isin(sorted_kinds, tuple(FLOW_STATES)))
+        events = self.order[positions]
+        states = np.zeros(len(positions), dtype=np.int64)
+        for kind, state in FLOW_STATES.items():
+            states[sorted_kinds[positions] == kind] = state
+
+        # transitions are still grouped by ticket in time order, so the state a
+        # transition leaves is the one entered by the previous transition
+        codes = self.ticket_codes[events]
+        has_previous = np.r_[False, codes[1:] == codes[:-1]][: len(codes)]
+        previous_states = np.r_[0, states[:-1]][: len(codes)]
+
+        buckets = -(-(self.timestamps[events] - start_time) // width)
+        buckets = np.maximum(buckets, 0)
+        in_range = buckets < num_points
+
+        deltas = np.zeros((len(FLOW_LABELS), num_points + 1), dtype=np.int64)
+        np.add.at(deltas, (states[in_range], buckets[in_range]), 1)
+        leaving = in_range & has_previous
+        np.add.at(deltas, (previous_states[leaving], buckets[leaving]), -1)
+        counts = np.cumsum(deltas[:, :num_points], axis=1)
+
+        return StatusFlow(
+            time_points=time_points.tolist(),
+            open=counts[0].tolist(),
+            in_progress=counts[1].tolist(),
+            done=counts[2].tolist(),
+            remaining=(counts[0] + counts[1]).tolist(),
+        )
+
+    def lead_times(
+        self, now_ms: Optional[int] = None, completed_only: bool = False
+    ) -> Dict[str, Optional[float]]:
+        """
+        Days from each ticket's first "create ticket" to its last "complete
+        ticket", or to now while it is still open. None without a create event.
+        With `completed_only`, only tickets both created and completed.
+        """
+        if now_ms is None:
+            now_ms = int(datetime.now().timestamp() * 1000)
+
+        created = np.full(self.num_tickets, np.iinfo(np.int64).max, dtype=np.int64)
+        is_create = self.kinds == KIND_CREATE
+        np.minimum.at(created, self.ticket_codes[is_create], self.timestamps[is_create])
+
+        completed = np.full(self.num_tickets, now_ms, dtype=np.int64)
+        has_completed = np.zeros(self.num_tickets, dtype=bool)
+        is_complete = self.kinds == KIND_COMPLETE
+        completed_codes = self.ticket_codes[is_complete]
+        has_completed[completed_codes] = True
+        completed[has_completed] = np.iinfo(np.int64).min
+        np.maximum.at(completed, completed_codes, self.timestamps[is_complete])
+
+        has_created = np.zeros(self.num_tickets, dtype=bool)
+        has_created[self.ticket_codes[is_create]] = True
+        created = np.where(has_created, created, completed)
+        days = (completed - created) / 1000 / 86400
+
+        keep = (
+            has_created & has_completed
+            if completed_only
+            else np.ones(self.num_tickets, dtype=bool)
+        )
+        return {
+            ticket_id: round(day, 2) if ok else None
+            for ticket_id, day, ok, kept in zip(
+                self.ticket_ids.tolist(),
+                days.tolist(),
+                has_created.tolist(),
+                keep.tolist(),
+            )
+            if kept
+        }
+
+
+class EventGroups(dict):
+    """
+    The `{ticket_id: events}` dict returned by `group_events_by_tix`, carrying
+    the columns it was built from so the metrics that take it do not have to
+    convert it back. Treat it as read-only, edits are not seen by `columns`.
+    """
+
+    def __init__(self, columns: EventColumns, groups: Dict[str, List[Dict]]):
+        super().__init__(groups)
+        self.columns = columns
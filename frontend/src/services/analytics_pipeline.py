@@ -0,0 +1,146 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .analytics_engine import EventColumns, StatusFlow
+
+if TYPE_CHECKING:
+    # pyarrow is only needed by callers that use the event store
+    from .event_store import EventStore
+
+# sprints kept in memory, the Analytics page only ever shows a handful
+MAX_CACHED_SPRINTS = 32
+
+
+def event_log_version(sprint: Dict) -> Hashable:
+    """
+    The sprint's `version` when the exporter sets one, otherwise the number
+    of events and the last one. Event logs are append-only, so a new event
+    changes the version; it is read on every rerun and never walks the log.
+    """
+    if sprint.get("version") is not None:
+        return sprint["version"]
+
+    events = sprint["events"]
+    last = events[-1] if events else {}
+    return (
+        sprint["start_time"],
+        sprint["end_time"],
+        len(events),
+        last.get("ticket_id"),
+        last.get("timestamp"),
+        last.get("description"),
+    )
+
+
+class SprintAnalytics:
+    """
+    Every metric on the Analytics page for one sprint, computed from a single
+    read and sort of its event log. Results are built on first access and
+    shared, e.g. the burndown and the CFD come from the same status flow.
+
+    Values that depend on the current time (days remaining, lead time of open
+    tickets) are recomputed on every access, the work behind them is not.
+    """
+
+    def __init__(self, sprint: Dict, columns: Optional[EventColumns] = None):
+        self.sprint_id = sprint.get("id")
+        self.start_time = sprint["start_time"]
+        self.end_time = sprint["end_time"]
+        # columns loaded elsewhere (e.g. from the event store) skip the events
+        self._events = sprint.get("events") if columns is None else None
+        self._columns = columns
+        self._flows: Dict[Union[str, int], StatusFlow] = {}
+        # sessions rendering the same sprint share one build of each result
+        self._lock = threading.RLock()
+
+    @property
+    def columns(self) -> EventColumns:
+        with self._lock:
+            if self._columns is None:
+                self._columns = EventColumns.from_events(self._events)
+                # the columns hold everything the metrics need
+                self._events = None
+            return self._columns
+
+    @cached_property
+    def in_progress_count(self) -> int:
+        return self.columns.count_in_progress()
+
+    @cached_property
+    def status_breakdown(self) -> Dict[str, int]:
+        return self.columns.status_breakdown()
+
+    def days_remaining(self) -> int:
+        now_ms = int(datetime.now().timestamp() * 1000)
+        return int(((self.end_time - now_ms) / 1000) / 86400)
+
+    def header(self) -> Tuple[int, int]:
+        return self.days_remaining(), self.in_progress_count
+
+    def status_flow(self, bucket: Union[str, int] = "day") -> StatusFlow:
+        with self._lock:
+            if bucket not in self._flows:
+                self._flows[bucket] = self.columns.status_flow(
+                    self.start_time, self.end_time, bucket
+                )
+            return self._flows[bucket]
+
+    def burndown(self, bucket: Union[str, int] = "day") -> Tuple[int, int, List[int]]:
+        return self.start_time, self.end_time, self.status_flow(bucket).remaining
+
+    def lead_time(self) -> Dict[str, Optional[float]]:
+        return self.columns.lead_times()
+
+
+_cache: "OrderedDict[Tuple[Hashable, Hashable], SprintAnalytics]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _memoized(
+    key: Tuple[Hashable, Hashable], build: Callable[[], SprintAnalytics]
+) -> SprintAnalytics:
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+        analytics = build()
+        _cache[key] = analytics
+        while len(_cache) > MAX_CACHED_SPRINTS:
+            _cache.popitem(last=False)
+        return analytics
+
+
+def get_sprint_analytics(sprint: Dict) -> SprintAnalytics:
+    """
+    The shared `SprintAnalytics` of a sprint, memoized per (sprint id,
+    event-log version) across reruns and sessions.
+    """
+    key = (sprint.get("id"), event_log_version(sprint))
+    return _memoized(key, lambda: SprintAnalytics(sprint))
+
+
+def load_sprint_analytics(store: "EventStore", sprint_id: str) -> SprintAnalytics:
+    """
+    Like `get_sprint_analytics` for a sprint kept in an `EventStore`, loaded
+    from its memory-mapped columns. The file's mtime and size are the version.
+    """
+    key = (sprint_id, store.version(sprint_id))
+    return _memoized(
+        key,
+        lambda: SprintAnalytics(
+            store.sprint_info(sprint_id), columns=store.load_columns(sprint_id)
+        ),
+    )
@@ -0,0 +1,220 @@
+import heapq
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .analytics_engine import (
+    BREAKDOWN_BUCKETS,
+    BREAKDOWN_LABELS,
+    FLOW_STATES,
+    KIND_COMPLETE,
+    KIND_CREATE,
+    KIND_STATUS_IN_PROGRESS,
+    StatusFlow,
+    bucket_width_ms,
+    classify_description,
+)
+
+# how far behind the newest event an event may arrive and still be applied
+DEFAULT_LATENESS_MS = 60 * 60 * 1000
+
+
+def read_events(source: Union[str, Path, Iterable]) -> Iterator[Dict]:
+    """
+    Yields events one at a time from a JSONL file, where each line is an
+    event or an array of events (a chunk), or from any iterable of events or
+    such lines. Only the current line is held in memory.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "r") as file:
+            yield from read_events(file)
+        return
+
+    for item in source:
+        if isinstance(item, (str, bytes)):
+            if not item.strip():
+                continue
+            item = json.loads(item)
+        if isinstance(item, list):
+            yield from item
+        else:
+            yield item
+
+
+class _TicketState:
+    __slots__ = (
+        "created",
+        "completed",
+        "flow_state",
+        "breakdown_kind",
+        "progress_kind",
+    )
+
+    def __init__(self):
+        self.created: Optional[int] = None
+        self.completed: Optional[int] = None
+        self.flow_state: Optional[int] = None
+        self.breakdown_kind: Optional[int] = None
+        self.progress_kind: Optional[int] = None
+
+
+class StreamingSprintAnalytics:
+    """
+    Lead time, status breakdown, in-progress count and the status flow of a
+    sprint, updated one event at a time. Memory is bounded by the number of
+    tickets and time points, not events: only per-ticket state, the flow
+    deltas and the events inside the lateness window are kept.
+
+    Events may arrive out of order by up to `lateness_ms`; they are buffered
+    and applied in timestamp order once no earlier event can still arrive.
+    Events later than that are counted in `late_events` and skipped. With
+    nothing skipped the results match `EventColumns` on the full log.
+    """
+
+    def __init__(
+        self,
+        start_time: int,
+        end_time: int,
+        bucket: Union[str, int] = "day",
+        lateness_ms: int = DEFAULT_LATENESS_MS,
+    ):
+        self.start_time = start_time
+        self.end_time = end_time
+        self.width = bucket_width_ms(bucket)
+        self.lateness_ms = lateness_ms
+        self.num_points = max((end_time - start_time) // self.width + 1, 0)
+
+        self.late_events = 0
+        self._tickets: Dict[str, _TicketState] = {}
+        self._deltas = np.zeros(
+            (len(FLOW_STATES), self.num_points + 1), dtype=np.int64
+        )
+        self._kinds: Dict[str, int] = {}
+        self._pending: List[Tuple[int, int, str, int]] = []
+        self._sequence = 0
+        self._newest: Optional[int] = None
+        self._applied_up_to: Optional[int] = None
+
+    def feed(self, event: Dict):
+        timestamp = event["timestamp"]
+        if self._applied_up_to is not None and timestamp < self._applied_up_to:
+            self.late_events += 1
+            return
+
+        ticket_id = event["ticket_id"]
+        # registered on arrival so tickets keep the order of the log
+        if ticket_id not in self._tickets:
+            self._tickets[ticket_id] = _TicketState()
+
+        description = event["description"]
+        kind = self._kinds.get(description)
+        if kind is None:
+            kind = self._kinds[description] = classify_description(description)
+
+        # the sequence number keeps arrival order among equal timestamps
+        heapq.heappush(
+            self._pending, (timestamp, self._sequence, ticket_id, kind)
+        )
+        self._sequence += 1
+
+        if self._newest is None or timestamp > self._newest:
+            self._newest = timestamp
+        self._drain(self._newest - self.lateness_ms)
+
+    def feed_many(self, events: Iterable[Dict]) -> "StreamingSprintAnalytics":
+        for event in events:
+            self.feed(event)
+        return self
+
+    def close(self) -> "StreamingSprintAnalytics":
+        """Applies the events still waiting in the lateness window."""
+        self._drain()
+        return self
+
+    def _drain(self, watermark: Optional[int] = None):
+        pending = self._pending
+        while pending and (watermark is None or pending[0][0] <= watermark):
+            timestamp, _, ticket_id, kind = heapq.heappop(pending)
+            self._apply(ticket_id, timestamp, kind)
+            self._applied_up_to = timestamp
+
+    def _apply(self, ticket_id: str, timestamp: int, kind: int):
+        state = self._tickets[ticket_id]
+        if kind == KIND_CREATE and (
+            state.created is None or timestamp < state.created
+        ):
+            state.created = timestamp
+        if kind == KIND_COMPLETE and (
+            state.completed is None or timestamp > state.completed
+        ):
+            state.completed = timestamp
+        if kind in BREAKDOWN_BUCKETS:
+            state.breakdown_kind = kind
+        if kind in (KIND_STATUS_IN_PROGRESS, KIND_COMPLETE):
+            state.progress_kind = kind
+
+        flow_state = FLOW_STATES.get(kind)
+        if flow_state is None:
+            return
+        bucket = max(-(-(timestamp - self.start_time) // self.width), 0)
+        if bucket < self.num_points:
+            self._deltas[flow_state, bucket] += 1
+            if state.flow_state is not None:
+                self._deltas[state.flow_state, bucket] -= 1
+        state.flow_state = flow_state
+
+    def status_flow(self) -> StatusFlow:
+        counts = np.cumsum(self._deltas[:, : self.num_points], axis=1)
+        time_points = self.start_time + self.width * np.arange(self.num_points)
+        return StatusFlow(
+            time_points=time_points.tolist(),
+            open=counts[0].tolist(),
+            in_progress=counts[1].tolist(),
+            done=counts[2].tolist(),
+            remaining=(counts[0] + counts[1]).tolist(),
+        )
+
+    def status_breakdown(self) -> Dict[str, int]:
+        counts = [0] * len(BREAKDOWN_LABELS)
+        for state in self._tickets.values():
+            counts[BREAKDOWN_BUCKETS.get(state.breakdown_kind, 0)] += 1
+        return dict(zip(BREAKDOWN_LABELS, counts))
+
+    def in_progress_count(self) -> int:
+        return sum(
+            1
+            for state in self._tickets.values()
+            if state.progress_kind == KIND_STATUS_IN_PROGRESS
+        )
+
+    def lead_times(self, now_ms: Optional[int] = None) -> Dict[str, Optional[float]]:
+        if now_ms is None:
+            now_ms = int(datetime.now().timestamp() * 1000)
+        lead_times = {}
+        for ticket_id, state in self._tickets.items():
+            if state.created is None:
+                lead_times[ticket_id] = None
+                continue
+            completed = state.completed if state.completed is not None else now_ms
+            lead_times[ticket_id] = round((completed - state.created) / 1000 / 86400, 2)
+        return lead_times
+
+
+def stream_sprint_analytics(
+    sprint: Dict,
+    events: Union[str, Path, Iterable],
+    bucket: Union[str, int] = "day",
+    lateness_ms: int = DEFAULT_LATENESS_MS,
+) -> StreamingSprintAnalytics:
+    """
+    Runs a sprint's events through `StreamingSprintAnalytics`. `sprint` only
+    needs `start_time` and `end_time`, `events` is a JSONL path or an
+    iterable accepted by `read_events`.
+    """
+    analytics = StreamingSprintAnalytics(
+        sprint["start_time"], sprint["end_time"], bucket, lateness_ms
+    )
+    return analytics.feed_many(read_events(events)).close()
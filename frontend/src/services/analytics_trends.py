@@ -0,0 +1,183 @@
+import multiprocessing
+import os
+import statistics
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import pandas as pd
+
+from .analytics_pipeline import SprintAnalytics, event_log_version
+
+if TYPE_CHECKING:
+    from .event_store import EventStore
+
+# per-sprint metrics kept in memory, small dicts so this can be generous
+MAX_CACHED_METRICS = 1024
+# spawned workers take seconds to start (each imports numpy and pandas) while
+# the engine computes about a million events a second in process, so the pool
+# only pays off for this many events to compute
+MIN_PARALLEL_EVENTS = 2_000_000
+
+
+def summarize_sprint(analytics: SprintAnalytics) -> Dict:
+    """
+    The per-sprint numbers behind the trend charts. Lead times only cover
+    tickets completed in the log, so they do not change with the clock and
+    can be cached for as long as the log does not change.
+    """
+    flow = analytics.status_flow()
+    lead_times = list(analytics.columns.lead_times(completed_only=True).values())
+    return {
+        "id": analytics.sprint_id,
+        "start_time": analytics.start_time,
+        "end_time": analytics.end_time,
+        "velocity": flow.done[-1] - flow.done[0] if flow.done else 0,
+        "completed": flow.done[-1] if flow.done else 0,
+        "remaining": flow.remaining[-1] if flow.remaining else 0,
+        "status_breakdown": analytics.status_breakdown,
+        "lead_time_mean": (
+            round(statistics.fmean(lead_times), 2) if lead_times else None
+        ),
+        "lead_time_median": (
+            round(statistics.median(lead_times), 2) if lead_times else None
+        ),
+    }
+
+
+def _sprint_metrics(sprint: Dict) -> Dict:
+    return summarize_sprint(SprintAnalytics(sprint))
+
+
+def _stored_sprint_metrics(job: Tuple[str, str]) -> Dict:
+    # workers map the file themselves, only its path is sent to them
+    from .event_store import EventStore
+
+    root, sprint_id = job
+    store = EventStore(root)
+    analytics = SprintAnalytics(
+        store.sprint_info(sprint_id), columns=store.load_columns(sprint_id)
+    )
+    return summarize_sprint(analytics)
+
+
+_cache: "OrderedDict[Hashable, Dict]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _run_jobs(
+    jobs: Sequence, sizes: Sequence[int], compute: Callable, max_workers: Optional[int]
+) -> List:
+    """
+    `compute` over the jobs, `sizes` being their number of events. In a
+    process pool only with more than one worker and enough events to make up
+    for starting it.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    if workers <= 1 or sum(sizes) < MIN_PARALLEL_EVENTS:
+        return [compute(job) for job in jobs]
+
+    # spawn, forking the multi-threaded Streamlit server is not safe
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        return list(pool.map(compute, jobs))
+
+
+def _compute(
+    keys: Sequence[Hashable],
+    jobs: Sequence,
+    size: Callable[..., int],
+    compute: Callable,
+    max_workers: Optional[int],
+) -> List[Dict]:
+    """
+    Metrics for each job, from the cache when its key was seen before, the
+    misses computed by `_run_jobs`, one sprint per task. `size` gives a job's
+    number of events. A rerun where every sprint is cached never starts the
+    pool.
+    """
+    with _cache_lock:
+        cached = {key: _cache[key] for key in keys if key in _cache}
+    missing = [(key, job) for key, job in zip(keys, jobs) if key not in cached]
+    if not missing:
+        return [cached[key] for key in keys]
+
+    missing_jobs = [job for _, job in missing]
+    results = _run_jobs(
+        missing_jobs, [size(job) for job in missing_jobs], compute, max_workers
+    )
+
+    with _cache_lock:
+        for (key, _), metrics in zip(missing, results):
+            cached[key] = _cache[key] = metrics
+            _cache.move_to_end(key)
+        while len(_cache) > MAX_CACHED_METRICS:
+            _cache.popitem(last=False)
+
+    return [cached[key] for key in keys]
+
+
+def multi_sprint_metrics(
+    sprints: Sequence[Dict], max_workers: Optional[int] = None
+) -> List[Dict]:
+    """Per-sprint metrics of in-memory sprints, cached by event-log version."""
+    keys = [
+        ("sprint", sprint.get("id"), event_log_version(sprint)) for sprint in sprints
+    ]
+    return _compute(
+        keys,
+        sprints,
+        lambda sprint: len(sprint["events"]),
+        _sprint_metrics,
+        max_workers,
+    )
+
+
+def stored_multi_sprint_metrics(
+    store: "EventStore",
+    sprint_ids: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+) -> List[Dict]:
+    """Per-sprint metrics of sprints in an `EventStore`, cached by file version."""
+    sprint_ids = store.sprint_ids() if sprint_ids is None else sprint_ids
+    keys = [
+        ("store", str(store.root), sprint_id, store.version(sprint_id))
+        for sprint_id in sprint_ids
+    ]
+    jobs = [(str(store.root), sprint_id) for sprint_id in sprint_ids]
+    return _compute(
+        keys,
+        jobs,
+        lambda job: store.num_events(job[1]),
+        _stored_sprint_metrics,
+        max_workers,
+    )
+
+
+def sprint_trends(metrics: Sequence[Dict]) -> pd.DataFrame:
+    """Velocity and lead-time series across sprints, ordered by sprint start."""
+    trends = pd.DataFrame(
+        [
+            {
+                "sprint": m["id"],
+                "start": pd.to_datetime(m["start_time"], unit="ms", utc=True),
+                "velocity": m["velocity"],
+                "lead_time_mean": m["lead_time_mean"],
+                "lead_time_median": m["lead_time_median"],
+            }
+            for m in metrics
+        ],
+        columns=["sprint", "start", "velocity", "lead_time_mean", "lead_time_median"],
+    )
+    return trends.sort_values("start", kind="stable").reset_index(drop=True)
@@ -0,0 +1,194 @@
+import os
+from pathlib import Path
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple, Union
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pyarrow as pa
+
+from .analytics_engine import EventColumns, classify_description
+
+EVENT_SCHEMA = pa.schema(
+    [
+        ("ticket_id", pa.dictionary(pa.int32(), pa.string())),
+        ("timestamp", pa.int64()),
+        ("event_type", pa.dictionary(pa.int16(), pa.string())),
+        # classify_description of event_type, stored so reads parse no strings
+        ("kind", pa.int8()),
+        ("status", pa.dictionary(pa.int8(), pa.string())),
+        ("priority", pa.dictionary(pa.int8(), pa.string())),
+    ]
+)
+# rows per record batch, a time-range read only pages in the batches it needs
+BATCH_ROWS = 64 * 1024
+FILE_SUFFIX = ".arrow"
+
+
+class EventStore:
+    """
+    Sprint event logs as Arrow IPC files, one per sprint, sorted by timestamp.
+    Ticket ids, event types, statuses and priorities are dictionary-encoded
+    and each event's kind is stored as a code, so loading a sprint is a
+    memory map plus a binary search on the timestamp column: no JSON parsing
+    and no per-event string handling.
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def path(self, sprint_id: str) -> Path:
+        return self.root / f"{quote(str(sprint_id), safe='')}{FILE_SUFFIX}"
+
+    def sprint_ids(self) -> List[str]:
+        return sorted(
+            unquote(path.name[: -len(FILE_SUFFIX)])
+            for path in self.root.glob(f"*{FILE_SUFFIX}")
+        )
+
+    def version(self, sprint_id: str) -> Hashable:
+        stat = self.path(sprint_id).stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def write_sprint(self, sprint: Dict, events: Optional[Iterable[Dict]] = None):
+        """
+        Stores `sprint` (id, start_time, end_time) with its events, taken from
+        `events` when given, e.g. `read_events(path)`, else `sprint["events"]`.
+        """
+        ticket_ids, timestamps, event_types, statuses, priorities = [], [], [], [], []
+        for event in sprint["events"] if events is None else events:
+            ticket_ids.append(event["ticket_id"])
+            timestamps.append(event["timestamp"])
+            event_types.append(event["description"])
+            statuses.append(event.get("status"))
+            priorities.append(event.get("priority"))
+
+        # dictionaries keep first-appearance order, which EventColumns relies on
+        event_type = pa.array(event_types, type=EVENT_SCHEMA.field("event_type").type)
+        kind_of_type = np.array(
+            [classify_description(d) for d in event_type.dictionary.to_pylist()],
+            dtype=np.int8,
+        )
+        kinds = kind_of_type[event_type.indices.to_numpy(zero_copy_only=False)]
+
+        table = pa.Table.from_arrays(
+            [
+                pa.array(ticket_ids, type=EVENT_SCHEMA.field("ticket_id").type),
+                pa.array(timestamps, type=pa.int64()),
+                event_type,
+                pa.array(kinds, type=pa.int8()),
+                pa.array(statuses, type=EVENT_SCHEMA.field("status").type),
+                pa.array(priorities, type=EVENT_SCHEMA.field("priority").type),
+            ],
+            schema=EVENT_SCHEMA,
+        )
+        order = np.argsort(table.column("timestamp").to_numpy(), kind="stable")
+        table = table.take(order).replace_schema_metadata(
+            {
+                "sprint_id": str(sprint["id"]),
+                "start_time": str(sprint["start_time"]),
+                "end_time": str(sprint["end_time"]),
+            }
+        )
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(sprint["id"])
+        tmp_path = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table, max_chunksize=BATCH_ROWS)
+        # readers keep their memory map of the old file until they drop it
+        os.replace(tmp_path, path)
+
+    def _open(self, sprint_id: str) -> pa.Table:
+        # zero-copy, batches are paged in from the file as they are touched
+        source = pa.memory_map(str(self.path(sprint_id)), "r")
+        return pa.ipc.open_file(source).read_all()
+
+    def sprint_info(self, sprint_id: str) -> Dict:
+        with pa.memory_map(str(self.path(sprint_id)), "r") as source:
+            metadata = pa.ipc.open_file(source).schema.metadata or {}
+        return {
+            "id": metadata[b"sprint_id"].decode(),
+            "start_time": int(metadata[b"start_time"]),
+            "end_time": int(metadata[b"end_time"]),
+        }
+
+    def num_events(self, sprint_id: str) -> int:
+        """Read from the batch headers, no column is paged in."""
+        with pa.memory_map(str(self.path(sprint_id)), "r") as source:
+            reader = pa.ipc.open_file(source)
+            return sum(
+                reader.get_batch(i).num_rows for i in range(reader.num_record_batches)
+            )
+
+    def read_table(
+        self,
+        sprint_id: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> pa.Table:
+        """The sprint's events with `start_time <= timestamp <= end_time`."""
+        table = self._open(sprint_id)
+        start, stop = _time_range(table.column("timestamp"), start_time, end_time)
+        return table.slice(start, stop - start)
+
+    def load_columns(
+        self,
+        sprint_id: str,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+    ) -> EventColumns:
+        """
+        The sprint's events as `EventColumns`. A single record batch is handed
+        over as NumPy views of the memory map; across batches only the integer
+        columns (ticket codes, timestamps, kinds) are concatenated, the ticket
+        id strings are never copied.
+        """
+        table = self.read_table(sprint_id, start_time, end_time)
+        if not table.num_rows:
+            return EventColumns.from_events([])
+
+        ticket_id = table.column("ticket_id")
+        # an IPC file has one dictionary per column, shared by every batch
+        dictionary = ticket_id.chunk(0).dictionary
+        codes = _numpy([chunk.indices for chunk in ticket_id.chunks]).astype(np.int64)
+
+        # a time range may not include every ticket of the dictionary, keep
+        # the ones present, in dictionary (first appearance) order
+        present = np.bincount(codes, minlength=len(dictionary)) > 0
+        remap = np.cumsum(present) - 1
+        ticket_ids = dictionary.to_numpy(zero_copy_only=False)[present]
+
+        return EventColumns(
+            ticket_ids=ticket_ids.astype(object),
+            ticket_codes=remap[codes],
+            timestamps=_numpy(table.column("timestamp").chunks),
+            kinds=_numpy(table.column("kind").chunks),
+        )
+
+
+def _numpy(chunks: List[pa.Array]) -> np.ndarray:
+    """One array of the chunks' values, a view when there is a single chunk."""
+    arrays = [chunk.to_numpy() for chunk in chunks if len(chunk)]
+    if len(arrays) == 1:
+        return arrays[0]
+    return np.concatenate(arrays)
+
+
+def _time_range(
+    timestamps: pa.ChunkedArray, start_time: Optional[int], end_time: Optional[int]
+) -> Tuple[int, int]:
+    """Row range of a sorted timestamp column inside [start_time, end_time]."""
+    start, stop, offset = 0, len(timestamps), 0
+    for chunk in timestamps.chunks:
+        values = chunk.to_numpy()
+        if not len(values):
+            continue
+        if start_time is not None and values[-1] < start_time:
+            start = offset + len(values)
+        elif start_time is not None and values[0] < start_time:
+            start = offset + int(np.searchsorted(values, start_time, "left"))
+        if end_time is not None and values[-1] > end_time and stop == len(timestamps):
+            stop = offset + int(np.searchsorted(values, end_time, "right"))
+        offset += len(values)
+    return start, max(start, stop)
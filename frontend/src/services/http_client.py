@@ -0,0 +1,100 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# (connect, read) seconds, generation calls an LLM so it needs a longer read
+DEFAULT_TIMEOUT = (3.05, 30)
+POOL_SIZE = 20
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _build_session(idempotent: bool) -> requests.Session:
+    """
+    Idempotent calls are retried on connection and read errors, 429 and 5xx.
+    Others (create, gen) only when the backend cannot have processed them:
+    connection errors and 429. A read error or a 5xx may follow a request
+    that was processed, so retrying it could create duplicate tickets.
+    """
+    if idempotent:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    else:
+        retry = Retry(
+            total=3,
+            read=0,
+            other=0,
+            backoff_factor=0.3,
+            status_forcelist=(429,),
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry
+    )
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session(idempotent: bool = True) -> requests.Session:
+    """Process-wide sessions, shared by every Streamlit session and rerun so TLS connections are reused."""
+    with _sessions_lock:
+        if idempotent not in _sessions:
+            _sessions[idempotent] = _build_session(idempotent)
+        return _sessions[idempotent]
+
+
+def request(
+    method: str, url: str, idempotent: bool = True, **kwargs
+) -> requests.Response:
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    return get_session(idempotent).request(method, url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return request("GET", url, **kwargs)
+
+
+def post(url: str, idempotent: bool = True, **kwargs) -> requests.Response:
+    return request("POST", url, idempotent=idempotent, **kwargs)
+
+
+def parallel(*calls: Callable[[], Any]) -> List[Any]:
+    """
+    Runs independent service calls concurrently over the shared pool and
+    returns their results in order, e.g.
+    `parallel(lambda: list_tickets(), lambda: find_similar_tickets(t))`.
+    """
+    global _executor
+    with _sessions_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=POOL_SIZE, thread_name_prefix="ticket-http"
+            )
+
+    futures = [_executor.submit(call) for call in calls]
+    return [future.result() for future in futures]
+
+
+async def arequest(
+    method: str, url: str, idempotent: bool = True, **kwargs
+) -> requests.Response:
+    """Async variant of `request`, for use with `asyncio.gather`."""
+    return await asyncio.to_thread(request, method, url, idempotent, **kwargs)
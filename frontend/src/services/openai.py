@@ -5,12 +5,15 @@ from uuid import uuid4
 
 SYSTEM = ""
 
-OPENAI_API_KEY = st.secrets["OPENAI"]["OPENAI_API_KEY"]
-openai_client = OpenAI(api_key=OPENAI_API_KEY)
+
+@st.cache_resource
+def get_openai_client() -> OpenAI:
+    # built on first use so importing the services package stays offline
+    return OpenAI(api_key=st.secrets["OPENAI"]["OPENAI_API_KEY"])
 
 
 def user_to_vectordb_prompt(user_prompt) -> str:
-    completion = openai_client.chat.completions.create(
+    completion = get_openai_client().chat.completions.create(
         model="gpt-4o",
         messages=[
             {"role": "system", "content": SYSTEM},
@@ -21,7 +24,7 @@ def user_to_vectordb_prompt(user_prompt) -> str:
 
 
 def text_to_embedding(text):
-    embeddings = openai_client.embeddings.create(
+    embeddings = get_openai_client().embeddings.create(
         model="text-embedding-3-small", input=text, encoding_format="float"
     )
     return embeddings.data[0].embedding
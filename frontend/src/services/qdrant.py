@@ -3,21 +3,20 @@ from qdrant_client import QdrantClient, models
 from .openai import text_to_embedding
 from utils import read_json
 
-QDRANT_URL = st.secrets["QDRANT"]["QDRANT_URL"]
-QDRANT_API_KEY = st.secrets["QDRANT"]["QDRANT_API_KEY"]
-QDRANT_COLLECTION_NAME = st.secrets["QDRANT"]["COLLECTION_NAME"]
 
-qdrant_client = QdrantClient(
-    url=QDRANT_URL,
-    api_key=QDRANT_API_KEY,
-)
+@st.cache_resource
+def get_qdrant_client() -> QdrantClient:
+    # built on first use so importing the services package stays offline
+    return QdrantClient(
+        url=st.secrets["QDRANT"]["QDRANT_URL"],
+        api_key=st.secrets["QDRANT"]["QDRANT_API_KEY"],
+    )
 
 
-def fetch_recommended_sessions(
-    artist_profile, collection_name=QDRANT_COLLECTION_NAME, limit=5
-):
+def fetch_recommended_sessions(artist_profile, collection_name=None, limit=5):
+    collection_name = collection_name or st.secrets["QDRANT"]["COLLECTION_NAME"]
     artist_embedding = text_to_embedding(artist_profile)
-    similar_sessions = qdrant_client.search(
+    similar_sessions = get_qdrant_client().search(
         collection_name=collection_name, query_vector=artist_embedding, limit=limit
     )
     return [session.payload["session_name"] for session in similar_sessions]
@@ -1,9 +1,10 @@
-from typing import List
+from typing import Dict, List, Optional, Union
 from pydantic import BaseModel, RootModel, ValidationError
-import requests
 
 from entities.http import HttpResponse
 from entities.ticket import Ticket
+from . import http_client
+from .ticket_store import get_ticket_store
 
 backend_base_url = "https://s618z67nt2.execute-api.ap-southeast-1.amazonaws.com"
 
@@ -12,28 +13,110 @@ class ListTicketData(RootModel[list[Ticket]]):
     pass
 
 
-def list_tickets():
+class ListTicketResponse(HttpResponse[ListTicketData]):
+    next_page_offset: Optional[Union[str, int]] = None
+
+
+def list_tickets_page(
+    limit: Optional[int] = None,
+    offset: Optional[Union[str, int]] = None,
+    **filters: List[str],
+):
+    """
+    Fetches one page of tickets. Filters are payload fields (status, priority,
+    assignee_id, labels, type) mapped to the values to match.
+
+    Returns `(tickets, next_page_offset)`, or None if the request failed.
+    """
     list_endpoint = f"{backend_base_url}/ticket/list"
-    response = requests.get(list_endpoint)
+    params = {field: ",".join(values) for field, values in filters.items() if values}
+    if limit:
+        params["limit"] = limit
+    if offset is not None:
+        params["offset"] = offset
+
+    response = http_client.get(list_endpoint, params=params)
     res = response.json()
 
     try:
-        res = HttpResponse[ListTicketData](**res)
+        res = ListTicketResponse(**res)
     except ValidationError as e:
         print("Validate get ticket failed: ", e)
         return None
 
     if response.status_code != 200:
-        print("Generate ticket failed: ", res)
+        print("List tickets failed: ", res)
         print(res.base.message)
         return None
 
-    if not res.data:
+    return (res.data.root if res.data else []), res.next_page_offset
+
+
+def list_tickets(**filters: List[str]):
+    tickets = []
+    offset = None
+    while True:
+        page = list_tickets_page(offset=offset, **filters)
+        if page is None:
+            return None
+
+        page_tickets, offset = page
+        tickets.extend(page_tickets)
+        if offset is None:
+            break
+
+    if not tickets:
         print("No ticket in response")
         return None
 
-    print(res.data.root)
-    return res.data.root
+    return tickets
+
+
+class SyncTicketData(BaseModel):
+    tickets: list[Ticket]
+    watermark: float
+    after_id: Optional[str] = None
+    has_more: bool
+
+
+def sync_tickets(since: float, limit: Optional[int] = None):
+    """
+    Fetches the tickets changed after the `since` watermark, following
+    `has_more` until caught up.
+
+    Returns the merged `SyncTicketData`, or None if a request failed.
+    """
+    sync_endpoint = f"{backend_base_url}/ticket/sync"
+    merged = SyncTicketData(tickets=[], watermark=since, has_more=True)
+
+    while merged.has_more:
+        params = {"since": merged.watermark}
+        # inside a group of tickets sharing one updated_at, paged by id
+        if merged.after_id is not None:
+            params["after_id"] = merged.after_id
+        if limit:
+            params["limit"] = limit
+
+        response = http_client.get(sync_endpoint, params=params)
+        res = response.json()
+
+        try:
+            res = HttpResponse[SyncTicketData](**res)
+        except ValidationError as e:
+            print("Validate sync tickets failed: ", e)
+            return None
+
+        if response.status_code != 200 or not res.data:
+            print("Sync tickets failed: ", res)
+            print(res.base.message)
+            return None
+
+        merged.tickets.extend(res.data.tickets)
+        merged.watermark = res.data.watermark
+        merged.after_id = res.data.after_id
+        merged.has_more = res.data.has_more
+
+    return merged
 
 
 # class GenTicketData(BaseModel):
@@ -61,8 +144,10 @@ class GenTicketData(BaseModel):
 
 def generate_ticket(ticket_desc: str, reporter_id: str, assignee_id: str):
     create_endpoint = f"{backend_base_url}/ticket/gen"
-    response = requests.post(
+    response = http_client.post(
         create_endpoint,
+        idempotent=False,
+        timeout=(3.05, 90),
         json={
             "data": {
                 "ticket_description": ticket_desc,
@@ -89,7 +174,11 @@ def generate_ticket(ticket_desc: str, reporter_id: str, assignee_id: str):
 
 def create_ticket(ticket: Ticket):
     create_endpoint = f"{backend_base_url}/ticket/create"
-    response = requests.post(create_endpoint, json={"data": ticket.model_dump()})
+    response = http_client.post(
+        create_endpoint,
+        idempotent=False,
+        json={"data": ticket.model_dump(exclude={"embedding"})},
+    )
     res = response.json()
 
     try:
@@ -103,12 +192,15 @@ def create_ticket(ticket: Ticket):
         print(res.base.message)
         return None
 
+    get_ticket_store().upsert([res.data])
     return res.data
 
 
 def create_tickets(tickets: List[Ticket]):
     create_endpoint = f"{backend_base_url}/ticket/create"
-    response = requests.post(create_endpoint, json={"data": tickets})
+    response = http_client.post(
+        create_endpoint, idempotent=False, json={"data": tickets}
+    )
     res = response.json()
 
     try:
@@ -126,16 +218,17 @@ def create_tickets(tickets: List[Ticket]):
         print("No ticket in response")
         return None
 
+    get_ticket_store().upsert(res.data.root)
     return res.data.root
 
 
 def find_similar_tickets(ticket: Ticket):
     create_endpoint = f"{backend_base_url}/ticket/find_similar"
 
-    ticket_model = ticket.model_dump()
+    ticket_model = ticket.model_dump(exclude={"embedding"})
     ticket_model["created_at"] = None
     ticket_model["updated_at"] = None
-    response = requests.post(create_endpoint, json={"data": ticket_model})
+    response = http_client.post(create_endpoint, json={"data": ticket_model})
     res = response.json()
 
     try:
@@ -156,22 +249,171 @@ def find_similar_tickets(ticket: Ticket):
     return res.data.root
 
 
-def update_ticket(ticket: dict):
+def update_ticket(ticket: dict, expected_updated_at: Optional[float] = None):
+    """
+    Sends `ticket`, a dict with the id and the fields to change. With
+    `expected_updated_at` the backend rejects the update (409) if the ticket
+    was updated since, the current copy it returns replaces the stored one.
+    """
     update_endpoint = f"{backend_base_url}/ticket/update"
     data = {"data": ticket}
-    print("[UPDATE ticket] data: ", data)
-    response = requests.post(update_endpoint, json=data)
+    if expected_updated_at is not None:
+        data["expected_updated_at"] = expected_updated_at
+    response = http_client.post(update_endpoint, json=data)
     res = response.json()
 
     try:
-        res = HttpResponse[SimilarTicket](**res)
+        res = HttpResponse[Ticket](**res)
     except ValidationError as e:
         print("Validate update ticket failed: ", e)
         return None
 
+    if response.status_code == 409 and res.data:
+        print("Update ticket rejected, it was modified by someone else")
+        get_ticket_store().upsert([res.data])
+        return None
+
     if response.status_code != 200:
         print("Update ticket failed: ", res)
         print(res.base.message)
         return None
 
+    get_ticket_store().upsert([res.data])
     return res.data
+
+
+# set by the backend, never part of an edit
+SERVER_FIELDS = {"id", "created_at", "updated_at", "embedding"}
+
+
+def diff_ticket(base: Ticket, edited: Union[Ticket, Dict]) -> Dict:
+    """
+    The fields of `edited` (a ticket or a dict of fields) whose value differs
+    from `base`, the last copy read from the backend, as JSON values.
+    Fields set by the backend are ignored.
+    """
+    if isinstance(edited, Ticket):
+        edited = edited.model_dump(exclude=SERVER_FIELDS)
+    fields = {
+        field: value for field, value in edited.items() if field not in SERVER_FIELDS
+    }
+    # validated on top of the base, so "done" and Status.DONE compare equal
+    edited = Ticket.model_validate({**base.model_dump(), **fields}).model_dump(
+        mode="json", include=set(fields)
+    )
+    current = base.model_dump(mode="json", include=set(fields))
+    return {
+        field: value for field, value in edited.items() if value != current[field]
+    }
+
+
+def updated_at_of(ticket: Ticket) -> Optional[float]:
+    """The ticket's `updated_at` as the backend stores it, for preconditions."""
+    return ticket.updated_at.timestamp() if ticket.updated_at else None
+
+
+def save_ticket(base: Ticket, edited: Union[Ticket, Dict]):
+    """
+    Sends only the fields of `edited` that differ from `base`, on condition
+    that the ticket was not updated since `base` was read.
+
+    Returns the saved ticket, `base` when nothing changed, or None if the
+    update failed or was rejected (the store then holds the current copy).
+    """
+    delta = diff_ticket(base, edited)
+    if not delta:
+        return base
+    return update_ticket(
+        {"id": base.id, **delta}, expected_updated_at=updated_at_of(base)
+    )
+
+
+class UpdateTicketError(BaseModel):
+    index: int
+    id: Optional[str] = None
+    status: int
+    message: str
+    # the current ticket, when the update was rejected as outdated (409)
+    data: Optional[Ticket] = None
+
+
+class UpdateTicketsResponse(HttpResponse[list[Optional[Ticket]]]):
+    errors: list[UpdateTicketError] = []
+
+
+def update_tickets(deltas: List[dict]):
+    """
+    Updates many tickets in one call. Each delta is `{"id", ...fields}`,
+    optionally with an `expected_updated_at`.
+
+    Returns the updated tickets in the order of `deltas`, None where an item
+    failed, and the per-item errors, or None if the request failed.
+    """
+    update_endpoint = f"{backend_base_url}/ticket/update"
+    response = http_client.post(update_endpoint, json={"data": deltas})
+    res = response.json()
+
+    try:
+        res = UpdateTicketsResponse(**res)
+    except ValidationError as e:
+        print("Validate update tickets failed: ", e)
+        return None
+
+    if response.status_code != 200 or res.data is None:
+        print("Update tickets failed: ", res)
+        print(res.base.message)
+        return None
+
+    # outdated items come back with the current ticket, refresh those too
+    get_ticket_store().upsert(
+        res.data + [error.data for error in res.errors if error.data]
+    )
+    return res.data, res.errors
+
+
+def save_tickets(edits: Dict[str, Dict]) -> Optional[Dict[str, str]]:
+    """
+    Saves `{ticket id: {field: value}}` edits in one batch update. Each edit
+    is validated on top of the stored copy of its ticket and only the changed
+    fields are sent, on condition that the ticket was not updated since that
+    copy was read. Edits that leave a ticket invalid (e.g. a cleared title or
+    status) are refused without being sent.
+
+    Returns the message of every edit that was not saved by ticket id, or
+    None if the request failed.
+    """
+    store = get_ticket_store()
+    failed = {}
+    deltas = []
+    for ticket_id, fields in edits.items():
+        base = store.get(ticket_id)
+        if base is None:
+            failed[ticket_id] = "ticket not found"
+            continue
+        try:
+            delta = diff_ticket(base, fields)
+        except ValidationError as e:
+            failed[ticket_id] = "invalid " + ", ".join(
+                str(error["loc"][0]) for error in e.errors()
+            )
+            continue
+        if delta:
+            deltas.append(
+                {
+                    "id": ticket_id,
+                    **delta,
+                    "expected_updated_at": updated_at_of(base),
+                }
+            )
+
+    if not deltas:
+        return failed
+
+    result = update_tickets(deltas)
+    if result is None:
+        return None
+
+    _, errors = result
+    for error in errors:
+        failed[deltas[error.index]["id"]] = error.message
+    return failed
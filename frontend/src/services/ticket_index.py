@@ -0,0 +1,123 @@
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from entities.ticket import Ticket
+
+# fields the board filters and groups on, labels are indexed per label
+INDEXED_FIELDS = ("status", "assignee_id", "type", "priority", "labels")
+
+
+def _field_values(ticket: Ticket, field: str) -> Set[Any]:
+    value = getattr(ticket, field)
+    if field == "labels":
+        return set(value or [])
+    # enums are indexed by their value, so "open" and Status.OPEN both match
+    return {getattr(value, "value", value)}
+
+
+class TicketIndex:
+    """
+    Tickets by id plus an inverted index (value -> ticket ids) per field in
+    `INDEXED_FIELDS`, updated ticket by ticket. Facet options, counts and
+    filters read the postings, so their cost follows the number of matching
+    tickets rather than the size of the backlog.
+
+    Tickets keep the order in which they were first added. Not thread-safe,
+    `TicketStore` guards it with its lock.
+    """
+
+    def __init__(self, tickets: Iterable[Ticket] = ()):
+        self._tickets: Dict[str, Ticket] = {}
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        self._postings: Dict[str, Dict[Any, Set[str]]] = {
+            field: defaultdict(set) for field in INDEXED_FIELDS
+        }
+        for ticket in tickets:
+            self.add(ticket)
+
+    def __len__(self) -> int:
+        return len(self._tickets)
+
+    def __contains__(self, ticket_id: str) -> bool:
+        return ticket_id in self._tickets
+
+    def get(self, ticket_id: str) -> Optional[Ticket]:
+        return self._tickets.get(ticket_id)
+
+    def tickets(self) -> List[Ticket]:
+        return list(self._tickets.values())
+
+    def add(self, ticket: Ticket):
+        """Adds a ticket or replaces the one with the same id, keeping its place."""
+        previous = self._tickets.get(ticket.id)
+        if previous is not None:
+            self._unindex(previous)
+        else:
+            self._positions[ticket.id] = self._next_position
+            self._next_position += 1
+
+        self._tickets[ticket.id] = ticket
+        for field in INDEXED_FIELDS:
+            for value in _field_values(ticket, field):
+                self._postings[field][value].add(ticket.id)
+
+    def remove(self, ticket_id: str):
+        ticket = self._tickets.pop(ticket_id, None)
+        if ticket is None:
+            return
+        self._unindex(ticket)
+        del self._positions[ticket_id]
+
+    def _unindex(self, ticket: Ticket):
+        for field in INDEXED_FIELDS:
+            postings = self._postings[field]
+            for value in _field_values(ticket, field):
+                ids = postings.get(value)
+                if ids is None:
+                    continue
+                ids.discard(ticket.id)
+                if not ids:
+                    del postings[value]
+
+    def values(self, field: str) -> List[Any]:
+        """Values of `field` held by at least one ticket, for facet options."""
+        return list(self._postings[field])
+
+    def counts(self, field: str) -> Dict[Any, int]:
+        return {value: len(ids) for value, ids in self._postings[field].items()}
+
+    def match(self, **filters: Optional[Iterable[Any]]) -> List[Ticket]:
+        """
+        Tickets matching every filter, a filter matching any of its values
+        (e.g. `match(status=["open"], labels=["auth", "email"])`). Empty or
+        None filters are ignored. Results are in insertion order.
+        """
+        candidates: Optional[Set[str]] = None
+        # narrowest filter first, so every intersection is at most that size
+        unions = sorted(
+            (
+                self._union(field, values)
+                for field, values in filters.items()
+                if values
+            ),
+            key=len,
+        )
+        for ids in unions:
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        if candidates is None:
+            return self.tickets()
+        return [
+            self._tickets[ticket_id]
+            for ticket_id in sorted(candidates, key=self._positions.__getitem__)
+        ]
+
+    def _union(self, field: str, values: Iterable[Any]) -> Set[str]:
+        postings = self._postings[field]
+        ids: Set[str] = set()
+        for value in values:
+            ids |= postings.get(getattr(value, "value", value), set())
+        return ids
@@ -0,0 +1,145 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import streamlit as st
+
+from entities.ticket import Ticket
+from .ticket_index import TicketIndex
+
+DEFAULT_TTL_SECONDS = 30.0
+# re-read a few seconds before the watermark, writes that committed out of
+# order around it are then still picked up (applying a ticket twice is harmless)
+SYNC_OVERLAP_SECONDS = 5.0
+
+# since watermark -> (changed tickets, new watermark)
+Syncer = Callable[[float], Optional[Tuple[List[Ticket], float]]]
+
+
+class TicketStore:
+    """
+    Process-wide copy of the ticket list, shared by every browser session and
+    page. Reads are served from memory until the TTL expires, writes made
+    through the ticket service are applied in place, and concurrent refreshes
+    are coalesced into a single backend call. After the first full load,
+    refreshes only fetch the changes since the last watermark when a
+    `syncer` is given.
+
+    The tickets are kept in a `TicketIndex`, so facet options, counts and
+    filtered selections are answered without scanning every ticket.
+
+    The returned tickets are shared, treat them as read-only and use
+    `model_copy` before changing one.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Optional[List[Ticket]]],
+        syncer: Optional[Syncer] = None,
+        ttl: float = DEFAULT_TTL_SECONDS,
+    ):
+        self.loader = loader
+        self.syncer = syncer
+        self.ttl = ttl
+        self._tickets = TicketIndex()
+        self._loaded_at: Optional[float] = None
+        self._watermark: Optional[float] = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def _is_fresh(self) -> bool:
+        return (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at < self.ttl
+        )
+
+    def list(self, force_refresh: bool = False) -> List[Ticket]:
+        if not force_refresh and self._is_fresh():
+            with self._lock:
+                return self._tickets.tickets()
+
+        requested_at = time.monotonic()
+        with self._refresh_lock:
+            # another session refreshed while we waited, reuse its result
+            if self._loaded_at is not None and self._loaded_at >= requested_at:
+                with self._lock:
+                    return self._tickets.tickets()
+
+            if self.syncer is not None and self._watermark is not None and not force_refresh:
+                self._apply_delta()
+            else:
+                self._load()
+
+            with self._lock:
+                # if the backend call failed keep serving the previous copy,
+                # and wait a full TTL before trying again
+                self._loaded_at = time.monotonic()
+                return self._tickets.tickets()
+
+    def _load(self):
+        tickets = self.loader()
+        if tickets is None:
+            return
+
+        index = TicketIndex(tickets)
+        with self._lock:
+            self._tickets = index
+            self._watermark = max(
+                (t.updated_at.timestamp() for t in tickets if t.updated_at),
+                default=None,
+            )
+
+    def _apply_delta(self):
+        delta = self.syncer(self._watermark - SYNC_OVERLAP_SECONDS)
+        if delta is None:
+            return
+
+        changed, watermark = delta
+        with self._lock:
+            for ticket in changed:
+                self._tickets.add(ticket)
+            self._watermark = max(self._watermark, watermark)
+
+    def get(self, ticket_id: str) -> Optional[Ticket]:
+        with self._lock:
+            return self._tickets.get(ticket_id)
+
+    def upsert(self, tickets: Iterable[Ticket]):
+        with self._lock:
+            for ticket in tickets:
+                if ticket is not None:
+                    self._tickets.add(ticket)
+
+    def remove(self, ticket_id: str):
+        with self._lock:
+            self._tickets.remove(ticket_id)
+
+    def facet_values(self, field: str) -> List[Any]:
+        with self._lock:
+            return self._tickets.values(field)
+
+    def counts(self, field: str) -> Dict[Any, int]:
+        with self._lock:
+            return self._tickets.counts(field)
+
+    def match(self, **filters: Optional[Iterable[Any]]) -> List[Ticket]:
+        """Tickets matching all filters, see `TicketIndex.match`."""
+        with self._lock:
+            return self._tickets.match(**filters)
+
+    def invalidate(self):
+        with self._lock:
+            self._loaded_at = None
+
+
+@st.cache_resource
+def get_ticket_store() -> TicketStore:
+    from .ticket import list_tickets, sync_tickets
+
+    def syncer(since: float):
+        delta = sync_tickets(since)
+        if delta is None:
+            return None
+        return delta.tickets, delta.watermark
+
+    return TicketStore(loader=list_tickets, syncer=syncer)
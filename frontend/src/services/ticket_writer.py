@@ -0,0 +1,214 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Union
+
+import streamlit as st
+
+from entities.ticket import Ticket
+from .ticket import updated_at_of
+from .ticket_store import TicketStore, get_ticket_store
+
+# how long a write waits for more moves of the same tickets before it is sent
+FLUSH_DELAY_SECONDS = 0.5
+MAX_BATCH_SIZE = 25
+
+
+@dataclass
+class Rejected:
+    """A write refused because the ticket changed since, with its current copy."""
+
+    current: Ticket
+
+
+# deltas ({"id", "expected_updated_at", field: value}) -> per delta the saved
+# ticket, `Rejected` or None if it failed
+Sender = Callable[[List[Dict]], List[Union[Ticket, Rejected, None]]]
+
+
+@dataclass
+class _PendingWrite:
+    delta: Dict
+    # last copy the backend confirmed, restored if the write fails
+    previous: Ticket
+    owner: Optional[str] = None
+
+
+@dataclass
+class WriteFailure:
+    ticket_id: str
+    delta: Dict
+    restored: Ticket
+
+
+class TicketWriteQueue:
+    """
+    Background writer for small ticket changes such as Kanban moves. The
+    change is applied to the `TicketStore` right away and only its delta is
+    queued; repeated changes of a ticket are merged into one write, and a
+    worker thread sends the queue in batches of up to `max_batch_size`.
+
+    Every write is conditional on the ticket not having been updated since
+    its last confirmed copy. A saved ticket replaces the optimistic copy,
+    unless it changed again in the meantime. A failed write is merged into a
+    newer change of the same ticket if there is one, else the last confirmed
+    copy is restored; a rejected write is dropped in favour of the current
+    copy the backend sent. Both are kept for their owner (a browser session)
+    to pick up with `take_failures`.
+    """
+
+    def __init__(
+        self,
+        store: TicketStore,
+        sender: Sender,
+        delay: float = FLUSH_DELAY_SECONDS,
+        max_batch_size: int = MAX_BATCH_SIZE,
+    ):
+        self.store = store
+        self.sender = sender
+        self.delay = delay
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[str, _PendingWrite] = {}
+        self._in_flight: Dict[str, _PendingWrite] = {}
+        self._failures: Dict[Optional[str], List[WriteFailure]] = {}
+        self._condition = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def enqueue(self, ticket: Ticket, delta: Dict, owner: Optional[str] = None):
+        """
+        Applies `delta` to `ticket` in the store and queues it, e.g.
+        `enqueue(ticket, {"status": "done"})`. Returns the optimistic copy.
+        """
+        updated = _apply(ticket, delta)
+        with self._condition:
+            pending = self._pending.get(ticket.id)
+            if pending is not None:
+                pending.delta.update(delta)
+                pending.owner = owner
+            else:
+                in_flight = self._in_flight.get(ticket.id)
+                # while a write is in flight its ticket is not confirmed yet,
+                # the copy it replaces is settled when it returns
+                previous = in_flight.previous if in_flight else ticket
+                self._pending[ticket.id] = _PendingWrite(
+                    delta={"id": ticket.id, **delta}, previous=previous, owner=owner
+                )
+            self.store.upsert([updated])
+            self._start_worker()
+            self._condition.notify()
+        return updated
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending) + len(self._in_flight)
+
+    def take_failures(self, owner: Optional[str] = None) -> List[WriteFailure]:
+        with self._condition:
+            return self._failures.pop(owner, [])
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Waits until every queued write was sent, False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._in_flight, timeout
+            )
+
+    def _start_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="ticket-writer", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+            # let a burst of clicks settle so it goes out as one write per ticket
+            time.sleep(self.delay)
+
+            with self._condition:
+                batch_ids = list(self._pending)[: self.max_batch_size]
+                batch = {
+                    ticket_id: self._pending.pop(ticket_id) for ticket_id in batch_ids
+                }
+                self._in_flight.update(batch)
+
+            deltas = [
+                {**write.delta, "expected_updated_at": updated_at_of(write.previous)}
+                for write in batch.values()
+            ]
+            try:
+                saved = self.sender(deltas)
+            except Exception as e:
+                print("Write tickets failed: ", e)
+                saved = [None] * len(deltas)
+
+            with self._condition:
+                for (ticket_id, write), ticket in zip(batch.items(), saved):
+                    self._settle(ticket_id, write, ticket)
+                self._condition.notify_all()
+
+    def _settle(
+        self,
+        ticket_id: str,
+        write: _PendingWrite,
+        saved: Union[Ticket, Rejected, None],
+    ):
+        del self._in_flight[ticket_id]
+        newer = self._pending.get(ticket_id)
+
+        if isinstance(saved, Ticket):
+            self._confirm(saved, newer)
+            return
+
+        if isinstance(saved, Rejected):
+            # the newer change still applies, now on top of the current copy
+            self._confirm(saved.current, newer)
+            self._failures.setdefault(write.owner, []).append(
+                WriteFailure(ticket_id, write.delta, saved.current)
+            )
+            return
+
+        if newer is not None:
+            # resend the failed change along with the newer one
+            newer.delta = {**write.delta, **newer.delta}
+            return
+
+        self.store.upsert([write.previous])
+        self._failures.setdefault(write.owner, []).append(
+            WriteFailure(ticket_id, write.delta, write.previous)
+        )
+
+    def _confirm(self, ticket: Ticket, newer: Optional[_PendingWrite]):
+        if newer is None:
+            self.store.upsert([ticket])
+            return
+        # keep showing the newer change on top of the confirmed copy
+        newer.previous = ticket
+        self.store.upsert([_apply(ticket, newer.delta)])
+
+
+def _apply(ticket: Ticket, delta: Dict) -> Ticket:
+    fields = {key: value for key, value in delta.items() if key != "id"}
+    # validated, so JSON values in the delta become enums and datetimes
+    return Ticket.model_validate({**ticket.model_dump(), **fields})
+
+
+@st.cache_resource
+def get_ticket_writer() -> TicketWriteQueue:
+    from .ticket import update_tickets
+
+    def sender(deltas: List[Dict]) -> List[Union[Ticket, Rejected, None]]:
+        result = update_tickets(deltas)
+        if result is None:
+            return [None] * len(deltas)
+
+        saved, errors = result
+        for error in errors:
+            print(f"Update ticket {error.id} failed: ", error.message)
+            if error.status == 409 and error.data:
+                saved[error.index] = Rejected(error.data)
+        return saved
+
+    return TicketWriteQueue(get_ticket_store(), sender)
@@ -0,0 +1,181 @@
+import copy
+import random
+from datetime import datetime
+
+import pytest
+
+import services.analytics as analytics
+import services.analytics_engine as analytics_engine
+from services.analytics_engine import EventColumns
+
+from . import analytics_baseline as baseline
+
+DAY_MS = 24 * 60 * 60 * 1000
+START_TIME = 1_736_121_600_000  # 2025-01-06
+DESCRIPTIONS = [
+    "update status - in_progress",
+    "update status - open",
+    "update status - review",
+    "update priority - high",
+    "update priority - low",
+    "complete ticket",
+]
+
+
+class FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls.fromtimestamp(START_TIME / 1000 + 9 * 86400, tz)
+
+
+@pytest.fixture(autouse=True)
+def frozen_now(monkeypatch):
+    # lead times and the header count up to now, both sides must agree on it
+    monkeypatch.setattr(baseline, "datetime", FrozenDatetime)
+    monkeypatch.setattr(analytics, "datetime", FrozenDatetime)
+    monkeypatch.setattr(analytics_engine, "datetime", FrozenDatetime)
+
+
+def random_sprint(seed: int, tickets: int = 40, sprint_days: int = 10) -> dict:
+    """
+    A shuffled sprint log with timestamp ties (coarse timestamps), events
+    before the start and after the end of the sprint, reopened and review
+    statuses, and tickets without a create event.
+    """
+    rng = random.Random(seed)
+    end_time = START_TIME + sprint_days * DAY_MS
+    events = []
+    for ticket in range(tickets):
+        ticket_id = f"TIX-{ticket}"
+        priority = rng.choice(["low", "medium", "high"])
+        # whole hours, so events of the same and of different tickets collide
+        timestamp = START_TIME + rng.randint(-48, sprint_days * 24 + 48) * 3600_000
+        has_create = rng.random() < 0.9
+        if has_create:
+            events.append(
+                {
+                    "ticket_id": ticket_id,
+                    "timestamp": timestamp,
+                    "description": "create ticket",
+                    "status": "open",
+                    "priority": priority,
+                }
+            )
+        for _ in range(rng.randint(0, 6)):
+            timestamp += rng.choice([0, 0, 3600_000, DAY_MS])
+            events.append(
+                {
+                    "ticket_id": ticket_id,
+                    "timestamp": timestamp,
+                    "description": rng.choice(DESCRIPTIONS),
+                    "status": "in_progress",
+                    "priority": priority,
+                }
+            )
+        if not has_create:
+            # the original lead time needs a create or a complete event
+            events.append(
+                {
+                    "ticket_id": ticket_id,
+                    "timestamp": timestamp,
+                    "description": "complete ticket",
+                    "status": "done",
+                    "priority": priority,
+                }
+            )
+
+    rng.shuffle(events)
+    return {
+        "id": f"random-{seed}",
+        "start_time": START_TIME,
+        "end_time": end_time,
+        "events": events,
+    }
+
+
+SEEDS = range(25)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_group_events_by_tix(seed):
+    sprint = random_sprint(seed)
+    expected = baseline.group_events_by_tix(copy.deepcopy(sprint))
+    assert list(analytics.group_events_by_tix(sprint).items()) == list(
+        expected.items()
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_analytics_page_header(seed):
+    sprint = random_sprint(seed)
+    assert analytics.get_analytics_page_header(
+        sprint
+    ) == baseline.get_analytics_page_header(copy.deepcopy(sprint))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_lead_time(seed):
+    sprint = random_sprint(seed)
+    expected = baseline.generate_lead_time(
+        baseline.group_events_by_tix(copy.deepcopy(sprint))
+    )
+    assert analytics.generate_lead_time(analytics.group_events_by_tix(sprint)) == (
+        expected
+    )
+    # a plain dict is converted back to columns
+    assert analytics.generate_lead_time(
+        dict(baseline.group_events_by_tix(copy.deepcopy(sprint)))
+    ) == expected
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_status_breakdown(seed):
+    sprint = random_sprint(seed)
+    expected = baseline.generate_tix_status_breakdown(
+        baseline.group_events_by_tix(copy.deepcopy(sprint))
+    )
+    assert (
+        analytics.generate_tix_status_breakdown(analytics.group_events_by_tix(sprint))
+        == expected
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_status_per_unit_time(seed):
+    sprint = random_sprint(seed)
+    assert tuple(analytics.generate_tix_status_per_unit_time(sprint)) == tuple(
+        baseline.generate_tix_status_per_unit_time(copy.deepcopy(sprint))
+    )
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_sprint_burndown(seed):
+    sprint = random_sprint(seed)
+    assert analytics.generate_sprint_burndown(
+        sprint
+    ) == baseline.generate_sprint_burndown(copy.deepcopy(sprint))
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_event_columns_in_progress_count(seed):
+    sprint = random_sprint(seed)
+    _, expected = baseline.get_analytics_page_header(copy.deepcopy(sprint))
+    assert EventColumns.from_events(sprint["events"]).count_in_progress() == expected
+
+
+def test_empty_sprint():
+    sprint = {
+        "id": "empty",
+        "start_time": START_TIME,
+        "end_time": START_TIME,
+        "events": [],
+    }
+    assert analytics.group_events_by_tix(sprint) == {}
+    assert analytics.generate_tix_status_breakdown(
+        analytics.group_events_by_tix(sprint)
+    ) == {"Open": 0, "In Progress": 0, "Done": 0}
+    assert tuple(analytics.generate_tix_status_per_unit_time(sprint)) == (
+        [0],
+        [0],
+        [0],
+    )
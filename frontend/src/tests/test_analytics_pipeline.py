@@ -0,0 +1,43 @@
+from services.analytics_pipeline import event_log_version, get_sprint_analytics
+
+from .test_analytics_parity import random_sprint
+
+
+class UnreadableEvents(list):
+    def __iter__(self):
+        raise AssertionError("the version must not walk the event log")
+
+
+def test_version_does_not_read_every_event():
+    sprint = random_sprint(0)
+    sprint["events"] = UnreadableEvents(sprint["events"])
+
+    assert event_log_version(sprint) == event_log_version(dict(sprint))
+
+
+def test_version_changes_when_an_event_is_appended():
+    sprint = random_sprint(1)
+    before = event_log_version(sprint)
+
+    sprint["events"] = sprint["events"] + [
+        {**sprint["events"][0], "description": "complete ticket"}
+    ]
+
+    assert event_log_version(sprint) != before
+
+
+def test_exporter_version_wins():
+    sprint = {**random_sprint(2), "version": 7}
+
+    assert event_log_version(sprint) == 7
+    assert event_log_version({**random_sprint(3), "version": 7}) == 7
+
+
+def test_analytics_are_memoized_per_version():
+    sprint = random_sprint(4)
+    analytics = get_sprint_analytics(sprint)
+
+    assert get_sprint_analytics(dict(sprint)) is analytics
+
+    sprint = {**sprint, "events": sprint["events"][:-1]}
+    assert get_sprint_analytics(sprint) is not analytics
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+
+from services.analytics_engine import EventColumns
+from services.analytics_stream import (
+    StreamingSprintAnalytics,
+    read_events,
+    stream_sprint_analytics,
+)
+
+from .test_analytics_parity import DAY_MS, START_TIME, random_sprint
+
+NOW_MS = START_TIME + 9 * DAY_MS
+# wider than any sprint here, so no event is ever too late
+NO_LATENESS_LIMIT = 10**15
+
+
+def assert_matches_columns(analytics: StreamingSprintAnalytics, sprint: dict):
+    columns = EventColumns.from_events(sprint["events"])
+    assert analytics.late_events == 0
+    assert analytics.status_flow() == columns.status_flow(
+        sprint["start_time"], sprint["end_time"]
+    )
+    assert analytics.status_breakdown() == columns.status_breakdown()
+    assert analytics.in_progress_count() == columns.count_in_progress()
+    assert analytics.lead_times(NOW_MS) == columns.lead_times(NOW_MS)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_shuffled_iterator_matches_event_columns(seed):
+    sprint = random_sprint(seed)
+
+    analytics = stream_sprint_analytics(
+        sprint, iter(sprint["events"]), lateness_ms=NO_LATENESS_LIMIT
+    )
+
+    assert_matches_columns(analytics, sprint)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_ordered_log_needs_no_lateness_window(seed):
+    sprint = random_sprint(seed)
+    sprint["events"].sort(key=lambda event: event["timestamp"])
+
+    analytics = stream_sprint_analytics(sprint, sprint["events"], lateness_ms=0)
+
+    assert_matches_columns(analytics, sprint)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_chunked_jsonl_matches_event_columns(tmp_path, chunk_size):
+    sprint = random_sprint(3)
+    events = sprint["events"]
+    path = tmp_path / "events.jsonl"
+    with open(path, "w") as file:
+        for start in range(0, len(events), chunk_size):
+            chunk = events[start : start + chunk_size]
+            # single events and arrays of events may be mixed in one file
+            file.write(json.dumps(chunk[0] if len(chunk) == 1 else chunk) + "\n\n")
+
+    assert list(read_events(path)) == events
+    analytics = stream_sprint_analytics(sprint, path, lateness_ms=NO_LATENESS_LIMIT)
+
+    assert_matches_columns(analytics, sprint)
+
+
+def test_events_later_than_the_window_are_skipped():
+    hour = 3600_000
+    event = {"ticket_id": "TIX-1", "description": "create ticket"}
+    analytics = StreamingSprintAnalytics(
+        START_TIME, START_TIME + 2 * DAY_MS, lateness_ms=hour
+    )
+
+    analytics.feed({**event, "timestamp": START_TIME + 10 * hour})
+    analytics.feed({**event, "timestamp": START_TIME + 13 * hour})
+    # behind the newest event by more than the window, after the first was applied
+    analytics.feed(
+        {"ticket_id": "TIX-2", "description": "create ticket", "timestamp": START_TIME}
+    )
+    # within the window, still applied
+    analytics.feed(
+        {
+            "ticket_id": "TIX-1",
+            "description": "complete ticket",
+            "timestamp": START_TIME + 12 * hour + 30 * 60_000,
+        }
+    )
+    analytics.close()
+
+    assert analytics.late_events == 1
+    # the skipped event's ticket is not seen at all
+    assert analytics.lead_times(NOW_MS) == {"TIX-1": 0.1}
@@ -0,0 +1,141 @@
+import subprocess
+import sys
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+
+import services.analytics_trends as analytics_trends
+from services.analytics_pipeline import SprintAnalytics
+from services.analytics_trends import (
+    multi_sprint_metrics,
+    stored_multi_sprint_metrics,
+    summarize_sprint,
+)
+
+from .test_analytics_parity import random_sprint
+
+
+class InlinePool:
+    """Stands in for the process pool, runs the jobs in this process."""
+
+    created = 0
+
+    def __init__(self, max_workers=None, mp_context=None):
+        type(self).created += 1
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def map(self, fn, jobs):
+        return map(fn, jobs)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(analytics_trends, "_cache", OrderedDict())
+    InlinePool.created = 0
+    monkeypatch.setattr(analytics_trends, "ProcessPoolExecutor", InlinePool)
+
+
+@pytest.fixture
+def parallel(monkeypatch):
+    """Sends every computation to the pool, whatever its size."""
+    monkeypatch.setattr(analytics_trends, "MIN_PARALLEL_EVENTS", 0)
+    monkeypatch.setattr(analytics_trends.os, "cpu_count", lambda: 4)
+
+
+def test_metrics_match_the_per_sprint_pipeline(parallel):
+    sprints = [random_sprint(seed) for seed in range(3)]
+
+    metrics = multi_sprint_metrics(sprints)
+
+    assert metrics == [summarize_sprint(SprintAnalytics(s)) for s in sprints]
+    assert InlinePool.created == 1
+
+
+def test_cached_rerun_does_not_start_a_pool(parallel):
+    sprints = [random_sprint(seed) for seed in range(3)]
+    first = multi_sprint_metrics(sprints)
+
+    second = multi_sprint_metrics([dict(sprint) for sprint in sprints])
+
+    assert second == first
+    assert InlinePool.created == 1
+
+
+def test_a_single_miss_is_computed_in_process(parallel):
+    sprints = [random_sprint(seed) for seed in range(3)]
+    multi_sprint_metrics(sprints)
+
+    changed = {**sprints[1], "events": sprints[1]["events"][:-1]}
+    metrics = multi_sprint_metrics([sprints[0], changed, sprints[2]])
+
+    assert metrics[1] == summarize_sprint(SprintAnalytics(changed))
+    assert InlinePool.created == 1
+
+
+def test_one_worker_never_starts_a_pool(parallel):
+    multi_sprint_metrics([random_sprint(seed) for seed in range(3)], max_workers=1)
+
+    assert InlinePool.created == 0
+
+
+def test_small_logs_are_computed_in_process():
+    sprints = [random_sprint(seed) for seed in range(12)]
+
+    assert multi_sprint_metrics(sprints) == [
+        summarize_sprint(SprintAnalytics(s)) for s in sprints
+    ]
+    assert InlinePool.created == 0
+
+
+def test_a_single_cpu_never_starts_a_pool(monkeypatch):
+    monkeypatch.setattr(analytics_trends, "MIN_PARALLEL_EVENTS", 0)
+    monkeypatch.setattr(analytics_trends.os, "cpu_count", lambda: 1)
+
+    multi_sprint_metrics([random_sprint(seed) for seed in range(3)])
+
+    assert InlinePool.created == 0
+
+
+def test_stored_sprints_are_sized_from_the_store(tmp_path, monkeypatch):
+    from services.event_store import EventStore
+
+    store = EventStore(tmp_path)
+    sprints = [random_sprint(seed) for seed in range(3)]
+    for sprint in sprints:
+        store.write_sprint(sprint)
+    monkeypatch.setattr(analytics_trends.os, "cpu_count", lambda: 4)
+    monkeypatch.setattr(
+        analytics_trends,
+        "MIN_PARALLEL_EVENTS",
+        sum(len(sprint["events"]) for sprint in sprints),
+    )
+
+    stored_multi_sprint_metrics(store, [sprint["id"] for sprint in sprints[:2]])
+    assert InlinePool.created == 0
+    stored_multi_sprint_metrics(store)
+    # the first two are cached, the third alone is too small
+    assert InlinePool.created == 0
+
+    analytics_trends._cache.clear()
+    stored_multi_sprint_metrics(store)
+    assert InlinePool.created == 1
+
+
+def test_workers_do_not_import_the_network_clients():
+    # a spawned worker imports only the module of the function it runs
+    code = (
+        "import sys, services.analytics_trends; "
+        "assert not {'qdrant_client', 'openai', 'streamlit'} & set(sys.modules)"
+    )
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parent.parent,
+        check=True,
+    )
@@ -0,0 +1,95 @@
+import pytest
+
+import services.event_store as event_store
+from services.analytics_engine import EventColumns
+from services.analytics_pipeline import SprintAnalytics
+from services.event_store import EventStore
+
+from .test_analytics_parity import DAY_MS, START_TIME, random_sprint
+
+NOW_MS = START_TIME + 9 * DAY_MS
+
+
+def assert_same_metrics(loaded: EventColumns, expected: EventColumns, sprint: dict):
+    # tickets keep their order of first appearance in the whole log, in a
+    # time range that can differ from their first appearance in the range
+    assert sorted(loaded.ticket_ids.tolist()) == sorted(expected.ticket_ids.tolist())
+    assert loaded.status_flow(
+        sprint["start_time"], sprint["end_time"]
+    ) == expected.status_flow(sprint["start_time"], sprint["end_time"])
+    assert loaded.status_breakdown() == expected.status_breakdown()
+    assert loaded.count_in_progress() == expected.count_in_progress()
+    assert loaded.lead_times(NOW_MS) == expected.lead_times(NOW_MS)
+
+
+@pytest.fixture(params=[64 * 1024, 16], ids=["one-batch", "many-batches"])
+def store(request, tmp_path, monkeypatch):
+    monkeypatch.setattr(event_store, "BATCH_ROWS", request.param)
+    return EventStore(tmp_path)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_store_matches_json(store, seed):
+    sprint = random_sprint(seed)
+    store.write_sprint(sprint)
+
+    loaded = store.load_columns(sprint["id"])
+
+    assert store.sprint_info(sprint["id"]) == {
+        key: sprint[key] for key in ("id", "start_time", "end_time")
+    }
+    expected = EventColumns.from_events(sprint["events"])
+    assert loaded.ticket_ids.tolist() == expected.ticket_ids.tolist()
+    assert_same_metrics(loaded, expected, sprint)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_time_range_matches_filtered_json(store, seed):
+    sprint = random_sprint(seed)
+    store.write_sprint(sprint)
+    start_time, end_time = START_TIME + DAY_MS, START_TIME + 5 * DAY_MS
+
+    loaded = store.load_columns(sprint["id"], start_time, end_time)
+
+    in_range = [
+        event
+        for event in sprint["events"]
+        if start_time <= event["timestamp"] <= end_time
+    ]
+    assert len(loaded.timestamps) == len(in_range)
+    assert_same_metrics(loaded, EventColumns.from_events(in_range), sprint)
+
+
+def test_single_batch_is_loaded_without_copies(tmp_path):
+    store = EventStore(tmp_path)
+    sprint = random_sprint(0)
+    store.write_sprint(sprint)
+
+    loaded = store.load_columns(sprint["id"])
+
+    # read-only views of the memory-mapped buffers, not copies
+    for column in (loaded.timestamps, loaded.kinds):
+        assert not column.flags.owndata
+        assert not column.flags.writeable
+
+
+def test_empty_range_and_sprint(store):
+    sprint = random_sprint(1)
+    store.write_sprint(sprint)
+
+    assert store.load_columns(sprint["id"], 0, 1).num_tickets == 0
+    store.write_sprint({**sprint, "id": "empty", "events": []})
+    assert store.load_columns("empty").num_tickets == 0
+
+
+def test_sprint_analytics_from_the_store(store):
+    sprint = random_sprint(2)
+    store.write_sprint(sprint)
+
+    from_store = SprintAnalytics(
+        store.sprint_info(sprint["id"]), columns=store.load_columns(sprint["id"])
+    )
+    from_json = SprintAnalytics(sprint)
+
+    assert from_store.burndown() == from_json.burndown()
+    assert from_store.status_breakdown == from_json.status_breakdown
@@ -0,0 +1,81 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from services import http_client
+
+
+class Backend:
+    """A local server answering POSTs with `status` after `delay` seconds."""
+
+    def __init__(self, status=200, delay=0.0):
+        self.status = status
+        self.delay = delay
+        self.requests = 0
+        backend = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                backend.requests += 1
+                time.sleep(backend.delay)
+                try:
+                    self.send_response(backend.status)
+                    self.send_header("Content-Length", "2")
+                    self.end_headers()
+                    self.wfile.write(b"{}")
+                except OSError:
+                    pass  # the client gave up waiting
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_port}/ticket/create"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def backend():
+    backends = []
+
+    def start(**kwargs):
+        backends.append(Backend(**kwargs))
+        return backends[-1]
+
+    yield start
+    for started in backends:
+        started.server.shutdown()
+        started.server.server_close()
+
+
+def test_slow_non_idempotent_post_is_sent_once(backend):
+    slow = backend(delay=0.5)
+
+    with pytest.raises(requests.exceptions.RequestException):
+        http_client.post(slow.url, idempotent=False, json={}, timeout=(1, 0.1))
+
+    time.sleep(0.6)
+    assert slow.requests == 1
+
+
+@pytest.mark.parametrize("status", [500, 503])
+def test_non_idempotent_post_is_not_retried_on_server_errors(backend, status):
+    failing = backend(status=status)
+
+    response = http_client.post(failing.url, idempotent=False, json={})
+
+    assert response.status_code == status
+    assert failing.requests == 1
+
+
+def test_idempotent_post_is_retried_on_server_errors(backend):
+    failing = backend(status=503)
+
+    response = http_client.post(failing.url, json={})
+
+    assert response.status_code == 503
+    assert failing.requests == 4
@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from entities.ticket import Status
+from services.ticket_index import INDEXED_FIELDS, TicketIndex
+
+from .test_ticket_store import make_ticket
+
+STATUSES = ["open", "in-progress", "done"]
+ASSIGNEES = ["kai", "ryan", "avellin", None]
+LABELS = ["auth", "frontend", "backend", "email"]
+
+
+def random_ticket(rng: random.Random, ticket_id: str):
+    return make_ticket(
+        ticket_id,
+        status=rng.choice(STATUSES),
+        assignee_id=rng.choice(ASSIGNEES),
+        type=rng.choice(["bug", "feature", "task"]),
+        priority=rng.choice(["high", "medium", "low"]),
+        labels=rng.sample(LABELS, rng.randint(0, 2)),
+    )
+
+
+def scan(tickets, **filters):
+    """What `match` returns, by checking every ticket."""
+
+    def matches(ticket, field, values):
+        wanted = {getattr(v, "value", v) for v in values}
+        value = getattr(ticket, field)
+        if field == "labels":
+            return bool(wanted & set(value))
+        return getattr(value, "value", value) in wanted
+
+    return [
+        ticket
+        for ticket in tickets
+        if all(matches(ticket, f, v) for f, v in filters.items() if v)
+    ]
+
+
+def test_match_ignores_empty_filters_and_keeps_insertion_order():
+    tickets = [make_ticket(str(i)) for i in range(5)]
+    index = TicketIndex(tickets)
+
+    assert index.match() == tickets
+    assert index.match(status=None, labels=[]) == tickets
+
+
+def test_enums_and_values_match_alike():
+    index = TicketIndex([make_ticket("a", status="done"), make_ticket("b")])
+
+    assert [t.id for t in index.match(status=[Status.DONE])] == ["a"]
+    assert [t.id for t in index.match(status=["done"])] == ["a"]
+    assert index.counts("status") == {"done": 1, "open": 1}
+
+
+def test_replacing_a_ticket_reindexes_it_in_place():
+    index = TicketIndex(
+        [make_ticket("a", labels=["auth"]), make_ticket("b", labels=["auth"])]
+    )
+
+    index.add(make_ticket("a", labels=["email"], status="done"))
+
+    assert len(index) == 2
+    assert [t.id for t in index.tickets()] == ["a", "b"]
+    assert [t.id for t in index.match(labels=["auth"])] == ["b"]
+    assert [t.id for t in index.match(labels=["email"], status=["done"])] == ["a"]
+    assert sorted(index.values("labels")) == ["auth", "email"]
+
+
+def test_remove_drops_empty_postings():
+    index = TicketIndex([make_ticket("a", labels=["auth"]), make_ticket("b")])
+
+    index.remove("a")
+    index.remove("missing")
+
+    assert "a" not in index
+    assert index.values("labels") == []
+    assert index.counts("status") == {"open": 1}
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_match_agrees_with_a_scan(seed):
+    rng = random.Random(seed)
+    index = TicketIndex()
+    for _ in range(200):
+        ticket_id = str(rng.randrange(60))
+        if rng.random() < 0.2:
+            index.remove(ticket_id)
+        else:
+            index.add(random_ticket(rng, ticket_id))
+
+    tickets = index.tickets()
+    for field in INDEXED_FIELDS:
+        assert sum(index.counts(field).values()) == sum(
+            len(scan(tickets, **{field: [value]})) for value in index.values(field)
+        )
+    for _ in range(50):
+        filters = {
+            "status": rng.sample(STATUSES, rng.randint(0, 2)),
+            "assignee_id": rng.sample(ASSIGNEES, rng.randint(0, 2)),
+            "labels": rng.sample(LABELS, rng.randint(0, 2)),
+        }
+        assert index.match(**filters) == scan(tickets, **filters)
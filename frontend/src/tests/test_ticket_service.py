@@ -0,0 +1,145 @@
+import pytest
+
+import services.ticket as ticket_service
+from components.tablev2 import normalize_assignee
+from entities.ticket import Status
+from services.ticket import UpdateTicketError, diff_ticket, save_ticket, save_tickets
+from services.ticket_store import TicketStore
+
+from .test_ticket_store import make_ticket
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Captures `update_ticket` calls, answering with the merged ticket."""
+    calls = []
+
+    def update_ticket(delta, expected_updated_at=None):
+        calls.append((delta, expected_updated_at))
+        base = make_ticket(delta["id"], 200.0)
+        return base.model_copy(update={k: v for k, v in delta.items() if k != "id"})
+
+    monkeypatch.setattr(ticket_service, "update_ticket", update_ticket)
+    return calls
+
+
+@pytest.fixture
+def sent_batch(monkeypatch):
+    """
+    Captures `update_tickets` calls against a store holding tickets "a" and
+    "b", refusing items whose status is "done".
+    """
+    calls = []
+    store = TicketStore(lambda: [make_ticket("a"), make_ticket("b", 150.0)])
+    store.list()
+
+    def update_tickets(deltas):
+        calls.append(deltas)
+        errors = [
+            UpdateTicketError(index=index, id=delta["id"], status=500, message="boom")
+            for index, delta in enumerate(deltas)
+            if delta.get("status") == "done"
+        ]
+        return [], errors
+
+    monkeypatch.setattr(ticket_service, "get_ticket_store", lambda: store)
+    monkeypatch.setattr(ticket_service, "update_tickets", update_tickets)
+    return calls
+
+
+def test_diff_only_returns_changed_fields_as_json():
+    base = make_ticket("a", labels=["auth"])
+
+    delta = diff_ticket(
+        base,
+        {
+            "title": base.title,
+            "status": Status.DONE,
+            "priority": "medium",
+            "labels": ["auth", "email"],
+        },
+    )
+
+    assert delta == {"status": "done", "labels": ["auth", "email"]}
+
+
+def test_diff_ignores_server_fields():
+    base = make_ticket("a")
+    edited = base.model_copy(update={"id": "b", "updated_at": None, "embedding": [1.0]})
+
+    assert diff_ticket(base, edited) == {}
+    assert diff_ticket(base, base.model_copy(update={"status": Status.DONE})) == {
+        "status": "done"
+    }
+
+
+def test_save_sends_the_delta_on_condition(sent):
+    base = make_ticket("a", 100.0)
+
+    saved = save_ticket(base, {"status": "done", "title": base.title})
+
+    assert sent == [({"id": "a", "status": "done"}, 100.0)]
+    assert saved.status == Status.DONE
+
+
+def test_save_without_changes_sends_nothing(sent):
+    base = make_ticket("a")
+
+    assert save_ticket(base, {"title": base.title, "status": "open"}) is base
+    assert sent == []
+
+
+@pytest.mark.parametrize("stored", ["Unassigned", None, ""])
+@pytest.mark.parametrize("entered", ["", "  ", "Unassigned", None])
+def test_leaving_a_ticket_unassigned_is_not_a_change(sent, stored, entered):
+    base = make_ticket("a", assignee_id=stored)
+
+    save_ticket(base, {"assignee_id": normalize_assignee(entered, stored)})
+
+    assert sent == []
+
+
+def test_unassigning_and_assigning_are_changes():
+    assert normalize_assignee("", "kai") is None
+    assert normalize_assignee("Unassigned", "kai") is None
+    assert normalize_assignee(" ryan ", "kai") == "ryan"
+    assert normalize_assignee("ryan", None) == "ryan"
+
+
+def test_save_tickets_sends_only_the_changed_fields(sent_batch):
+    failed = save_tickets(
+        {"a": {"title": "Ticket a", "priority": "high"}, "b": {"title": "Ticket b"}}
+    )
+
+    assert sent_batch == [
+        [{"id": "a", "priority": "high", "expected_updated_at": 100.0}]
+    ]
+    assert failed == {}
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        {"title": None},
+        {"title": ""},
+        {"status": None},
+        {"type": None},
+        {"priority": "?"},
+    ],
+)
+def test_save_tickets_refuses_invalid_edits(sent_batch, edit):
+    failed = save_tickets({"a": edit, "b": {"priority": "low"}})
+
+    assert sent_batch == [
+        [{"id": "b", "priority": "low", "expected_updated_at": 150.0}]
+    ]
+    assert failed == {"a": f"invalid {next(iter(edit))}"}
+
+
+def test_save_tickets_reports_failed_and_unknown_tickets(sent_batch):
+    failed = save_tickets(
+        {"a": {"status": "done"}, "b": {"priority": "low"}, "c": {"status": "done"}}
+    )
+
+    assert [delta["id"] for delta in sent_batch[0]] == ["a", "b"]
+    assert failed == {"c": "ticket not found", "a": "boom"}
@@ -0,0 +1,124 @@
+import threading
+from datetime import datetime, timezone
+
+from entities.ticket import Ticket
+from services.ticket_store import SYNC_OVERLAP_SECONDS, TicketStore
+
+
+def make_ticket(ticket_id: str, updated_at: float = 100.0, **fields) -> Ticket:
+    return Ticket(
+        id=ticket_id,
+        title=f"Ticket {ticket_id}",
+        description="description",
+        reporter_id="kai",
+        updated_at=datetime.fromtimestamp(updated_at, timezone.utc),
+        **fields,
+    )
+
+
+class CountingLoader:
+    def __init__(self, tickets):
+        self.tickets = tickets
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.tickets
+
+
+def test_list_is_served_from_memory_until_the_ttl_expires():
+    loader = CountingLoader([make_ticket("a")])
+    store = TicketStore(loader, ttl=60)
+
+    assert [t.id for t in store.list()] == ["a"]
+    store.list()
+    assert loader.calls == 1
+
+    store.list(force_refresh=True)
+    assert loader.calls == 2
+
+    store.invalidate()
+    store.list()
+    assert loader.calls == 3
+
+
+def test_failed_load_keeps_the_previous_copy():
+    loader = CountingLoader([make_ticket("a")])
+    store = TicketStore(loader, ttl=0)
+    store.list()
+
+    loader.tickets = None
+    assert [t.id for t in store.list()] == ["a"]
+
+
+def test_concurrent_refreshes_are_coalesced():
+    release = threading.Event()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        release.wait(5)
+        return [make_ticket("a")]
+
+    store = TicketStore(slow_loader, ttl=60)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(store.list())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert [[t.id for t in tickets] for tickets in results] == [["a"]] * 8
+
+
+def test_writes_are_applied_in_place():
+    store = TicketStore(CountingLoader([make_ticket("a"), make_ticket("b")]), ttl=60)
+    store.list()
+
+    store.upsert([make_ticket("a", status="done"), None, make_ticket("c")])
+    store.remove("b")
+
+    assert [t.id for t in store.list()] == ["a", "c"]
+    assert store.get("a").status.value == "done"
+    assert [t.id for t in store.match(status=["done"])] == ["a"]
+    assert store.counts("status") == {"done": 1, "open": 1}
+
+
+def test_refresh_syncs_changes_since_the_watermark():
+    loader = CountingLoader([make_ticket("a", 100.0), make_ticket("b", 200.0)])
+    requested = []
+
+    def syncer(since):
+        requested.append(since)
+        return [make_ticket("b", 300.0, status="done"), make_ticket("c", 300.0)], 300.0
+
+    store = TicketStore(loader, syncer=syncer, ttl=0)
+    store.list()
+    tickets = store.list()
+
+    assert loader.calls == 1
+    assert requested == [200.0 - SYNC_OVERLAP_SECONDS]
+    assert [t.id for t in tickets] == ["a", "b", "c"]
+    assert store.get("b").status.value == "done"
+
+    store.list()
+    assert requested[-1] == 300.0 - SYNC_OVERLAP_SECONDS
+
+
+def test_failed_sync_keeps_the_watermark():
+    requested = []
+
+    def syncer(since):
+        requested.append(since)
+        return None
+
+    store = TicketStore(CountingLoader([make_ticket("a", 100.0)]), syncer=syncer, ttl=0)
+    store.list()
+    store.list()
+    store.list()
+
+    assert requested == [100.0 - SYNC_OVERLAP_SECONDS] * 2
@@ -0,0 +1,149 @@
+import threading
+
+from services.ticket_store import TicketStore
+from services.ticket_writer import Rejected, TicketWriteQueue
+
+from .test_ticket_store import make_ticket
+
+
+class RecordingSender:
+    """Saves every delta onto the store's copy, unless told to fail."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+        # cleared to hold a write in flight
+        self.gate = threading.Event()
+        self.gate.set()
+        self.sending = threading.Event()
+
+    def __call__(self, deltas):
+        self.batches.append(deltas)
+        fail = self.fail
+        self.sending.set()
+        self.gate.wait(5)
+        if fail:
+            raise ConnectionError("backend unavailable")
+        return [
+            make_ticket(
+                delta["id"],
+                updated_at=500.0,
+                **{k: v for k, v in delta.items() if k not in ("id", "expected_updated_at")},
+            )
+            for delta in deltas
+        ]
+
+
+def make_queue(sender, tickets=("a", "b", "c"), **kwargs):
+    store = TicketStore(lambda: [make_ticket(t) for t in tickets], ttl=60)
+    store.list()
+    return store, TicketWriteQueue(store, sender, delay=0, **kwargs)
+
+
+def test_change_is_applied_before_it_is_sent():
+    sender = RecordingSender()
+    sender.gate.clear()
+    store, queue = make_queue(sender)
+
+    updated = queue.enqueue(store.get("a"), {"status": "done"})
+
+    assert updated.status.value == "done"
+    assert store.get("a").status.value == "done"
+    sender.gate.set()
+    assert queue.flush(5)
+    assert store.get("a").updated_at.timestamp() == 500.0
+    assert queue.pending_count() == 0
+
+
+def test_repeated_changes_are_merged_into_one_conditional_write():
+    sender = RecordingSender()
+    sender.gate.clear()
+    store, queue = make_queue(sender)
+    queue.enqueue(store.get("b"), {"status": "done"})
+    assert sender.sending.wait(5)
+
+    # queued behind the write in flight, merged while they wait
+    queue.enqueue(store.get("a"), {"status": "in-progress"})
+    queue.enqueue(store.get("a"), {"status": "done", "priority": "high"})
+    sender.gate.set()
+    assert queue.flush(5)
+
+    assert sender.batches[1] == [
+        {
+            "id": "a",
+            "status": "done",
+            "priority": "high",
+            "expected_updated_at": 100.0,
+        }
+    ]
+
+
+def test_writes_are_sent_in_batches():
+    sender = RecordingSender()
+    sender.gate.clear()
+    store, queue = make_queue(sender, tickets="abcdefg", max_batch_size=3)
+    queue.enqueue(store.get("a"), {"status": "done"})
+    assert sender.sending.wait(5)
+
+    for ticket_id in "bcdefg":
+        queue.enqueue(store.get(ticket_id), {"status": "done"})
+    sender.gate.set()
+    assert queue.flush(5)
+
+    assert [[d["id"] for d in batch] for batch in sender.batches] == [
+        ["a"],
+        ["b", "c", "d"],
+        ["e", "f", "g"],
+    ]
+
+
+def test_failed_write_restores_the_confirmed_copy_for_its_owner():
+    store, queue = make_queue(RecordingSender(fail=True))
+
+    queue.enqueue(store.get("a"), {"status": "done"}, owner="session-1")
+    assert queue.flush(5)
+
+    assert store.get("a").status.value == "open"
+    assert queue.take_failures("session-2") == []
+    [failure] = queue.take_failures("session-1")
+    assert failure.ticket_id == "a"
+    assert failure.delta == {"id": "a", "status": "done"}
+    assert failure.restored.status.value == "open"
+    assert queue.take_failures("session-1") == []
+
+
+def test_failed_write_is_resent_with_a_newer_change():
+    sender = RecordingSender(fail=True)
+    sender.gate.clear()
+    store, queue = make_queue(sender)
+    queue.enqueue(store.get("a"), {"status": "done"})
+    assert sender.sending.wait(5)
+
+    queue.enqueue(store.get("a"), {"priority": "high"})
+    sender.fail = False
+    sender.gate.set()
+    assert queue.flush(5)
+
+    assert sender.batches[1] == [
+        {
+            "id": "a",
+            "status": "done",
+            "priority": "high",
+            "expected_updated_at": 100.0,
+        }
+    ]
+    assert store.get("a").status.value == "done"
+    assert store.get("a").priority.value == "high"
+    assert queue.take_failures() == []
+
+
+def test_rejected_write_is_replaced_by_the_current_copy():
+    current = make_ticket("a", updated_at=300.0, status="in-progress")
+    store, queue = make_queue(lambda deltas: [Rejected(current) for _ in deltas])
+
+    queue.enqueue(store.get("a"), {"status": "done"}, owner="session-1")
+    assert queue.flush(5)
+
+    assert store.get("a") == current
+    [failure] = queue.take_failures("session-1")
+    assert failure.restored == current
@@ -1,6 +1,7 @@
 from .file_manager import read_json
 from .ticket_operations import unpack_ticket, get_sample_analytics
-from .sample_data import SAMPLE_TICKETS, SAMPLE_USERS
+from . import sample_data
+from .sample_data import SAMPLE_USERS
 from .user import get_user, auth_user
 
 __all__ = [
@@ -12,3 +13,9 @@ __all__ = [
     "get_user",
     "auth_user",
 ]
+
+
+def __getattr__(name: str):
+    if name == "SAMPLE_TICKETS":
+        return sample_data.SAMPLE_TICKETS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
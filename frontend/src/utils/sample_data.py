@@ -1,9 +1,5 @@
 from typing import List
 from entities import Ticket, User
-from services.ticket import list_tickets
-
-# TODO: Replace this with some sort of state management
-SAMPLE_TICKETS: List[Ticket] = list_tickets()
 
 SAMPLE_USERS = [
     User(**user_data)
@@ -38,3 +34,14 @@ SAMPLE_USERS = [
         },
     ]
 ]
+
+
+def __getattr__(name: str):
+    # SAMPLE_TICKETS used to be fetched when this module was imported, which
+    # put a full ticket list call in front of every page; resolve it on access
+    if name == "SAMPLE_TICKETS":
+        from services.ticket_store import get_ticket_store
+
+        tickets: List[Ticket] = get_ticket_store().list()
+        return tickets
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")